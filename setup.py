@@ -53,6 +53,10 @@ INSTALLATION_REQUIREMENTS = [
     'PyJWT'
 ]
 
+EXTRAS_REQUIREMENTS = {
+    'async': ['aiohttp'],
+}
+
 
 project_root = os.path.abspath(os.path.dirname(__file__))
 
@@ -92,4 +96,5 @@ setup(
     packages=find_packages(include=[PACKAGE_NAME, PACKAGE_NAME + '.*']),
 
     install_requires=INSTALLATION_REQUIREMENTS,
+    extras_require=EXTRAS_REQUIREMENTS,
 )
@@ -22,6 +22,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
 import os
 
 import pytest
@@ -29,6 +30,7 @@ import requests
 
 import webexteamssdk
 from webexteamssdk.api.access_tokens import AccessTokensAPI
+from webexteamssdk.api.async_api import AsyncAPIWrapper
 from webexteamssdk.api.attachment_actions import AttachmentActionsAPI
 from webexteamssdk.api.events import EventsAPI
 from webexteamssdk.api.licenses import LicensesAPI
@@ -147,6 +149,68 @@ def test_non_default_wait_on_rate_limit():
         DEFAULT_WAIT_ON_RATE_LIMIT
 
 
+@pytest.mark.usefixtures("access_token")
+def test_custom_connection_pool():
+    connection_object = webexteamssdk.WebexTeamsAPI(
+        pool_maxsize=64, pool_block=True, tcp_keepalive=60,
+    )
+    adapter = connection_object._session._req_session.get_adapter(
+        connection_object.base_url
+    )
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+    assert adapter.socket_options
+
+
+@pytest.mark.usefixtures("access_token")
+def test_custom_json_codec(api):
+    connection_object = webexteamssdk.WebexTeamsAPI(json_codec="stdlib-dict")
+    me = connection_object.people.me()
+    assert type(me.json_data) is dict
+    assert me == api.people.me()
+
+
+@pytest.mark.usefixtures("access_token")
+def test_compiled_data_objects(api):
+    connection_object = webexteamssdk.WebexTeamsAPI(
+        object_factory=webexteamssdk.compiled_data_factory,
+    )
+    me = connection_object.people.me()
+    expected = api.people.me()
+    assert isinstance(me, webexteamssdk.CompiledData)
+    assert not hasattr(me, "__dict__")
+    assert me.id == expected.id
+    assert me.created == expected.created
+    assert me.to_dict() == expected.to_dict()
+    assert me.to_json() == expected.to_json()
+
+
+@pytest.mark.usefixtures("access_token")
+def test_identity_data_objects(api):
+    connection_object = webexteamssdk.WebexTeamsAPI(
+        object_factory=webexteamssdk.identity_data_factory,
+    )
+    me = connection_object.people.me()
+    assert me.identity_key() == (me.id, me.to_dict().get("lastModified"))
+    assert len({me, connection_object.people.get(me.id)}) == 1
+
+
+@pytest.mark.usefixtures("access_token")
+def test_lazy_data_objects(api):
+    connection_object = webexteamssdk.WebexTeamsAPI(
+        object_factory=webexteamssdk.lazy_data_factory,
+    )
+    rooms = list(connection_object.rooms.list(max=10))
+    expected = list(api.rooms.list(max=10))
+    assert all(isinstance(room, webexteamssdk.LazyData) for room in rooms)
+    assert not any(room.decoded for room in rooms)
+    assert [room.raw_json for room in rooms] == \
+        [room.to_json().encode("utf-8") for room in rooms]
+    assert [room.id for room in rooms] == [room.id for room in expected]
+    assert [room.to_dict() for room in rooms] == \
+        [room.to_dict() for room in expected]
+
+
 # Test creation of component API objects
 def test_access_tokens_api_object_creation(api):
     assert isinstance(api.access_tokens, AccessTokensAPI)
@@ -198,3 +262,19 @@ def test_teams_api_object_creation(api):
 
 def test_webhooks_api_object_creation(api):
     assert isinstance(api.webhooks, WebhooksAPI)
+
+
+# Test the asyncio API wrapper
+def test_async_api_object_creation(access_token):
+    async_api = webexteamssdk.AsyncWebexTeamsAPI(access_token=access_token)
+    assert isinstance(async_api.rooms, AsyncAPIWrapper)
+
+
+def test_async_api_people_me(api):
+    async def get_me():
+        async with webexteamssdk.AsyncWebexTeamsAPI(
+            access_token=api.access_token
+        ) as async_api:
+            return await async_api.people.me()
+
+    assert asyncio.run(get_me()) == api.people.me()
@@ -90,3 +90,17 @@ def test_list_events_with_paging(api, me, admin_audit_events):
     events_list = list(itertools.islice(events_gen, num_events))
     assert len(events_list) == num_events
     assert are_valid_admin_audit_events(events_list)
+
+
+def test_list_admin_audit_events_in_parallel(api, me, admin_audit_events):
+    page_size = 1
+    num_events = 3
+    events_gen = api.admin_audit_events.list(
+        orgId=me.orgId,
+        _from=from_datetime_string,
+        to=to_datetime_string,
+        max=page_size,
+    ).parallel(concurrency=3)
+    events_list = list(itertools.islice(events_gen, num_events))
+    assert len(events_list) == num_events
+    assert are_valid_admin_audit_events(events_list)
@@ -104,6 +104,18 @@ def test_list_events_with_paging(api, events):
     assert are_valid_events(events_list)
 
 
+def test_list_events_sharded(api, events):
+    _from = str(min(event.created for event in events))
+    to = str(max(event.created for event in events))
+    serial_events = list(api.events.list(_from=_from, to=to))
+    sharded_events = list(
+        api.events.list(_from=_from, to=to).sharded(shards=4)
+    )
+    assert are_valid_events(sharded_events)
+    assert [event.id for event in sharded_events] == \
+        [event.id for event in serial_events]
+
+
 def test_get_event_by_id(api, events):
     event_id = events[0].id
     event = api.events.get(event_id)
@@ -270,6 +270,14 @@ def test_list_messages_before_datetime(api, group_room,
     assert are_valid_messages(message_list)
 
 
+def test_message_created_timestamps(group_room_messages):
+    datetimes = [message.created for message in group_room_messages]
+    strings = [message.json_data["created"] for message in group_room_messages]
+    assert datetimes[0] is group_room_messages[0].created
+    assert webexteamssdk.timestamps_to_epoch(datetimes) == \
+        webexteamssdk.timestamps_to_epoch(strings)
+
+
 def test_list_messages_before_message_with_id(api, group_room,
                                               group_room_markdown_message):
     message_list = list(api.messages.list(
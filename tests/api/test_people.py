@@ -22,7 +22,9 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
 import itertools
+import json
 
 import pytest
 
@@ -209,6 +211,27 @@ def test_list_people_with_paging(api, test_people,
     assert are_valid_people(people_list)
 
 
+def test_list_people_batches(api, test_people):
+    display_name = test_people["not_a_member"].displayName
+    people = api.people.list(displayName=display_name)
+    batches = list(people.batches(columns=["id", "displayName"]))
+    assert all(isinstance(b, webexteamssdk.ColumnBatch) for b in batches)
+    assert [person_id for b in batches for person_id in b["id"]] == \
+        [person.id for person in people]
+
+
+def test_export_people_to_ndjson(api, test_people, tmp_path):
+    display_name = test_people["not_a_member"].displayName
+    people = api.people.list(displayName=display_name)
+    path = str(tmp_path / "people.ndjson")
+    count = people.to_ndjson(path)
+    with open(path) as file_object:
+        exported = [json.loads(line) for line in file_object]
+    assert count == len(exported) >= 1
+    assert [item["id"] for item in exported] == \
+        [person.id for person in people]
+
+
 def test_create_person(test_people):
     person = test_people["not_a_member"]
     assert is_valid_person(person)
@@ -220,6 +243,32 @@ def test_get_person_details(api, test_people):
     assert is_valid_person(person)
 
 
+def test_get_people_with_loader(api, test_people, me):
+    person_ids = [test_people["not_a_member"].id, me.id]
+    loader = api.people.loader()
+    people = loader.get_many(person_ids)
+    assert are_valid_people(people)
+    assert [person.id for person in people] == person_ids
+    assert loader.get(me.id).id == me.id
+
+
+def test_get_people_with_async_loader(api, test_people, me):
+    person_ids = [test_people["not_a_member"].id, me.id]
+
+    async def get_people():
+        async with webexteamssdk.AsyncWebexTeamsAPI(
+            access_token=api.access_token
+        ) as async_api:
+            loader = async_api.people.loader()
+            return await asyncio.gather(
+                *[loader.get(person_id) for person_id in person_ids]
+            )
+
+    people = asyncio.run(get_people())
+    assert are_valid_people(people)
+    assert [person.id for person in people] == person_ids
+
+
 def test_get_my_details(me):
     assert is_valid_person(me)
 
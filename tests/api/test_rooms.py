@@ -23,6 +23,7 @@ SOFTWARE.
 """
 
 import itertools
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -142,6 +143,64 @@ def test_list_team_rooms(api, team, team_room):
     assert are_valid_rooms(team_rooms_list)
 
 
+def test_list_group_rooms_cached(api, group_room):
+    group_rooms = api.rooms.list(type='group').cached(ttl=60)
+    first_pass = list(group_rooms)
+    assert len(first_pass) > 0
+    assert are_valid_rooms(first_pass)
+    assert all(a is b for a, b in zip(first_pass, group_rooms))
+
+
+def test_list_group_rooms_pages_and_chunks(api, group_room):
+    group_rooms = api.rooms.list(type='group', max=2)
+    pages = list(group_rooms.pages())
+    chunks = list(group_rooms.chunks(3))
+    assert all(len(page) <= 2 for page in pages)
+    assert all(len(chunk) == 3 for chunk in chunks[:-1])
+    assert sum(pages, []) == sum(chunks, []) == list(group_rooms)
+    assert are_valid_rooms(sum(pages, []))
+
+
+def test_list_group_rooms_adaptive(api, group_room):
+    group_rooms = list(api.rooms.list(type='group', max=1).adaptive())
+    assert are_valid_rooms(group_rooms)
+    assert {room.id for room in group_rooms} == \
+        {room.id for room in api.rooms.list(type='group')}
+
+
+def test_list_group_rooms_checkpointed(api, group_room, add_rooms, tmp_path):
+    add_rooms(3)
+    path = str(tmp_path / "rooms-checkpoint.json")
+    metrics = webexteamssdk.MetricsRegistry()
+    metrics_api = webexteamssdk.WebexTeamsAPI(access_token=api.access_token,
+                                              metrics=metrics)
+
+    def requests_made():
+        return metrics.snapshot()[("GET", "rooms")]["requests"]
+
+    expected = list(metrics_api.rooms.list(type='group', max=1))
+    full_crawl_requests = requests_made()
+    assert len(expected) >= 4
+
+    # Consume three items (two pages) before stopping
+    group_rooms = metrics_api.rooms.list(type='group', max=1)
+    first_pass = group_rooms.checkpointed(path=path)
+    consumed = list(itertools.islice(first_pass, 3))
+    first_pass.close()
+    checkpoint = webexteamssdk.PaginationCheckpoint.load(path)
+    assert (checkpoint.pages, checkpoint.items) == (2, 2)
+    assert not checkpoint.complete
+
+    metrics.reset()
+    resumed = list(group_rooms.checkpointed(path=path))
+
+    # The crawl resumes with the item being processed when it stopped
+    assert consumed == expected[:3]
+    assert resumed == expected[2:]
+    assert requests_made() == full_crawl_requests - 2
+    assert webexteamssdk.PaginationCheckpoint.load(path).complete
+
+
 def test_list_direct_rooms(api, direct_rooms):
     direct_rooms_list = list(api.rooms.list(type='direct'))
     assert len(direct_rooms_list) > 0
@@ -161,6 +220,33 @@ def test_get_room_details(api, group_room):
     assert is_valid_room(room)
 
 
+def test_get_room_details_cached(access_token, group_room):
+    entity_cache = webexteamssdk.EntityCache()
+    api = webexteamssdk.WebexTeamsAPI(access_token=access_token,
+                                      entity_cache=entity_cache)
+    assert api.rooms.get(group_room.id) == api.rooms.get(group_room.id)
+    assert entity_cache.hits == 1
+    new_title = create_string("Updated Group Room")
+    api.rooms.update(group_room.id, title=new_title)
+    assert api.rooms.get(group_room.id).title == new_title
+
+
+def test_get_room_details_concurrently(api, group_room):
+    coalescing_api = webexteamssdk.WebexTeamsAPI(
+        access_token=api.access_token,
+        coalesce_gets=True,
+        metrics=webexteamssdk.MetricsRegistry(),
+    )
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        rooms = list(executor.map(
+            lambda _: coalescing_api.rooms.get(group_room.id), range(8)
+        ))
+    assert all(room == rooms[0] for room in rooms)
+    assert is_valid_room(rooms[0])
+    requests = coalescing_api.metrics.snapshot()[("GET", "rooms/{id}")]
+    assert requests["requests"] < 8
+
+
 def test_get_room_meeting_info(api, group_room):
     room_meeting_info = api.rooms.get_meeting_info(group_room.id)
     assert is_valid_room_meeting_info(room_meeting_info)
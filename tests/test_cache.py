@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""webexteamssdk/cache.py Tests
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import json
+import os
+
+import pytest
+import requests
+
+from webexteamssdk import ApiError
+from webexteamssdk.cache import EntityCache, FileCacheBackend
+from webexteamssdk.restsession import RestSession
+
+
+# Helper Functions
+def stub_requests(session, status_code=200):
+    """Replace a session's HTTP requests; return the list of sent URLs."""
+    sent = []
+
+    def request(method, url, **kwargs):
+        sent.append(url)
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = "OK" if status_code == 200 else "Not Found"
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(
+            {"id": "room_id"} if status_code == 200 else {"message": "gone"}
+        ).encode("utf-8")
+        response.url = url
+        response.request = requests.Request(method, url).prepare()
+        return response
+
+    session._req_session.request = request
+    return sent
+
+
+def cached_session(cache, access_token="access_token"):
+    return RestSession(access_token, "https://webexapis.com/v1/",
+                       entity_cache=cache)
+
+
+# Tests
+def test_responses_are_cached_per_access_token():
+    cache = EntityCache()
+    first, second = cached_session(cache, "first"), cached_session(cache)
+    first_sent, second_sent = stub_requests(first), stub_requests(second)
+
+    for _ in range(2):
+        first.get("rooms/room_id")
+        second.get("rooms/room_id")
+
+    assert len(first_sent) == len(second_sent) == 1
+
+
+def test_only_get_by_id_requests_are_cached():
+    session = cached_session(EntityCache())
+    sent = stub_requests(session)
+
+    for url in ("people/me", "rooms/room_id/meetingInfo", "rooms/room_id",
+                "people/me", "rooms/room_id/meetingInfo", "rooms/room_id"):
+        session.get(url)
+
+    assert len(sent) == 5
+
+
+def test_file_cache_stores_json(tmp_path):
+    cache = EntityCache(backend=FileCacheBackend(str(tmp_path)))
+    session = cached_session(cache)
+    sent = stub_requests(session, status_code=404)
+
+    for _ in range(2):
+        with pytest.raises(ApiError) as error:
+            session.get("rooms/missing_id")
+        assert error.value.status_code == 404
+        assert error.value.message == "gone"
+
+    assert len(sent) == 1
+    for name in os.listdir(str(tmp_path)):
+        with open(os.path.join(str(tmp_path), name)) as entry_file:
+            entry = json.load(entry_file)
+        assert "access_token" not in entry["key"]
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""webexteamssdk/models/compiled.py Tests
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from webexteamssdk.models.compiled import CompiledData, compiled_data_factory
+
+
+# Tests
+def test_unknown_attributes_do_not_modify_the_compiled_classes():
+    compiled_classes = (CompiledData, type(compiled_data_factory("room", {})))
+    before = [dict(vars(cls)) for cls in compiled_classes]
+
+    room = compiled_data_factory("room", {
+        "id": "room_id",
+        "unknown": 1,
+        "nested": {"unknown": {"value": 2}},
+    })
+    assert room.id == "room_id"
+    assert room.unknown == 1
+    assert room.nested.unknown.value == 2
+
+    unknown_model = compiled_data_factory(
+        "unknown_model", {"key{}".format(index): index for index in range(300)}
+    )
+    assert all(getattr(unknown_model, "key{}".format(index)) == index
+               for index in range(300))
+
+    assert [dict(vars(cls)) for cls in compiled_classes] == before
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""webexteamssdk/metrics.py Fixtures & Tests
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from webexteamssdk.metrics import MetricsRegistry, endpoint_template
+
+
+# Tests
+def test_endpoint_template_collapses_ids():
+    room_id = "Y2lzY29zcGFyazovL3VzL1JPT00vYmJjZWIxYWQtNDNmMS0zYjU4"
+    assert endpoint_template("rooms/" + room_id) == "rooms/{id}"
+    assert endpoint_template("people/123") == "people/{id}"
+    assert endpoint_template(
+        "locations/0f1e2d3c-aaaa-bbbb-cccc-0123456789ab/queues"
+    ) == "locations/{id}/queues"
+    assert endpoint_template("adminAudit/events") == "adminAudit/events"
+
+
+def test_metrics_snapshot():
+    registry = MetricsRegistry(latency_buckets=(0.1, 1.0))
+    registry.record_request("GET", "rooms/{id}", status_code=200,
+                            latency=0.05, response_bytes=100)
+    registry.record_request("GET", "rooms/{id}", status_code=503,
+                            latency=0.5, response_bytes=20)
+    registry.record_retry("GET", "rooms/{id}")
+    registry.record_rate_limit_sleep("GET", "rooms/{id}", 2.0)
+
+    metrics = registry.snapshot()[("GET", "rooms/{id}")]
+    assert metrics["requests"] == 2
+    assert metrics["status_codes"] == {200: 1, 503: 1}
+    assert metrics["retries"] == 1
+    assert metrics["rate_limit_sleep_seconds"] == 2.0
+    assert metrics["latency_seconds"]["buckets"] == {
+        0.1: 1, 1.0: 2, "+Inf": 2,
+    }
+    assert metrics["response_bytes"]["sum"] == 120
+
+
+def test_metrics_prometheus_export():
+    registry = MetricsRegistry(latency_buckets=(0.1, 1.0))
+    registry.record_request("GET", "rooms", status_code=200, latency=0.05)
+    registry.record_page("GET", "rooms")
+
+    lines = registry.to_prometheus().splitlines()
+    assert "# TYPE webexteamssdk_requests_total counter" in lines
+    assert 'webexteamssdk_requests_total{endpoint="rooms",method="GET",' \
+           'status="200"} 1' in lines
+    assert 'webexteamssdk_pages_total{endpoint="rooms",method="GET"} 1' \
+        in lines
+    assert 'webexteamssdk_request_duration_seconds_bucket{endpoint="rooms",' \
+           'le="+Inf",method="GET"} 1' in lines
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""webexteamssdk/ratelimit.py Fixtures & Tests
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import os
+import socketserver
+import threading
+import time
+
+import pytest
+
+from webexteamssdk.async_restsession import AsyncRestSession
+from webexteamssdk.ratelimit import (
+    FileLockBackend, InProcessBackend, RateLimiter, RedisBackend,
+)
+
+
+# Helper Classes
+class RedisStandIn(socketserver.ThreadingTCPServer):
+    """A local stand-in for a Redis server.
+
+    Implements the subset of the protocol used by the RedisBackend: GET, SET
+    (with PX), MGET, TIME and WATCH / MULTI / EXEC transactions.
+
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        socketserver.ThreadingTCPServer.__init__(
+            self, ("127.0.0.1", 0), RedisStandInHandler,
+        )
+        self.lock = threading.Lock()
+        self.data = {}
+        self.versions = {}
+
+    def set(self, key, value):
+        self.data[key] = value
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+
+class RedisStandInHandler(socketserver.StreamRequestHandler):
+
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        command = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            command.append(self.rfile.read(length + 2)[:-2].decode())
+        return command
+
+    def encode(self, value):
+        if value is None:
+            return b"$-1\r\n"
+        if isinstance(value, list):
+            return b"*%d\r\n" % len(value) + b"".join(
+                self.encode(item) for item in value
+            )
+        if isinstance(value, bytes):
+            return b"+" + value + b"\r\n"
+        value = value.encode()
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def handle(self):
+        server = self.server
+        watched = {}
+        queued = None
+        while True:
+            command = self.read_command()
+            if command is None:
+                return
+            name, args = command[0].upper(), command[1:]
+            if queued is not None and name not in ("EXEC", "MULTI"):
+                queued.append((name, args))
+                self.wfile.write(b"+QUEUED\r\n")
+                continue
+            if name == "WATCH":
+                with server.lock:
+                    for key in args:
+                        watched[key] = server.versions.get(key, 0)
+                reply = b"OK"
+            elif name == "MULTI":
+                queued = []
+                reply = b"OK"
+            elif name == "EXEC":
+                with server.lock:
+                    if any(server.versions.get(key, 0) != version
+                           for key, version in watched.items()):
+                        reply = None
+                    else:
+                        for _, set_args in queued:
+                            server.set(set_args[0], set_args[1])
+                        reply = [b"OK"] * len(queued)
+                watched, queued = {}, None
+            elif name == "MGET":
+                with server.lock:
+                    reply = [server.data.get(key) for key in args]
+            elif name == "GET":
+                with server.lock:
+                    reply = server.data.get(args[0])
+            elif name == "SET":
+                with server.lock:
+                    server.set(args[0], args[1])
+                reply = b"OK"
+            elif name == "TIME":
+                now = time.time()
+                reply = [str(int(now)), str(int(now % 1 * 1e6))]
+            else:
+                self.wfile.write(b"-ERR unknown command\r\n")
+                continue
+            self.wfile.write(self.encode(reply))
+
+
+# Fixtures
+
+@pytest.fixture
+def redis_stand_in():
+    server = RedisStandIn()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    return str(tmp_path / "ratelimit.json")
+
+
+# Helper Functions
+def elapsed_for_requests(limiters, requests_per_limiter):
+    """Time the requests made concurrently through several limiters."""
+    def worker(limiter):
+        for _ in range(requests_per_limiter):
+            limiter.acquire("rooms")
+
+    threads = [threading.Thread(target=worker, args=(limiter,))
+               for limiter in limiters]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.time() - start
+
+
+# Tests
+
+def test_in_process_backend_shares_a_budget():
+    backend = InProcessBackend()
+    limiters = [RateLimiter(rate=10, burst=1, backend=backend)
+                for _ in range(2)]
+    # 10 requests at 10 requests/second (first request is free)
+    assert elapsed_for_requests(limiters, 5) >= 0.85
+
+
+def test_endpoint_buckets():
+    limiter = RateLimiter(endpoint_rates={"messages": (10, 1)})
+    assert limiter.reserve("rooms") == 0
+    assert limiter.reserve("messages") == 0
+    assert limiter.reserve("messages") > 0
+
+
+def test_pause_gate_holds_all_requests():
+    limiter = RateLimiter(rate=1000)
+    limiter.pause(0.5)
+    assert limiter.reserve("rooms") > 0.4
+    assert limiter.reserve("people") > 0.4
+
+
+def test_file_lock_backend_shares_a_budget(state_file):
+    limiters = [RateLimiter(rate=10, burst=1,
+                            backend=FileLockBackend(state_file))
+                for _ in range(2)]
+    assert elapsed_for_requests(limiters, 5) >= 0.85
+
+
+def test_file_lock_backend_shares_the_pause_gate(state_file):
+    RateLimiter(backend=FileLockBackend(state_file)).pause(0.5)
+    limiter = RateLimiter(backend=FileLockBackend(state_file))
+    assert limiter.pause_remaining() > 0.4
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+def test_file_lock_backend_across_processes(state_file):
+    limiter = RateLimiter(rate=10, burst=1,
+                          backend=FileLockBackend(state_file))
+    start = time.time()
+    pid = os.fork()
+    for _ in range(5):
+        limiter.acquire()
+    if pid == 0:
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert time.time() - start >= 0.85
+
+
+def test_redis_backend_shares_a_budget(redis_stand_in):
+    port = redis_stand_in.server_address[1]
+    limiters = [RateLimiter(rate=10, burst=1,
+                            backend=RedisBackend("127.0.0.1", port))
+                for _ in range(2)]
+    assert elapsed_for_requests(limiters, 5) >= 0.85
+
+
+def test_redis_backend_shares_the_pause_gate(redis_stand_in):
+    port = redis_stand_in.server_address[1]
+    RateLimiter(backend=RedisBackend("127.0.0.1", port)).pause(0.5)
+    limiter = RateLimiter(backend=RedisBackend("127.0.0.1", port))
+    assert limiter.pause_remaining() > 0.4
+    assert limiter.reserve("rooms") > 0.4
+
+
+def test_async_session_calls_shared_backends_off_the_event_loop(state_file):
+    limiter = RateLimiter(rate=10, burst=1,
+                          backend=FileLockBackend(state_file))
+    session = AsyncRestSession("access_token", "https://webexapis.com/v1/",
+                               rate_limiter=limiter)
+    threads = set()
+    reserve = limiter.backend.reserve
+
+    def recording_reserve(buckets):
+        threads.add(threading.current_thread())
+        return reserve(buckets)
+
+    limiter.backend.reserve = recording_reserve
+
+    async def acquire():
+        for _ in range(2):
+            await session._acquire(limiter, "rooms")
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(acquire())
+    assert threads and loop_thread not in threads
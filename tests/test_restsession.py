@@ -23,12 +23,20 @@ SOFTWARE.
 """
 
 
+import datetime
+import json
 import logging
+import threading
+import time
+import urllib.parse
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+import requests
 
 import webexteamssdk
+from webexteamssdk.restsession import RestSession
 
 
 logging.captureWarnings(True)
@@ -43,6 +51,34 @@ def rate_limit_detected(w):
     return False
 
 
+def json_response(content):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps(content).encode("utf-8")
+    return response
+
+
+def capped_offset_server(total, max_page_size):
+    """A stand-in for an offset-paginated endpoint that caps the page size.
+
+    Returns the request function and the list of the `max` and `start`
+    parameters of the requests it received.
+    """
+    received = []
+
+    def request(method, url, **kwargs):
+        params = kwargs.get("params") or {}
+        start, page_size = int(params.get("start", 0)), int(params["max"])
+        received.append((page_size, start))
+        end = min(total, start + min(page_size, max_page_size))
+        return json_response({"items": [
+            {"id": str(index)} for index in range(start, end)
+        ]})
+
+    return request, received
+
+
 # Tests
 @pytest.mark.slow
 def test_rate_limit_retry(api, list_of_rooms, add_rooms):
@@ -59,3 +95,135 @@ def test_rate_limit_retry(api, list_of_rooms, add_rooms):
                 break
 
     api._session.wait_on_rate_limit = original_wait_on_rate_limit
+
+
+def test_rate_limiter_paces_requests(api):
+    limited_api = webexteamssdk.WebexTeamsAPI(
+        access_token=api.access_token,
+        rate_limiter=webexteamssdk.RateLimiter(rate=2, burst=1),
+    )
+
+    start = time.time()
+    for _ in range(3):
+        limited_api.people.me()
+
+    assert time.time() - start >= 1
+
+
+def test_get_pages_with_prefetch(api, list_of_rooms, add_rooms):
+    if len(list_of_rooms) < 3:
+        add_rooms(3 - len(list_of_rooms))
+    params = {"max": 1}
+
+    expected = list(api._session.get_pages("rooms", params=params))
+    pages = list(api._session.get_pages("rooms", params=params, prefetch=2))
+    assert pages == expected
+
+    # Closing the generator early stops the background fetches
+    pages = api._session.get_pages("rooms", params=params, prefetch=2)
+    assert next(pages) == expected[0]
+    pages.close()
+
+
+def test_deadline_bounds_requests(api):
+    with api.deadline(30):
+        assert api.people.me()
+
+    with pytest.raises(webexteamssdk.DeadlineExceededError):
+        with api.deadline(0):
+            api.people.me()
+
+
+def test_concurrent_gets_are_coalesced():
+    session = RestSession(
+        "access_token", "https://webexapis.com/v1/", coalesce_gets=True,
+    )
+    sent = []
+    release = threading.Event()
+
+    def request(method, url, **kwargs):
+        sent.append(url)
+        release.wait(5)
+        return json_response({"id": "room_id"})
+
+    session._req_session.request = request
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = [executor.submit(session.get, "rooms/room_id")
+                   for _ in range(8)]
+        # Let the followers join the leader's in-flight request
+        time.sleep(0.5)
+        release.set()
+        rooms = [result.result() for result in results]
+
+    assert len(sent) == 1
+    assert all(room == {"id": "room_id"} for room in rooms)
+    # Each caller receives its own copy of the result
+    assert len(set(id(room) for room in rooms)) == 8
+
+
+def test_adaptive_page_sizes_exclude_waits():
+    session = RestSession("access_token", "https://webexapis.com/v1/")
+    page_sizes = []
+
+    def request(method, url, **kwargs):
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlparse(url).query))
+        query.update(kwargs.get("params") or {})
+        start, page_size = int(query.get("start", 0)), int(query["max"])
+        page_sizes.append(page_size)
+        if len(page_sizes) == 2:
+            # A (rate-limit) wait before the second page's exchange
+            time.sleep(0.3)
+
+        response = json_response({"items": [
+            {"id": str(index)} for index in range(start, start + page_size)
+        ]})
+        response.headers["Link"] = '<{}?{}>; rel="next"'.format(
+            url.split("?")[0],
+            urllib.parse.urlencode({"start": start + page_size,
+                                    "max": page_size}),
+        )
+        # Each exchange takes one second, whatever the page size
+        response.elapsed = datetime.timedelta(seconds=1)
+        return response
+
+    session._req_session.request = request
+
+    with session.adaptive_pagination(ceiling=80):
+        items = session.get_items("rooms", params={"max": 10})
+        ids = [item["id"] for _, item in zip(range(150), items)]
+
+    assert ids == [str(index) for index in range(150)]
+    assert page_sizes[:4] == [10, 20, 40, 80]
+
+
+def test_parallel_pages_with_a_capped_page_size():
+    session = RestSession("access_token", "https://webexapis.com/v1/")
+    session._req_session.request, received = capped_offset_server(10, 3)
+
+    pages = session.get_pages_parallel("rooms", params={"max": 5},
+                                       concurrency=4)
+    ids = [item["id"] for page in pages for item in page["items"]]
+
+    assert ids == [str(index) for index in range(10)]
+    assert received[:2] == [(5, 0), (5, 3)]
+
+
+def test_parallel_pages_stop_at_a_short_page():
+    session = RestSession("access_token", "https://webexapis.com/v1/")
+    session._req_session.request, received = capped_offset_server(3, 1000)
+
+    pages = list(session.get_pages_parallel("rooms", params={"max": 5}))
+
+    assert [len(page["items"]) for page in pages] == [3]
+    assert received == [(5, 0), (5, 3)]
+
+
+def test_parallel_page_sizes_are_capped_for_the_endpoint():
+    session = RestSession("access_token", "https://webexapis.com/v1/")
+    session._req_session.request, received = capped_offset_server(150, 1000)
+
+    pages = list(session.get_pages_parallel("messages", page_size=5000))
+
+    assert [len(page["items"]) for page in pages] == [100, 50]
+    assert received[:2] == [(100, 0), (100, 100)]
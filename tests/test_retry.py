@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""webexteamssdk/retry.py Fixtures & Tests
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import requests
+
+from webexteamssdk.exceptions import ApiError
+from webexteamssdk.retry import RetryBudget, RetryPolicy
+
+
+# Helper Functions
+def api_error(status_code, method="GET"):
+    response = requests.Response()
+    response.status_code = status_code
+    response.request = requests.Request(
+        method, "https://webexapis.com/v1/rooms",
+    ).prepare()
+    return ApiError(response)
+
+
+# Tests
+def test_retry_budget_limits_retries():
+    budget = RetryBudget(ratio=0.5, max_tokens=2)
+    assert budget.withdraw() and budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def test_retry_policy_retries_retryable_errors():
+    policy = RetryPolicy(max_attempts=3, base_delay=1, budget=False)
+    assert 0 <= policy.retry_delay("GET", 1, api_error(503)) <= 1
+    assert 0 <= policy.retry_delay("GET", 2, api_error(502)) <= 2
+    assert policy.retry_delay("GET", 3, api_error(503)) is None
+    assert policy.retry_delay(
+        "GET", 1, requests.exceptions.ReadTimeout(),
+    ) is not None
+    assert policy.stats["retries"] == 3
+    assert policy.stats["attempts_exhausted"] == 1
+
+
+def test_retry_policy_does_not_retry_other_errors():
+    policy = RetryPolicy(budget=False)
+    assert policy.retry_delay("GET", 1, api_error(404)) is None
+    assert policy.retry_delay("POST", 1, api_error(503, "POST")) is None
+    assert policy.retry_delay("GET", 1, ValueError()) is None
+    assert policy.retries == 0
+
+
+def test_retry_policy_stops_when_budget_is_exhausted():
+    policy = RetryPolicy(max_attempts=10,
+                         budget=RetryBudget(ratio=0, max_tokens=1))
+    assert policy.retry_delay("GET", 1, api_error(503)) is not None
+    assert policy.retry_delay("GET", 2, api_error(503)) is None
+    assert policy.stats["budget_exhausted"] == 1
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""webexteamssdk/tracing.py Fixtures & Tests
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import io
+import json
+import time
+
+from webexteamssdk.hooks import RequestEvent
+from webexteamssdk.tracing import (
+    ConsoleSpanExporter, InMemorySpanExporter, TracingHooks,
+)
+
+
+# Helper Functions
+def trace_request(tracing, status_code, endpoint="rooms/{id}"):
+    event = RequestEvent("GET", "https://webexapis.com/v1/" + endpoint,
+                         endpoint, attempt=1, start_time=time.time())
+    tracing.before_request(event)
+    event.elapsed = 0.25
+    event.status_code = status_code
+    event.tracking_id = "ROUTER_1234"
+    tracing.after_response(event)
+
+
+# Tests
+def test_request_spans_are_children_of_the_current_span():
+    exporter = InMemorySpanExporter()
+    tracing = TracingHooks(exporter)
+
+    with tracing.span("reply") as parent:
+        trace_request(tracing, 200)
+        trace_request(tracing, 503)
+
+    ok, failed, reply = exporter.get_finished_spans()
+    assert reply is parent
+    assert ok.name == "GET rooms/{id}"
+    assert ok.parent_id == failed.parent_id == parent.span_id
+    assert ok.trace_id == failed.trace_id == parent.trace_id
+    assert ok.attributes["webex.tracking_id"] == "ROUTER_1234"
+    assert abs(ok.duration - 0.25) < 0.001
+    assert ok.status == "UNSET"
+    assert failed.status == "ERROR"
+
+
+def test_console_exporter_writes_json_spans():
+    out = io.StringIO()
+    tracing = TracingHooks(ConsoleSpanExporter(out))
+    trace_request(tracing, 200)
+
+    span = json.loads(out.getvalue())
+    assert span["name"] == "GET rooms/{id}"
+    assert span["kind"] == "SpanKind.CLIENT"
+    assert span["parent_id"] is None
+    assert span["attributes"]["http.response.status_code"] == 200
@@ -38,18 +38,49 @@ from ._metadata import (
     __download_url__, __license__, __title__, __url__, __version__,
 )
 from .api import WebexTeamsAPI
+from .api.async_api import AsyncWebexTeamsAPI
+from .cache import (
+    CacheBackend, EntityCache, FileCacheBackend, InMemoryCacheBackend,
+)
+from .checkpoints import PaginationCheckpoint
+from .columnar import ColumnBatch
+from .deadline import Deadline
 from .exceptions import (
-    AccessTokenError, ApiError, ApiWarning, MalformedResponse, RateLimitError,
+    AccessTokenError, ApiError, ApiWarning, DeadlineExceededError,
+    MalformedResponse, RateLimiterBackendError, RateLimitError,
     RateLimitWarning, webexteamssdkException, webexteamssdkWarning,
 )
+from .hooks import RequestEvent, RequestHooks
+from .json_codec import (
+    get_json_codec, JSONCodec, OrjsonCodec, RawJSON, split_json_page,
+    StdlibJSONCodec, UjsonCodec,
+)
+from .loaders import AsyncPeopleLoader, PeopleLoader
+from .metrics import Histogram, MetricsRegistry
+from .models.compiled import compiled_data_factory, CompiledData
 from .models.dictionary import dict_data_factory
 from .models.immutable import (
     AccessToken, AdminAuditEvent, AttachmentAction, Event, GuestIssuerToken,
-    immutable_data_factory, License, Membership, Message, Organization, Person,
-    Role, Room, RoomMeetingInfo, Team, TeamMembership, Webhook, WebhookEvent,
+    identity_data_factory, immutable_data_factory, License, Membership,
+    Message, Organization, Person, Role, Room, RoomMeetingInfo, Team,
+    TeamMembership, Webhook, WebhookEvent,
 )
+from .models.lazy import lazy_data_factory, LazyData, LazyDataFactory
 from .models.simple import simple_data_factory, SimpleDataModel
-from .utils import WebexTeamsDateTime
+from .page_size import AdaptivePageSize
+from .ratelimit import (
+    FileLockBackend, InProcessBackend, RateLimiter, RateLimiterBackend,
+    RedisBackend, TokenBucket,
+)
+from .retry import RetryBudget, RetryPolicy
+from .sharding import ShardedScan
+from .tracing import (
+    ConsoleSpanExporter, InMemorySpanExporter, Span, SpanExporter,
+    TracingHooks,
+)
+from .utils import (
+    timestamps_to_datetime64, timestamps_to_epoch, WebexTeamsDateTime,
+)
 
 
 # Initialize Package Logging
@@ -24,14 +24,21 @@ SOFTWARE.
 
 from past.types import basestring
 
+from webexteamssdk.cache import EntityCache
 from webexteamssdk.config import (
-    DEFAULT_BASE_URL, DEFAULT_SINGLE_REQUEST_TIMEOUT,
+    DEFAULT_BASE_URL, DEFAULT_COALESCE_GETS, DEFAULT_JSON_CODEC,
+    DEFAULT_POOL_BLOCK, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE,
+    DEFAULT_PREFETCH, DEFAULT_SINGLE_REQUEST_TIMEOUT,
     DEFAULT_WAIT_ON_RATE_LIMIT,
 )
 from webexteamssdk.environment import WEBEX_TEAMS_ACCESS_TOKEN
 from webexteamssdk.exceptions import AccessTokenError
+from webexteamssdk.json_codec import JSONCodec
+from webexteamssdk.metrics import MetricsRegistry
 from webexteamssdk.models.immutable import immutable_data_factory
+from webexteamssdk.ratelimit import RateLimiter
 from webexteamssdk.restsession import RestSession
+from webexteamssdk.retry import RetryPolicy
 from webexteamssdk.utils import check_type
 from .access_tokens import AccessTokensAPI
 from .admin_audit_events import AdminAuditEventsAPI
@@ -66,6 +73,9 @@ class WebexTeamsAPI(object):
 
     WebexTeamsAPI wraps all of the individual Webex Teams APIs and represents
     them in a simple hierarchical structure.
+
+    A WebexTeamsAPI object is safe to share between threads; all threads
+    reuse the pooled connections of its session (see `pool_maxsize`).
     """
 
     def __init__(self, access_token=None, base_url=DEFAULT_BASE_URL,
@@ -79,7 +89,19 @@ class WebexTeamsAPI(object):
                  proxies=None,
                  be_geo_id=None,
                  caller=None,
-                 disable_ssl_verify=False):
+                 disable_ssl_verify=False,
+                 rate_limiter=None,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 pool_block=DEFAULT_POOL_BLOCK,
+                 tcp_keepalive=None,
+                 json_codec=DEFAULT_JSON_CODEC,
+                 prefetch=DEFAULT_PREFETCH,
+                 entity_cache=None,
+                 coalesce_gets=DEFAULT_COALESCE_GETS,
+                 retry_policy=None,
+                 metrics=None,
+                 hooks=None):
         """Create a new WebexTeamsAPI object.
 
         An access token must be used when interacting with the Webex Teams API.
@@ -113,6 +135,9 @@ class WebexTeamsAPI(object):
                 webexteamssdk.config.DEFAULT_WAIT_ON_RATE_LIMIT.
             object_factory(callable): The factory function to use to create
                 Python objects from the returned Webex Teams JSON data objects.
+                Factories with a true `raw_json` attribute (for example,
+                :data:`lazy_data_factory`) are passed the raw JSON text of the
+                items of list results.
             client_id(basestring): The client id of your integration. Provided
                 upon creation in the portal.
             client_secret(basestring): The client secret of your integration.
@@ -132,6 +157,52 @@ class WebexTeamsAPI(object):
             disable_ssl_verify(bool): Optional boolean flag to disable ssl
                 verification. Defaults to False. If set to True, the requests
                 session won't verify ssl certs anymore.
+            rate_limiter(RateLimiter): Optional client-side rate limiter used
+                to pace API requests.  A RateLimiter may be shared by several
+                WebexTeamsAPI objects to share a request budget.
+            pool_connections(int): The number of connection pools (one per
+                host) to cache. Defaults to
+                webexteamssdk.config.DEFAULT_POOL_CONNECTIONS.
+            pool_maxsize(int): The maximum number of connections kept in each
+                connection pool. When a WebexTeamsAPI object is shared by
+                several threads, set this to (at least) the number of threads.
+                Defaults to webexteamssdk.config.DEFAULT_POOL_MAXSIZE.
+            pool_block(bool): Whether requests should wait for a pooled
+                connection to become available, rather than opening (and then
+                discarding) extra connections. Defaults to
+                webexteamssdk.config.DEFAULT_POOL_BLOCK.
+            tcp_keepalive(int): Optional idle time (seconds) after which TCP
+                keep-alive probes are sent on pooled connections.
+            json_codec(JSONCodec, basestring): The JSON codec, or the name of
+                a codec, used to parse the API responses and encode request
+                bodies.  Use "auto" for the fastest installed codec (orjson,
+                ujson or the standard library), which parses JSON objects to
+                plain dicts. Defaults to
+                webexteamssdk.config.DEFAULT_JSON_CODEC ("stdlib"; parses JSON
+                objects to OrderedDicts).
+            prefetch(int): The number of pages fetched ahead (on a background
+                thread) while iterating over the results of `list()` methods.
+                Defaults to webexteamssdk.config.DEFAULT_PREFETCH (0; pages
+                are fetched as they are needed).
+            entity_cache(EntityCache): Optional cache of the responses of
+                `get()` (get-by-id) requests, invalidated by the `update()`
+                and `delete()` requests made through this object.  Responses
+                are cached per access token.
+            coalesce_gets(bool): Coalesce identical concurrent `get()`
+                requests (for example, many threads getting the same room)
+                into a single request.  Defaults to
+                webexteamssdk.config.DEFAULT_COALESCE_GETS (False).
+            retry_policy(RetryPolicy): Optional policy retrying the requests
+                that fail with connection errors, timeouts or 502, 503 and
+                504 responses, with jittered exponential backoff, bounded by
+                a retry budget.
+            metrics(MetricsRegistry): Optional registry recording the
+                per-endpoint metrics (request counts, status codes, latency,
+                payload sizes, retries, pages and rate-limit waits) of the
+                requests made through this object.
+            hooks(list): Optional request lifecycle hooks
+                (:class:`RequestHooks`, such as :class:`TracingHooks`)
+                called as the requests are made.
 
         Returns:
             WebexTeamsAPI: A new WebexTeamsAPI object.
@@ -154,6 +225,18 @@ class WebexTeamsAPI(object):
         check_type(be_geo_id, basestring, optional=True)
         check_type(caller, basestring, optional=True)
         check_type(disable_ssl_verify, bool, optional=True)
+        check_type(rate_limiter, RateLimiter, optional=True)
+        check_type(pool_connections, int)
+        check_type(pool_maxsize, int)
+        check_type(pool_block, bool)
+        check_type(tcp_keepalive, int, optional=True)
+        check_type(json_codec, (basestring, JSONCodec))
+        check_type(prefetch, int)
+        check_type(entity_cache, EntityCache, optional=True)
+        check_type(coalesce_gets, bool)
+        check_type(retry_policy, RetryPolicy, optional=True)
+        check_type(metrics, MetricsRegistry, optional=True)
+        check_type(hooks, list, optional=True)
 
         access_token = access_token or WEBEX_TEAMS_ACCESS_TOKEN
 
@@ -198,7 +281,20 @@ class WebexTeamsAPI(object):
             proxies=proxies,
             be_geo_id=be_geo_id,
             caller=caller,
-            disable_ssl_verify=disable_ssl_verify
+            disable_ssl_verify=disable_ssl_verify,
+            rate_limiter=rate_limiter,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
+            json_codec=json_codec,
+            prefetch=prefetch,
+            raw_items=bool(getattr(object_factory, "raw_json", False)),
+            entity_cache=entity_cache,
+            coalesce_gets=coalesce_gets,
+            retry_policy=retry_policy,
+            metrics=metrics,
+            hooks=hooks,
         )
 
         # API wrappers
@@ -249,6 +345,29 @@ class WebexTeamsAPI(object):
         """Automatic rate-limit handling enabled / disabled."""
         return self._session.wait_on_rate_limit
 
+    @property
+    def metrics(self):
+        """The registry of request metrics (None when disabled)."""
+        return self._session.metrics
+
+    def deadline(self, seconds):
+        """Context manager: bound the API calls made within to a deadline.
+
+        Within the context (in the calling thread), the API calls (including
+        the pages of `list()` results, retries and rate-limit waits) must
+        complete within `seconds` of entering the context, or raise
+        :class:`DeadlineExceededError`::
+
+            with api.deadline(2.5):
+                room = api.rooms.get(roomId)
+                members = list(api.memberships.list(roomId=roomId))
+
+        Args:
+            seconds(int, float): The time budget (seconds).
+
+        """
+        return self._session.deadline(seconds)
+
     # Create a class attribute for the Access Tokens API that can be accessed
     # before WebexTeamsAPI object is initialized.
     access_tokens = AccessTokensAPI(
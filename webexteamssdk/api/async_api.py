@@ -0,0 +1,552 @@
+# -*- coding: utf-8 -*-
+"""Webex Teams asyncio API wrapper.
+
+Classes:
+    AsyncWebexTeamsAPI: asyncio twin of the WebexTeamsAPI connection object.
+
+The asyncio API wrappers are derived from the synchronous API wrappers, so
+both clients always expose the same endpoints, parameters and argument
+checking.  Each synchronous wrapper is driven with a stand-in session that
+records the request the wrapper would make; the recorded request is then sent
+with an :class:`AsyncRestSession`, and the results are passed through the
+object factory exactly as the synchronous wrapper would have done.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+import contextlib
+import functools
+import inspect
+import os
+import threading
+
+from past.types import basestring
+from requests_toolbelt import MultipartEncoder
+
+from webexteamssdk.async_restsession import AsyncRestSession
+from webexteamssdk.config import (
+    DEFAULT_BASE_URL, DEFAULT_JSON_CODEC, DEFAULT_LOADER_WINDOW,
+    DEFAULT_POOL_BLOCK, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE,
+    DEFAULT_PREFETCH, DEFAULT_SINGLE_REQUEST_TIMEOUT,
+    DEFAULT_WAIT_ON_RATE_LIMIT,
+)
+from webexteamssdk.environment import WEBEX_TEAMS_ACCESS_TOKEN
+from webexteamssdk.exceptions import AccessTokenError
+from webexteamssdk.generator_containers import AsyncGeneratorContainer
+from webexteamssdk.json_codec import JSONCodec
+from webexteamssdk.loaders import AsyncPeopleLoader
+from webexteamssdk.models.immutable import immutable_data_factory
+from webexteamssdk.ratelimit import RateLimiter
+from webexteamssdk.response_codes import EXPECTED_RESPONSE_CODE
+from webexteamssdk.restsession import RestSession
+from webexteamssdk.utils import (
+    check_type, dict_from_items_with_values, extract_and_parse_json,
+)
+from .access_tokens import API_ENDPOINT as ACCESS_TOKENS_API_ENDPOINT
+from .access_tokens import OBJECT_TYPE as ACCESS_TOKEN_OBJECT_TYPE
+from .access_tokens import AccessTokensAPI
+from .admin_audit_events import AdminAuditEventsAPI
+from .attachment_actions import AttachmentActionsAPI
+from .events import EventsAPI
+from .guest_issuer import GuestIssuerAPI
+from .licenses import LicensesAPI
+from .memberships import MembershipsAPI
+from .messages import MessagesAPI
+from .organizations import OrganizationsAPI
+from .locations import LocationsAPI
+from .people import PeopleAPI
+from .devices import DevicesAPI
+from .workspaces import WorkspacesAPI
+from .roles import RolesAPI
+from .rooms import RoomsAPI
+from .team_memberships import TeamMembershipsAPI
+from .teams import TeamsAPI
+from .webhooks import WebhooksAPI
+from .telephony import TelephonyAPI
+from .contactcenter import ContactCenterAPI
+from .csdm import csdmAPI
+
+
+class _RecordedRequest(object):
+    """A session method call recorded from a synchronous API wrapper."""
+
+    def __init__(self, method_name, args, kwargs):
+        self.method_name = method_name
+        self.args = args
+        self.kwargs = kwargs
+
+    def __iter__(self):
+        """Yield this request, standing in for the items it will return."""
+        yield self
+
+    async def send(self, session):
+        """Send the recorded request using an AsyncRestSession."""
+        method = getattr(session, self.method_name)
+        return await method(*self.args, **self.kwargs)
+
+    def iterate(self, session):
+        """Return an async iterator over the recorded request's results."""
+        method = getattr(session, self.method_name)
+        return method(*self.args, **self.kwargs)
+
+
+class _RecordedObject(object):
+    """An object-factory call recorded from a synchronous API wrapper."""
+
+    def __init__(self, model, json_data):
+        self.model = model
+        self.json_data = json_data
+
+
+class _RequestRecorder(RestSession):
+    """Stand-in session used to drive the synchronous API wrappers.
+
+    Instead of making HTTP requests, the session methods record the calls made
+    by the API wrappers.  RestSession.__init__() is intentionally not called;
+    the recorder has no connection, headers or configuration of its own.
+
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def capture(self):
+        """Capture the requests recorded within the context."""
+        recorded = []
+        self._local.recorded = recorded
+        try:
+            yield recorded
+        finally:
+            self._local.recorded = None
+
+    def _record(self, method_name, *args, **kwargs):
+        recorded = getattr(self._local, "recorded", None)
+        if recorded is None:
+            raise RuntimeError("Requests may only be recorded by an "
+                               "AsyncWebexTeamsAPI wrapper.")
+
+        data = kwargs.get("data")
+        if isinstance(data, MultipartEncoder):
+            # The wrappers close any opened files as soon as they return;
+            # encode the multipart body now, while the files are still open.
+            kwargs["data"] = data.to_string()
+
+        request = _RecordedRequest(method_name, args, kwargs)
+        recorded.append(request)
+        return request
+
+    def get(self, *args, **kwargs):
+        return self._record("get", *args, **kwargs)
+
+    def get_pages(self, *args, **kwargs):
+        return self._record("get_pages", *args, **kwargs)
+
+    def get_items(self, *args, **kwargs):
+        return self._record("get_items", *args, **kwargs)
+
+    def get_items_list(self, *args, **kwargs):
+        return self._record("get_items_list", *args, **kwargs)
+
+    def post(self, *args, **kwargs):
+        return self._record("post", *args, **kwargs)
+
+    def post_test(self, *args, **kwargs):
+        return self._record("post_test", *args, **kwargs)
+
+    def put(self, *args, **kwargs):
+        return self._record("put", *args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        return self._record("delete", *args, **kwargs)
+
+
+def _recording_object_factory(model, json_data):
+    """Object factory used to record the model requested by a wrapper."""
+    return _RecordedObject(model, json_data)
+
+
+class AsyncAPIWrapper(object):
+    """asyncio adapter for a synchronous Webex Teams API wrapper.
+
+    Exposes each public method of the wrapped API.  Methods that return a
+    GeneratorContainer in the synchronous API return an
+    :class:`AsyncGeneratorContainer` (use `async for`), all other methods are
+    coroutine functions.
+
+    """
+
+    def __init__(self, api_class, session, object_factory, recorder):
+        """Init a new AsyncAPIWrapper.
+
+        Args:
+            api_class(type): The synchronous API wrapper class.
+            session(AsyncRestSession): The session used to send the requests.
+            object_factory(callable): The factory function used to create
+                Python objects from the returned JSON data objects.
+            recorder(_RequestRecorder): The request recorder used to drive the
+                synchronous API wrapper.
+
+        """
+        super(AsyncAPIWrapper, self).__init__()
+
+        self._api = api_class(recorder, _recording_object_factory)
+        self._session = session
+        self._object_factory = object_factory
+        self._recorder = recorder
+
+        for name, function in inspect.getmembers(api_class,
+                                                 inspect.isfunction):
+            if name.startswith("_") or hasattr(type(self), name):
+                # Private, or implemented by the (subclass) adapter itself
+                continue
+            setattr(self, name, self._adapt(getattr(self._api, name)))
+
+    def __repr__(self):
+        return "<AsyncAPIWrapper {}>".format(type(self._api).__name__)
+
+    def _build(self, result, value):
+        """Build the return value from a recorded result and its response."""
+        if isinstance(result, _RecordedObject):
+            return self._object_factory(result.model, value)
+        elif isinstance(result, _RecordedRequest):
+            return value
+        else:
+            return result
+
+    def _adapt(self, method):
+        """Adapt a bound synchronous wrapper method for asyncio."""
+        function = inspect.unwrap(method.__func__)
+
+        if inspect.isgeneratorfunction(function):
+            @functools.wraps(method)
+            def list_wrapper(*args, **kwargs):
+                return AsyncGeneratorContainer(self._iterate, method,
+                                               *args, **kwargs)
+            return list_wrapper
+
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            with self._recorder.capture() as recorded:
+                result = method(*args, **kwargs)
+
+            value = None
+            for request in recorded:
+                value = await request.send(self._session)
+
+            return self._build(result, value)
+
+        return wrapper
+
+    async def _iterate(self, method, *args, **kwargs):
+        """Async generator yielding the results of a wrapper list method."""
+        with self._recorder.capture():
+            generator = iter(method(*args, **kwargs))
+            try:
+                result = next(generator, None)
+            finally:
+                generator.close()
+
+        if isinstance(result, _RecordedObject):
+            request = result.json_data
+        elif isinstance(result, _RecordedRequest):
+            request = result
+        else:
+            return
+
+        async for item in request.iterate(self._session):
+            yield self._build(result, item)
+
+
+class AsyncPeopleAPI(AsyncAPIWrapper):
+    """asyncio adapter for the People API wrapper."""
+
+    def loader(self, window=DEFAULT_LOADER_WINDOW, callingData=False):
+        """Return a loader that batches people lookups into list calls.
+
+        Concurrent `await loader.get(personId)` calls are collected for
+        `window` seconds and looked up with one `list(id=...)` call per 85
+        IDs; see :class:`AsyncPeopleLoader`.
+
+        Args:
+            window(int, float): The time (seconds) a batch collects lookups
+                before it is sent.
+            callingData(bool): Include Webex Calling user details.
+
+        Returns:
+            AsyncPeopleLoader: The batching loader.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        return AsyncPeopleLoader(self, window=window, callingData=callingData)
+
+
+class AsyncAccessTokensAPI(object):
+    """asyncio Webex Teams Access-Tokens API."""
+
+    def __init__(self, session, object_factory):
+        """Initialize an AsyncAccessTokensAPI object.
+
+        Args:
+            session(AsyncRestSession): The session used to send the requests.
+            object_factory(callable): The factory function used to create
+                Python objects from the returned JSON data objects.
+
+        """
+        check_type(session, AsyncRestSession)
+
+        super(AsyncAccessTokensAPI, self).__init__()
+
+        self._session = session
+        self._object_factory = object_factory
+
+    async def _post(self, post_data):
+        # The token endpoints take form data and no Authorization header
+        response = await self._session.request(
+            "POST", ACCESS_TOKENS_API_ENDPOINT, EXPECTED_RESPONSE_CODE["POST"],
+            headers={"Authorization": None, "Content-type": None},
+            data=post_data,
+        )
+        json_data = extract_and_parse_json(response)
+        return self._object_factory(ACCESS_TOKEN_OBJECT_TYPE, json_data)
+
+    async def get(self, client_id, client_secret, code, redirect_uri):
+        """Exchange an Authorization Code for an Access Token.
+
+        See :meth:`AccessTokensAPI.get`.
+
+        """
+        check_type(client_id, basestring)
+        check_type(client_secret, basestring)
+        check_type(code, basestring)
+        check_type(redirect_uri, basestring)
+
+        return await self._post(dict_from_items_with_values(
+            grant_type="authorization_code",
+            client_id=client_id,
+            client_secret=client_secret,
+            code=code,
+            redirect_uri=redirect_uri,
+        ))
+
+    async def refresh(self, client_id, client_secret, refresh_token):
+        """Return a refreshed Access Token from the provided refresh_token.
+
+        See :meth:`AccessTokensAPI.refresh`.
+
+        """
+        check_type(client_id, basestring)
+        check_type(client_secret, basestring)
+        check_type(refresh_token, basestring)
+
+        return await self._post(dict_from_items_with_values(
+            grant_type="refresh_token",
+            client_id=client_id,
+            client_secret=client_secret,
+            refresh_token=refresh_token,
+        ))
+
+
+class AsyncWebexTeamsAPI(object):
+    """Webex Teams asyncio API wrapper.
+
+    The asyncio twin of :class:`WebexTeamsAPI`.  Exposes the same hierarchy
+    of APIs; methods are coroutine functions and list methods return async
+    iterables::
+
+        async with AsyncWebexTeamsAPI() as api:
+            me = await api.people.me()
+            async for room in api.rooms.list():
+                print(room.title)
+
+    Requires the optional `aiohttp` package.
+
+    """
+
+    def __init__(self, access_token=None, base_url=DEFAULT_BASE_URL,
+                 single_request_timeout=DEFAULT_SINGLE_REQUEST_TIMEOUT,
+                 wait_on_rate_limit=DEFAULT_WAIT_ON_RATE_LIMIT,
+                 object_factory=immutable_data_factory,
+                 client_id=None,
+                 client_secret=None,
+                 oauth_code=None,
+                 redirect_uri=None,
+                 proxies=None,
+                 be_geo_id=None,
+                 caller=None,
+                 disable_ssl_verify=False,
+                 rate_limiter=None,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 pool_block=DEFAULT_POOL_BLOCK,
+                 tcp_keepalive=None,
+                 json_codec=DEFAULT_JSON_CODEC,
+                 prefetch=DEFAULT_PREFETCH):
+        """Create a new AsyncWebexTeamsAPI object.
+
+        Takes the same arguments as :meth:`WebexTeamsAPI.__init__`.  The OAuth
+        code exchange (when `client_id`, `client_secret`, `oauth_code` and
+        `redirect_uri` are provided) is performed synchronously, as part of
+        creating the object.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            AccessTokenError: If an access token is not provided via the
+                access_token argument or an environment variable.
+
+        """
+        check_type(access_token, basestring, optional=True)
+        check_type(base_url, basestring, optional=True)
+        check_type(single_request_timeout, int, optional=True)
+        check_type(wait_on_rate_limit, bool, optional=True)
+        check_type(client_id, basestring, optional=True)
+        check_type(client_secret, basestring, optional=True)
+        check_type(oauth_code, basestring, optional=True)
+        check_type(redirect_uri, basestring, optional=True)
+        check_type(proxies, dict, optional=True)
+        check_type(be_geo_id, basestring, optional=True)
+        check_type(caller, basestring, optional=True)
+        check_type(disable_ssl_verify, bool, optional=True)
+        check_type(rate_limiter, RateLimiter, optional=True)
+        check_type(pool_connections, int)
+        check_type(pool_maxsize, int)
+        check_type(pool_block, bool)
+        check_type(tcp_keepalive, int, optional=True)
+        check_type(json_codec, (basestring, JSONCodec))
+        check_type(prefetch, int)
+
+        access_token = access_token or WEBEX_TEAMS_ACCESS_TOKEN
+
+        # Check if the user has provided the required oauth parameters
+        oauth_param_list = [client_id, client_secret, oauth_code, redirect_uri]
+        if not access_token and all(oauth_param_list):
+            access_token = AccessTokensAPI(
+                base_url, object_factory,
+                single_request_timeout=single_request_timeout,
+            ).get(
+                client_id=client_id,
+                client_secret=client_secret,
+                code=oauth_code,
+                redirect_uri=redirect_uri
+            ).access_token
+
+        # Set optional API metrics tracking variables from env vars if there
+        be_geo_id = be_geo_id or os.environ.get('BE_GEO_ID')
+        caller = caller or os.environ.get('WEBEX_PYTHON_SDK_CALLER')
+
+        if not access_token:
+            raise AccessTokenError(
+                "You must provide a Webex Teams access token to interact with "
+                "the Webex Teams APIs, either via a WEBEX_TEAMS_ACCESS_TOKEN "
+                "environment variable or via the access_token argument."
+            )
+
+        # Create the API session
+        self._session = AsyncRestSession(
+            access_token=access_token,
+            base_url=base_url,
+            single_request_timeout=single_request_timeout,
+            wait_on_rate_limit=wait_on_rate_limit,
+            proxies=proxies,
+            be_geo_id=be_geo_id,
+            caller=caller,
+            disable_ssl_verify=disable_ssl_verify,
+            rate_limiter=rate_limiter,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
+            json_codec=json_codec,
+            prefetch=prefetch,
+            raw_items=bool(getattr(object_factory, "raw_json", False)),
+        )
+
+        recorder = _RequestRecorder()
+
+        def wrapper(api_class):
+            return AsyncAPIWrapper(api_class, self._session, object_factory,
+                                   recorder)
+
+        # API wrappers
+        self.access_tokens = AsyncAccessTokensAPI(
+            self._session, object_factory,
+        )
+        self.admin_audit_events = wrapper(AdminAuditEventsAPI)
+        self.attachment_actions = wrapper(AttachmentActionsAPI)
+        self.events = wrapper(EventsAPI)
+        self.guest_issuer = wrapper(GuestIssuerAPI)
+        self.licenses = wrapper(LicensesAPI)
+        self.memberships = wrapper(MembershipsAPI)
+        self.messages = wrapper(MessagesAPI)
+        self.organizations = wrapper(OrganizationsAPI)
+        self.locations = wrapper(LocationsAPI)
+        self.people = AsyncPeopleAPI(PeopleAPI, self._session,
+                                     object_factory, recorder)
+        self.devices = wrapper(DevicesAPI)
+        self.workspaces = wrapper(WorkspacesAPI)
+        self.roles = wrapper(RolesAPI)
+        self.rooms = wrapper(RoomsAPI)
+        self.teams = wrapper(TeamsAPI)
+        self.team_memberships = wrapper(TeamMembershipsAPI)
+        self.webhooks = wrapper(WebhooksAPI)
+        self.telephony = wrapper(TelephonyAPI)
+        self.contactcenter = wrapper(ContactCenterAPI)
+        self.csdm = wrapper(csdmAPI)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the API session and its connections."""
+        await self._session.close()
+
+    @property
+    def access_token(self):
+        """The access token used for API calls to the Webex Teams service."""
+        return self._session.access_token
+
+    @property
+    def base_url(self):
+        """The base URL prefixed to the individual API endpoint suffixes."""
+        return self._session.base_url
+
+    @property
+    def single_request_timeout(self):
+        """Timeout (in seconds) for an single HTTP request."""
+        return self._session.single_request_timeout
+
+    @property
+    def wait_on_rate_limit(self):
+        """Automatic rate-limit handling enabled / disabled."""
+        return self._session.wait_on_rate_limit
@@ -30,7 +30,7 @@ class ContactCenterAPI(object):
             orgId=orgId,
             type=type
         )
-        items = self._session.get_items(f"/organization/{orgId}/{feature}", params=params, items_param="data")
+        items = self._session.get_items(f"/organization/{orgId}/{feature}", params=params, items_param="data", raw=False)
 
         # Yield person objects created from the returned items JSON objects
         for item in items:
@@ -46,7 +46,7 @@ class ContactCenterAPI(object):
             orgId=orgId,
             type=type
         )
-        items = self._session.get_items_list(f"/organization/{orgId}/{feature}", params=params)
+        items = self._session.get_items_list(f"/organization/{orgId}/{feature}", params=params, raw=False)
 
         # Yield person objects created from the returned items JSON objects
         for item in items:
@@ -63,7 +63,7 @@ class ContactCenterAPI(object):
             orgId=orgId,
             type=type
         )
-        items = self._session.get_items(f"/organization/{orgId}/{feature}", params=params, items_param="resources")
+        items = self._session.get_items(f"/organization/{orgId}/{feature}", params=params, items_param="resources", raw=False)
 
         # Yield person objects created from the returned items JSON objects
         for item in items:
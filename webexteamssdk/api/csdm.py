@@ -60,7 +60,7 @@ class csdmAPI(object):
             orgId=orgId,
             type=type
         )
-        items = self._session.get_items_list(f"/organization/{orgId}/{feature}", params=params)
+        items = self._session.get_items_list(f"/organization/{orgId}/{feature}", params=params, raw=False)
 
         # Yield person objects created from the returned items JSON objects
         for item in items:
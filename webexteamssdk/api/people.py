@@ -34,7 +34,9 @@ from builtins import *
 
 from past.builtins import basestring
 
+from ..config import DEFAULT_LOADER_WINDOW
 from ..generator_containers import generator_container
+from ..loaders import PeopleLoader
 from ..restsession import RestSession
 from ..utils import (
     check_type,
@@ -228,6 +230,27 @@ class PeopleAPI(object):
         # Return a person object created from the response JSON data
         return self._object_factory(OBJECT_TYPE, json_data)
 
+    def loader(self, window=DEFAULT_LOADER_WINDOW, callingData=False):
+        """Return a loader that batches people lookups into list calls.
+
+        Concurrent `loader.get(personId)` calls are collected for `window`
+        seconds and looked up with one `list(id=...)` call per 85 IDs; see
+        :class:`PeopleLoader`.
+
+        Args:
+            window(int, float): The time (seconds) a batch collects lookups
+                before it is sent.
+            callingData(bool): Include Webex Calling user details.
+
+        Returns:
+            PeopleLoader: The batching loader.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        return PeopleLoader(self, window=window, callingData=callingData)
+
     def update(self, personId, emails=None, displayName=None, firstName=None,
                lastName=None, avatar=None, orgId=None, roles=None, callingData=False,
                licenses=None, locationId=None, **request_parameters):
@@ -0,0 +1,632 @@
+# -*- coding: utf-8 -*-
+"""AsyncRestSession class for asyncio connections to the Webex Teams APIs.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+import asyncio
+import logging
+import socket
+import urllib.parse
+import warnings
+
+import requests
+from past.builtins import basestring
+
+from .config import (
+    DEFAULT_JSON_CODEC, DEFAULT_POOL_BLOCK, DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE, DEFAULT_PREFETCH, DEFAULT_SINGLE_REQUEST_TIMEOUT,
+    DEFAULT_WAIT_ON_RATE_LIMIT,
+)
+from .exceptions import MalformedResponse, RateLimitError, RateLimitWarning
+from .ratelimit import InProcessBackend
+from .response_codes import EXPECTED_RESPONSE_CODE
+from .restsession import (
+    RestSession, _fix_next_url, tcp_keepalive_socket_options,
+)
+from .utils import check_response_code, check_type
+
+
+logger = logging.getLogger(__name__)
+
+
+# Helper Functions
+def _import_aiohttp():
+    """Import the optional aiohttp dependency; raise a helpful error."""
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError(
+            "The asyncio client requires the aiohttp package; install it "
+            "with `pip install webexteamssdk[async]`."
+        )
+    return aiohttp
+
+
+def _keepalive_socket_factory(idle):
+    """Build an aiohttp socket factory enabling TCP keep-alive probes."""
+    socket_options = tcp_keepalive_socket_options(idle)
+
+    def socket_factory(addr_info):
+        family, type_, proto = addr_info[:3]
+        sock = socket.socket(family=family, type=type_, proto=proto)
+        for level, option, value in socket_options:
+            sock.setsockopt(level, option, value)
+        return sock
+
+    return socket_factory
+
+
+# Main module interface
+class AsyncRestSession(RestSession):
+    """asyncio HTTP session class for making calls to the Webex Teams APIs.
+
+    The asyncio twin of :class:`RestSession`.  Session configuration (access
+    token, base URL, headers, timeouts and rate-limit handling) is shared with
+    the synchronous implementation; the request methods are coroutines, and the
+    paginating methods are asynchronous generators.
+
+    Requests are prepared with the `requests` package, exactly as they are
+    for a synchronous session, and are sent with `aiohttp`.  The responses are
+    returned as :class:`requests.Response` objects so that response checking,
+    JSON parsing and the package exceptions behave the same in both clients.
+
+    """
+
+    def __init__(self, access_token, base_url,
+                 single_request_timeout=DEFAULT_SINGLE_REQUEST_TIMEOUT,
+                 wait_on_rate_limit=DEFAULT_WAIT_ON_RATE_LIMIT,
+                 proxies=None,
+                 be_geo_id=None,
+                 caller=None,
+                 disable_ssl_verify=False,
+                 rate_limiter=None,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 pool_block=DEFAULT_POOL_BLOCK,
+                 tcp_keepalive=None,
+                 json_codec=DEFAULT_JSON_CODEC,
+                 prefetch=DEFAULT_PREFETCH,
+                 raw_items=False):
+        """Initialize a new AsyncRestSession object.
+
+        Args:
+            access_token(basestring): The Webex Teams access token to be used
+                for this session.
+            base_url(basestring): The base URL that will be suffixed onto API
+                endpoint relative URLs to produce a callable absolute URL.
+            single_request_timeout(int): The timeout (seconds) for a single
+                HTTP REST API request.
+            wait_on_rate_limit(bool): Enable or disable automatic rate-limit
+                handling.
+            proxies(dict): Dictionary of proxies, keyed by URL scheme, used
+                for the requests made by this session.
+            be_geo_id(basestring): Optional partner identifier for API usage
+                tracking.
+            caller(basestring): Optional  identifier for API usage tracking.
+            disable_ssl_verify(bool): Optional boolean flag to disable ssl
+                verification. Defaults to False.
+            rate_limiter(RateLimiter): Optional client-side rate limiter used
+                to pace the requests made by this session.
+            pool_connections(int): Not used by the aiohttp connection pool;
+                accepted for compatibility with RestSession.
+            pool_maxsize(int): The maximum number of connections kept open to
+                a host.
+            pool_block(bool): Whether requests should wait for a connection
+                once `pool_maxsize` connections are open to a host.  When
+                False (the default), the number of connections per host is
+                not limited.
+            tcp_keepalive(int): Optional idle time (seconds) after which TCP
+                keep-alive probes are sent on the session's connections, as
+                for RestSession.  Requires aiohttp 3.12 or later.
+            json_codec(JSONCodec, basestring): The JSON codec (or codec name)
+                used to parse response bodies and encode JSON request bodies.
+            prefetch(int): The number of pages fetched ahead (by a background
+                task) while the current page is consumed, when iterating over
+                paginated results.  Defaults to 0.
+            raw_items(bool): Do not decode the items of paginated results;
+                :meth:`get_items` yields the raw JSON text (:class:`RawJSON`)
+                of each item.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `prefetch` is negative.
+
+        """
+        super(AsyncRestSession, self).__init__(
+            access_token=access_token,
+            base_url=base_url,
+            single_request_timeout=single_request_timeout,
+            wait_on_rate_limit=wait_on_rate_limit,
+            proxies=proxies,
+            be_geo_id=be_geo_id,
+            caller=caller,
+            disable_ssl_verify=disable_ssl_verify,
+            rate_limiter=rate_limiter,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
+            json_codec=json_codec,
+            prefetch=prefetch,
+            raw_items=raw_items,
+        )
+
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._tcp_keepalive = tcp_keepalive
+        self._proxies = dict(proxies) if proxies else {}
+        self._disable_ssl_verify = disable_ssl_verify
+
+        # The aiohttp session must be created inside a running event loop;
+        # it is created on first use.
+        self._client_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _get_client_session(self):
+        """Return the aiohttp session, creating it if needed."""
+        if self._client_session is None or self._client_session.closed:
+            aiohttp = _import_aiohttp()
+            connector_kwargs = {
+                "limit": 0,
+                "limit_per_host":
+                    self._pool_maxsize if self._pool_block else 0,
+            }
+            if self._tcp_keepalive:
+                connector_kwargs["socket_factory"] = _keepalive_socket_factory(
+                    self._tcp_keepalive
+                )
+            if self._disable_ssl_verify:
+                connector_kwargs["ssl"] = False
+            try:
+                connector = aiohttp.TCPConnector(**connector_kwargs)
+            except TypeError:
+                if "socket_factory" not in connector_kwargs:
+                    raise
+                raise ValueError(
+                    "tcp_keepalive requires aiohttp 3.12 or later (for the "
+                    "socket_factory argument of aiohttp.TCPConnector)."
+                )
+            self._client_session = aiohttp.ClientSession(connector=connector)
+        return self._client_session
+
+    async def close(self):
+        """Close the underlying aiohttp session and its connections."""
+        if self._client_session is not None:
+            await self._client_session.close()
+            self._client_session = None
+
+    def _prepare_request(self, method, abs_url, **kwargs):
+        """Prepare a request, merging in the session headers and defaults."""
+        request = requests.Request(
+            method=method,
+            url=abs_url,
+            headers=kwargs.pop("headers", None),
+            params=kwargs.pop("params", None),
+            json=kwargs.pop("json", None),
+            data=kwargs.pop("data", None),
+        )
+        return self._req_session.prepare_request(request), kwargs
+
+    async def _send(self, prepared, timeout=None):
+        """Send a prepared request with aiohttp; return a requests.Response."""
+        aiohttp = _import_aiohttp()
+        import yarl
+
+        body = prepared.body
+        if hasattr(body, "read"):
+            # Streaming bodies (for example, multipart file uploads)
+            body = body.read()
+
+        scheme = urllib.parse.urlparse(prepared.url).scheme
+        client_session = self._get_client_session()
+        async with client_session.request(
+            prepared.method,
+            yarl.URL(prepared.url, encoded=True),
+            headers=dict(prepared.headers),
+            data=body,
+            proxy=self._proxies.get(scheme),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as client_response:
+            content = await client_response.read()
+
+            response = requests.Response()
+            response.status_code = client_response.status
+            response.reason = client_response.reason
+            response.headers = requests.structures.CaseInsensitiveDict(
+                client_response.headers
+            )
+            response.url = str(client_response.url)
+            response.encoding = requests.utils.get_encoding_from_headers(
+                response.headers
+            ) or "utf-8"
+            response._content = content
+            response.request = prepared
+
+        return response
+
+    async def _call_rate_limiter(self, function, *args):
+        """Call a rate-limiter method without blocking the event loop.
+
+        The shared backends (:class:`FileLockBackend` and
+        :class:`RedisBackend`) block on file locks and network round trips,
+        so their calls are run in the loop's default executor.
+        """
+        if isinstance(self._rate_limiter.backend, InProcessBackend):
+            return function(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, function, *args)
+
+    async def _acquire(self, rate_limiter, endpoint):
+        """Wait for a request slot from a client-side rate limiter."""
+        wait = await self._call_rate_limiter(rate_limiter.reserve, endpoint)
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = await self._call_rate_limiter(
+                rate_limiter.pause_remaining
+            )
+
+    async def request(self, method, url, erc, **kwargs):
+        """Abstract base method for making requests to the Webex Teams APIs.
+
+        This base method:
+            * Expands the API endpoint URL to an absolute URL
+            * Makes the actual HTTP request to the API endpoint
+            * Provides support for Webex Teams rate-limiting
+            * Inspects response codes and raises exceptions as appropriate
+
+        Args:
+            method(basestring): The request-method type ("GET", "POST", etc.).
+            url(basestring): The URL of the API endpoint to be called.
+            erc(int): The expected response code that should be returned by the
+                Webex Teams API endpoint to indicate success.
+            **kwargs:
+                headers, params, json, data: Used to prepare the request.
+                timeout: Overrides the session's single request timeout.
+
+        Returns:
+            requests.Response: The response returned by the API endpoint.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Webex Teams API endpoint.
+
+        """
+        # Ensure the url is an absolute URL
+        abs_url = self.abs_url(url)
+
+        timeout = kwargs.pop("timeout", self.single_request_timeout)
+        self._encode_json_body(kwargs)
+        prepared, kwargs = self._prepare_request(method, abs_url, **kwargs)
+        if kwargs:
+            raise TypeError("Unexpected **kwargs: {!r}".format(kwargs))
+
+        rate_limiter = self._rate_limiter
+        if rate_limiter is not None:
+            endpoint = self.endpoint_name(abs_url)
+
+        while True:
+            # Wait for a request slot from the client-side rate limiter
+            if rate_limiter is not None:
+                await self._acquire(rate_limiter, endpoint)
+
+            # Make the HTTP request to the API endpoint
+            response = await self._send(prepared, timeout=timeout)
+            try:
+                # Check the response code for error conditions
+                check_response_code(response, erc)
+            except RateLimitError as e:
+                # Hold every request made through the rate limiter
+                if rate_limiter is not None:
+                    await self._call_rate_limiter(rate_limiter.pause,
+                                                  e.retry_after)
+
+                # Catch rate-limit errors
+                # Wait and retry if automatic rate-limit handling is enabled
+                if self.wait_on_rate_limit:
+                    warnings.warn(RateLimitWarning(response))
+                    if rate_limiter is None:
+                        await asyncio.sleep(e.retry_after)
+                    continue
+                else:
+                    # Re-raise the RateLimitError
+                    raise
+            else:
+                return response
+
+    async def get(self, url, params=None, **kwargs):
+        """Sends a GET request.
+
+        Args:
+            url(basestring): The URL of the API endpoint.
+            params(dict): The parameters for the HTTP GET request.
+            **kwargs:
+                erc(int): The expected (success) response code for the request.
+                others: Passed on to :meth:`request`.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Webex Teams API endpoint.
+
+        """
+        check_type(url, basestring)
+        check_type(params, dict, optional=True)
+
+        # Expected response code
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
+
+        response = await self.request("GET", url, erc, params=params, **kwargs)
+        return self._parse_json(response)
+
+    async def get_pages(self, url, params=None, prefetch=None, raw=False,
+                        **kwargs):
+        """Return an async generator that GETs and yields pages of data.
+
+        Provides native support for RFC5988 Web Linking.
+
+        Args:
+            url(basestring): The URL of the API endpoint.
+            params(dict): The parameters for the HTTP GET request.
+            prefetch(int): The number of pages fetched ahead (by a background
+                task) while the current page is consumed.  Defaults to the
+                session's `prefetch` setting.
+            raw(bool): Leave the objects of the pages' arrays undecoded, as
+                :class:`RawJSON` (see :func:`split_json_page`).
+            **kwargs:
+                erc(int): The expected (success) response code for the request.
+                others: Passed on to :meth:`request`.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Webex Teams API endpoint.
+
+        """
+        check_type(url, basestring)
+        check_type(params, dict, optional=True)
+        check_type(prefetch, int, optional=True)
+        check_type(raw, bool)
+
+        if prefetch is None:
+            prefetch = self.prefetch
+
+        pages = self._get_pages(url, params, raw, **kwargs)
+        if prefetch <= 0:
+            try:
+                async for page in pages:
+                    yield page
+            finally:
+                await pages.aclose()
+            return
+
+        # Fetch pages with a background task, `prefetch` pages ahead
+        buffer = asyncio.Queue(maxsize=prefetch)
+
+        async def produce():
+            try:
+                async for page in pages:
+                    await buffer.put((True, page))
+                await buffer.put((False, None))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await buffer.put((False, e))
+            finally:
+                await pages.aclose()
+
+        task = asyncio.ensure_future(produce())
+        try:
+            while True:
+                has_page, page = await buffer.get()
+                if has_page:
+                    yield page
+                elif page is None:
+                    break
+                else:
+                    raise page
+        finally:
+            # Stop the background task, and wait for it to finish
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _get_pages(self, url, params=None, raw=False, **kwargs):
+        """GET and yield pages of data, following the RFC5988 `next` links."""
+        # Expected response code
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
+
+        # First request
+        response = await self.request("GET", url, erc, params=params,
+                                      **kwargs)
+
+        while True:
+            yield self._parse_page(response, raw)
+
+            if response.links.get("next"):
+                next_url = response.links.get("next").get("url")
+                next_url = _fix_next_url(next_url)
+
+                # Subsequent requests
+                response = await self.request("GET", next_url, erc, **kwargs)
+
+            else:
+                break
+
+    async def get_items(self, url, params=None, items_param="items",
+                        raw=None, **kwargs):
+        """Return an async generator that GETs and yields individual items.
+
+        Yields individual `items` from Webex Teams"s top-level {"items": [...]}
+        JSON objects. Provides native support for RFC5988 Web Linking.  The
+        generator will request additional pages as needed until all items have
+        been returned.
+
+        Args:
+            url(basestring): The URL of the API endpoint.
+            params(dict): The parameters for the HTTP GET request.
+            items_param(basestring): The key of the items list in the
+                returned JSON envelope.
+            raw(bool): Yield the raw JSON text (:class:`RawJSON`) of the
+                items, rather than dictionaries.  Defaults to the session's
+                `raw_items` setting.
+            **kwargs:
+                erc(int): The expected (success) response code for the request.
+                others: Passed on to :meth:`request`.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Webex Teams API endpoint.
+            MalformedResponse: If the returned response does not contain a
+                top-level dictionary with an "items" key.
+
+        """
+        if raw is None:
+            raw = self.raw_items
+
+        async for json_page in self.get_pages(url, params=params, raw=raw,
+                                              **kwargs):
+            assert isinstance(json_page, dict)
+
+            items = json_page.get(items_param)
+
+            if items is None:
+                error_message = "'items' key not found in JSON data: " \
+                                "{!r}".format(json_page)
+                raise MalformedResponse(error_message)
+
+            else:
+                for item in items:
+                    yield item
+
+    async def get_items_list(self, url, params=None, raw=None, **kwargs):
+        """Async twin of :meth:`RestSession.get_items_list`."""
+        if raw is None:
+            raw = self.raw_items
+
+        async for json_page in self.get_pages(url, params=params, raw=raw,
+                                              **kwargs):
+            assert isinstance(json_page, list)
+
+            for item in json_page:
+                yield item
+
+    async def post(self, url, json=None, data=None, **kwargs):
+        """Sends a POST request.
+
+        Args:
+            url(basestring): The URL of the API endpoint.
+            json: Data to be sent in JSON format in tbe body of the request.
+            data: Data to be sent in the body of the request.
+            **kwargs:
+                erc(int): The expected (success) response code for the request.
+                others: Passed on to :meth:`request`.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Webex Teams API endpoint.
+
+        """
+        check_type(url, basestring)
+
+        # Expected response code
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["POST"])
+
+        response = await self.request("POST", url, erc, json=json, data=data,
+                                      **kwargs)
+
+        return self._parse_json(response)
+
+    async def post_test(self, url, json=None, data=None, **kwargs):
+        """Async twin of :meth:`RestSession.post_test`."""
+        check_type(url, basestring)
+
+        # Expected response code
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["POST"])
+
+        response = await self.request("POST", url, erc, json=json, data=data,
+                                      **kwargs)
+        res_dic = self._parse_json(response)
+        for hit in res_dic["hits"]["hits"]:
+            yield hit
+
+    async def put(self, url, json=None, data=None, **kwargs):
+        """Sends a PUT request.
+
+        Args:
+            url(basestring): The URL of the API endpoint.
+            json: Data to be sent in JSON format in tbe body of the request.
+            data: Data to be sent in the body of the request.
+            **kwargs:
+                erc(int): The expected (success) response code for the request.
+                others: Passed on to :meth:`request`.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Webex Teams API endpoint.
+
+        """
+        check_type(url, basestring)
+
+        # Expected response code
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["PUT"])
+
+        response = await self.request("PUT", url, erc, json=json, data=data,
+                                      **kwargs)
+
+        if erc == 204:
+            return "204 Successful"
+        else:
+            return self._parse_json(response)
+
+    async def delete(self, url, **kwargs):
+        """Sends a DELETE request.
+
+        Args:
+            url(basestring): The URL of the API endpoint.
+            **kwargs:
+                erc(int): The expected (success) response code for the request.
+                others: Passed on to :meth:`request`.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Webex Teams API endpoint.
+
+        """
+        check_type(url, basestring)
+
+        # Expected response code
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["DELETE"])
+
+        await self.request("DELETE", url, erc, **kwargs)
@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+"""Entity cache for Webex Teams get-by-id requests.
+
+Classes:
+    CacheBackend: Base class for entity cache storage backends.
+    InMemoryCacheBackend: A size-bounded LRU cache within a process.
+    FileCacheBackend: A size-bounded cache shared through a directory.
+    EntityCache: Caches the responses of get-by-id requests.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+
+from past.builtins import basestring
+
+from .config import (
+    DEFAULT_CACHE_MAX_ENTRIES, DEFAULT_CACHE_NEGATIVE_TTL, DEFAULT_CACHE_TTL,
+)
+from .utils import check_type
+
+
+class CacheBackend(object):
+    """Base class for entity cache storage backends.
+
+    A backend stores JSON-serializable values by (string) key, each with an
+    expiry time; expired entries are never returned.
+
+    """
+
+    def get(self, key):
+        """Return the value stored for `key` (None if missing or expired)."""
+        raise NotImplementedError
+
+    def set(self, key, value, ttl):
+        """Store `value` for `key`, for `ttl` seconds."""
+        raise NotImplementedError
+
+    def delete(self, key):
+        """Remove the value stored for `key` (if any)."""
+        raise NotImplementedError
+
+    def clear(self):
+        """Remove all the stored values."""
+        raise NotImplementedError
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """A size-bounded, least-recently-used cache within a process."""
+
+    def __init__(self, max_entries=DEFAULT_CACHE_MAX_ENTRIES):
+        """Init a new InMemoryCacheBackend.
+
+        Args:
+            max_entries(int): The largest number of entries kept; the least
+                recently used entries are evicted first.
+
+        """
+        check_type(max_entries, int)
+
+        super(InMemoryCacheBackend, self).__init__()
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCacheBackend(CacheBackend):
+    """A size-bounded cache shared by the processes using a directory.
+
+    Each entry is kept in a JSON file, written atomically; reads refresh a
+    file's modification time, and the least recently used files are evicted
+    first.  Place the directory on a memory-backed filesystem (such
+    as /dev/shm) to share the cache through shared memory.
+
+    """
+
+    def __init__(self, directory, max_entries=DEFAULT_CACHE_MAX_ENTRIES):
+        """Init a new FileCacheBackend.
+
+        Args:
+            directory(basestring): The path of the cache directory.  The
+                directory is created if it doesn't exist.
+            max_entries(int): The largest number of entries kept.
+
+        """
+        check_type(directory, basestring)
+        check_type(max_entries, int)
+
+        super(FileCacheBackend, self).__init__()
+        self.directory = directory
+        self.max_entries = max_entries
+        self._writes = 0
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def _path(self, key):
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + ".entry")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as entry_file:
+                entry = json.load(entry_file)
+            stored_key, expires, value = \
+                entry["key"], entry["expires"], entry["value"]
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            return None
+        if stored_key != key:
+            return None
+        if expires <= time.time():
+            self.delete(key)
+            return None
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key, value, ttl):
+        path = self._path(key)
+        temporary_path = "{}.{}.{}.tmp".format(
+            path, os.getpid(), threading.current_thread().ident,
+        )
+        with open(temporary_path, "w", encoding="utf-8") as entry_file:
+            json.dump({"key": key, "expires": time.time() + ttl,
+                       "value": value}, entry_file)
+        os.replace(temporary_path, path)
+
+        # Evict the least recently used entries (checked every few writes)
+        self._writes += 1
+        if self._writes % 64 == 0 or self.max_entries < 64:
+            self._evict()
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".entry"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(".entry"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+
+class EntityCache(object):
+    """Caches the responses of get-by-id (GET) requests.
+
+    Used by :class:`RestSession` (see the `entity_cache` argument of
+    :class:`WebexTeamsAPI`): successful responses of get-by-id requests
+    (GET requests of `{resource}/{id}` URLs) are kept for the TTL of their
+    resource (the first path segment of the endpoint, such as "rooms" or
+    "people"), and 404 (Not Found) responses are kept for `negative_ttl`
+    seconds.  PUT, PATCH and DELETE requests made through the same session
+    invalidate the cached responses of the entity they address.
+
+    The cache is keyed by scope (a hash of the session's access token), host
+    and URL path, so that sessions using different access tokens never share
+    responses; the responses of a path's different query parameters are
+    cached (and invalidated) together.  The responses are stored as JSON
+    text.
+
+    """
+
+    def __init__(self, backend=None, ttl=DEFAULT_CACHE_TTL, ttls=None,
+                 negative_ttl=DEFAULT_CACHE_NEGATIVE_TTL):
+        """Init a new EntityCache.
+
+        Args:
+            backend(CacheBackend): The storage backend.  Defaults to a new
+                :class:`InMemoryCacheBackend`.
+            ttl(int, float): The default time (seconds) responses are kept.
+            ttls(dict): The times (seconds) responses are kept, by resource
+                (for example, ``{"people": 3600, "rooms": 60}``); 0 disables
+                caching for the resource.
+            negative_ttl(int, float): The time (seconds) 404 (Not Found)
+                responses are kept; 0 disables negative caching.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(backend, CacheBackend, optional=True)
+        check_type(ttl, (int, float))
+        check_type(ttls, dict, optional=True)
+        check_type(negative_ttl, (int, float))
+
+        super(EntityCache, self).__init__()
+        self.backend = backend if backend is not None \
+            else InMemoryCacheBackend()
+        self.ttl = ttl
+        self.ttls = dict(ttls) if ttls else {}
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "<{}(backend={!r}, hits={}, misses={})>".format(
+            self.__class__.__name__, self.backend, self.hits, self.misses,
+        )
+
+    @staticmethod
+    def _split(url, params, scope):
+        """Split a URL into its cache key and its variant (query)."""
+        parsed_url = urllib.parse.urlparse(url)
+        query = urllib.parse.parse_qsl(parsed_url.query,
+                                       keep_blank_values=True)
+        if params:
+            query.extend((str(key), str(value))
+                         for key, value in params.items())
+        key = "{}:{}{}".format(scope or "", parsed_url.netloc,
+                               parsed_url.path.rstrip("/"))
+        return key, urllib.parse.urlencode(sorted(query))
+
+    def ttl_for(self, resource):
+        """The time (seconds) the responses of a resource are kept."""
+        return self.ttls.get(resource, self.ttl)
+
+    def lookup(self, url, params=None, scope=None):
+        """Return the cached response of a GET request, or None.
+
+        Args:
+            url(basestring): The (absolute) URL of the request.
+            params(dict): The parameters of the request.
+            scope(basestring): The scope of the cached responses (a hash of
+                the access token of the request).
+
+        Returns:
+            tuple: A `(found, response)` tuple: `found` is True for the JSON
+            text of a successful response, and False for a dictionary
+            describing a 404 response (its `status_code`, `reason`,
+            `headers` and `content`).
+
+        """
+        key, variant = self._split(url, params, scope)
+        expires, cached = (self.backend.get(key) or {}).get(
+            variant, (0, None)
+        )
+        if expires <= time.time():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return cached
+
+    def _store(self, url, params, scope, cached, ttl):
+        """Cache a response for `ttl` seconds."""
+        if ttl <= 0:
+            return
+        now = time.time()
+        key, variant = self._split(url, params, scope)
+        entry = {
+            name: value for name, value
+            in (self.backend.get(key) or {}).items() if value[0] > now
+        }
+        entry[variant] = (now + ttl, cached)
+        self.backend.set(key, entry,
+                         max(expires for expires, _ in entry.values()) - now)
+
+    def store(self, url, params, resource, content, scope=None):
+        """Cache the JSON text of a successful GET response."""
+        self._store(url, params, scope, (True, content),
+                    self.ttl_for(resource))
+
+    def store_missing(self, url, params, resource, response, scope=None):
+        """Cache a 404 (Not Found) :class:`requests.Response`."""
+        if self.ttl_for(resource) <= 0:
+            return
+        missing = {
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: response.headers[name]
+                for name in ("Content-Type", "trackingId")
+                if name in response.headers
+            },
+            "content": response.text,
+        }
+        self._store(url, params, scope, (False, missing), self.negative_ttl)
+
+    def invalidate(self, url, scope=None):
+        """Discard the cached responses of a URL's path."""
+        key, _ = self._split(url, None, scope)
+        self.backend.delete(key)
+
+    def clear(self):
+        """Discard all the cached responses."""
+        self.backend.clear()
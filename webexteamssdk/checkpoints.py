@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""Resumable pagination checkpoints.
+
+Classes:
+    PaginationCheckpoint: The serializable cursor of a paginated crawl.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import json
+import os
+
+from past.builtins import basestring
+
+from .utils import check_type
+
+
+# The version of the checkpoint format
+CHECKPOINT_VERSION = 1
+
+
+class PaginationCheckpoint(object):
+    """The serializable cursor of a paginated crawl.
+
+    A checkpoint records the request being paginated, the URL of the page
+    being consumed (the `next` URL of the previous page), how many of that
+    page's items were consumed, and the number of pages and items consumed
+    so far.  Iterating a list method's results with the checkpoint (see
+    :meth:`GeneratorContainer.checkpointed`) updates it as the items are
+    consumed; iterating again with a saved checkpoint resumes the crawl
+    where it stopped, starting from the page being consumed.
+
+    An item is counted as consumed when the next item is requested, so a
+    resumed crawl starts with the item that was being processed when the
+    previous crawl stopped (at-least-once delivery).
+
+    """
+
+    def __init__(self):
+        """Init a new (not yet started) PaginationCheckpoint."""
+        super(PaginationCheckpoint, self).__init__()
+        self.request = None
+        self.url = None
+        self.params = None
+        self.page_offset = 0
+        self.pages = 0
+        self.items = 0
+        self.complete = False
+
+    @property
+    def started(self):
+        """Whether the crawl has started."""
+        return self.request is not None
+
+    def __repr__(self):
+        return "<{}(pages={}, items={}, complete={})>".format(
+            self.__class__.__name__, self.pages, self.items, self.complete,
+        )
+
+    def start(self, url, params):
+        """Start (or check that the checkpoint resumes) a request's crawl.
+
+        Args:
+            url(basestring): The URL of the paginated request.
+            params(dict): The parameters of the paginated request.
+
+        Raises:
+            ValueError: If the checkpoint was started by a different request.
+
+        """
+        request = {"url": url, "params": dict(params) if params else None}
+        if self.request is None:
+            self.request = request
+            self.url = url
+            self.params = request["params"]
+        elif self.request != request:
+            raise ValueError(
+                "The checkpoint was started by a different request: {!r}"
+                "".format(self.request)
+            )
+
+    def item_consumed(self):
+        """Count an item of the current page as consumed."""
+        self.page_offset += 1
+        self.items += 1
+
+    def page_consumed(self, next_url):
+        """Move the cursor to the next page (None for the last page)."""
+        self.url = next_url
+        self.params = None
+        self.page_offset = 0
+        self.pages += 1
+        self.complete = next_url is None
+
+    def to_dict(self):
+        """Return the checkpoint as a JSON-serializable dictionary."""
+        return {
+            "version": CHECKPOINT_VERSION,
+            "request": self.request,
+            "url": self.url,
+            "params": self.params,
+            "page_offset": self.page_offset,
+            "pages": self.pages,
+            "items": self.items,
+            "complete": self.complete,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a checkpoint from a dictionary created by :meth:`to_dict`.
+
+        Raises:
+            ValueError: If the checkpoint format is not supported.
+
+        """
+        check_type(data, dict)
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError("Unsupported checkpoint version: {!r}"
+                             "".format(data.get("version")))
+
+        checkpoint = cls()
+        checkpoint.request = data["request"]
+        checkpoint.url = data["url"]
+        checkpoint.params = data["params"]
+        checkpoint.page_offset = data["page_offset"]
+        checkpoint.pages = data["pages"]
+        checkpoint.items = data["items"]
+        checkpoint.complete = data["complete"]
+        return checkpoint
+
+    def to_json(self):
+        """Return the checkpoint as a JSON string."""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_data):
+        """Create a checkpoint from a JSON string (see :meth:`to_json`)."""
+        check_type(json_data, basestring)
+        return cls.from_dict(json.loads(json_data))
+
+    def save(self, path):
+        """Save the checkpoint to a (JSON) file, atomically.
+
+        Args:
+            path(basestring): The path of the checkpoint file.
+
+        """
+        check_type(path, basestring)
+
+        temporary_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(temporary_path, "w") as checkpoint_file:
+            checkpoint_file.write(self.to_json())
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Load a checkpoint saved by :meth:`save`.
+
+        Args:
+            path(basestring): The path of the checkpoint file.
+
+        Returns:
+            PaginationCheckpoint: The saved checkpoint, or a new checkpoint if
+                the file does not exist.
+
+        """
+        check_type(path, basestring)
+
+        try:
+            with open(path) as checkpoint_file:
+                json_data = checkpoint_file.read()
+        except (IOError, OSError):
+            if os.path.exists(path):
+                raise
+            return cls()
+        return cls.from_json(json_data)
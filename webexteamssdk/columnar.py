@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""Columnar (struct-of-arrays) batches of Webex Teams list results.
+
+Classes:
+    ColumnBatch: A batch of items, stored by column.
+
+Functions:
+    column_batches: Yield pages of items as ColumnBatches.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+native_str = str
+
+from builtins import *
+
+from array import array
+from collections import OrderedDict
+from itertools import compress
+
+from .utils import check_type
+
+try:
+    from sys import intern
+except ImportError:
+    # Python 2: intern() is a builtin
+    pass
+
+
+# The array type codes of the compact (numeric) columns
+INTEGER_TYPECODE = native_str("q")
+FLOAT_TYPECODE = native_str("d")
+BOOLEAN_TYPECODE = native_str("b")
+
+
+def _get_values(items, name):
+    """Extract a column's values; dotted names reach into nested objects."""
+    if "." not in name:
+        return [item.get(name) for item in items]
+
+    path = name.split(".")
+    values = []
+    for item in items:
+        for key in path:
+            item = item.get(key) if isinstance(item, dict) else None
+        values.append(item)
+    return values
+
+
+def _make_column(values):
+    """Store a column's values compactly.
+
+    Integer, float and boolean columns without missing values are stored as
+    arrays; the strings of string columns are interned; other columns are
+    lists.
+
+    """
+    types = set(map(type, values))
+    if types == {int}:
+        try:
+            return array(INTEGER_TYPECODE, values)
+        except OverflowError:
+            return values
+    elif types == {float} or types == {int, float}:
+        return array(FLOAT_TYPECODE, values)
+    elif types == {bool}:
+        return array(BOOLEAN_TYPECODE, values)
+    elif types and types <= {str, type(None)}:
+        return [intern(value) if value is not None else None
+                for value in values]
+    else:
+        return values
+
+
+class ColumnBatch(object):
+    """A batch of items, stored by column (struct of arrays).
+
+    Columns holding only integers, floats or booleans are stored as
+    :class:`array.array` objects (booleans as 0 and 1 bytes), which support
+    the buffer protocol (for example, ``numpy.frombuffer(batch["count"],
+    dtype="int64")``).  The strings of string columns are interned; other
+    columns (including columns with missing values, which are None) are
+    lists.
+
+    """
+
+    def __init__(self, columns):
+        """Init a new ColumnBatch.
+
+        Args:
+            columns(dict): The batch's columns (sequences of equal length),
+                by name.
+
+        Raises:
+            ValueError: If the columns are not of equal length.
+
+        """
+        check_type(columns, dict)
+
+        lengths = set(len(column) for column in columns.values())
+        if len(lengths) > 1:
+            raise ValueError("The columns of a ColumnBatch must be of equal "
+                             "length.")
+
+        super(ColumnBatch, self).__init__()
+        self._columns = OrderedDict(columns)
+        self._num_rows = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_items(cls, items, columns):
+        """Create a ColumnBatch from JSON items (dictionaries).
+
+        Args:
+            items(list): The JSON items.
+            columns(list): The names of the columns to extract; dotted names
+                reach into nested objects (for example, "data.actorId").
+                Missing values are None.
+
+        Returns:
+            ColumnBatch: The items' columns.
+
+        """
+        return cls(OrderedDict(
+            (name, _make_column(_get_values(items, name)))
+            for name in columns
+        ))
+
+    @property
+    def column_names(self):
+        """The names of the batch's columns."""
+        return list(self._columns)
+
+    @property
+    def num_rows(self):
+        """The number of rows (items) of the batch."""
+        return self._num_rows
+
+    def __len__(self):
+        return self._num_rows
+
+    def __getitem__(self, name):
+        """A column, by name."""
+        return self._columns[name]
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __repr__(self):
+        return "<{}({} rows; {})>".format(
+            self.__class__.__name__, self._num_rows,
+            ", ".join(self._columns),
+        )
+
+    def rows(self):
+        """Iterate over the batch's rows, as tuples."""
+        return zip(*self._columns.values())
+
+    def filter(self, mask):
+        """Select the rows for which `mask` is true.
+
+        Args:
+            mask(iterable): One value per row; the rows with a true value are
+                kept.
+
+        Returns:
+            ColumnBatch: A new batch with the selected rows.
+
+        """
+        mask = list(mask)
+        if len(mask) != self._num_rows:
+            raise ValueError("The mask must have one value per row.")
+
+        columns = OrderedDict()
+        for name, column in self._columns.items():
+            selected = compress(column, mask)
+            if isinstance(column, array):
+                columns[name] = array(column.typecode, selected)
+            else:
+                columns[name] = list(selected)
+        return self.__class__(columns)
+
+    def to_pydict(self):
+        """Convert the batch to a dictionary of lists, by column name."""
+        return OrderedDict(
+            (name, list(column)) for name, column in self._columns.items()
+        )
+
+    def to_arrow(self):
+        """Convert the batch to a :class:`pyarrow.RecordBatch`.
+
+        String columns are dictionary-encoded.  Requires the (optional)
+        `pyarrow` package.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("ColumnBatch.to_arrow() requires the pyarrow "
+                              "package; install it with `pip install "
+                              "pyarrow`.")
+
+        arrays = []
+        for column in self._columns.values():
+            if isinstance(column, array):
+                if column.typecode == BOOLEAN_TYPECODE:
+                    arrow_array = pyarrow.array(
+                        [bool(value) for value in column], pyarrow.bool_(),
+                    )
+                else:
+                    arrow_array = pyarrow.array(column)
+            else:
+                arrow_array = pyarrow.array(column)
+                if pyarrow.types.is_string(arrow_array.type):
+                    arrow_array = arrow_array.dictionary_encode()
+            arrays.append(arrow_array)
+
+        return pyarrow.RecordBatch.from_arrays(arrays,
+                                               names=self.column_names)
+
+
+def column_batches(item_pages, columns, arrow=False):
+    """Yield pages of items as ColumnBatches.
+
+    Args:
+        item_pages(iterable): The pages of items (lists of JSON items).
+        columns(list): The names of the columns to extract.
+        arrow(bool): Yield :class:`pyarrow.RecordBatch` objects, rather than
+            ColumnBatches.
+
+    """
+    check_type(columns, list)
+    check_type(arrow, bool)
+
+    for items in item_pages:
+        batch = ColumnBatch.from_items(items, columns)
+        yield batch.to_arrow() if arrow else batch
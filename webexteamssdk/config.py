@@ -31,6 +31,57 @@ DEFAULT_SINGLE_REQUEST_TIMEOUT = 600
 
 DEFAULT_WAIT_ON_RATE_LIMIT = True
 
+DEFAULT_POOL_CONNECTIONS = 10
+
+DEFAULT_POOL_MAXSIZE = 10
+
+DEFAULT_POOL_BLOCK = False
+
+DEFAULT_JSON_CODEC = "stdlib"
+
+DEFAULT_PREFETCH = 0
+
+DEFAULT_PARALLEL_CONCURRENCY = 4
+
+DEFAULT_SCAN_SHARDS = 8
+
+# The largest page sizes (`max` values) accepted by the API endpoints, used
+# as the ceilings of adaptive page-size tuning
+MAX_PAGE_SIZES = {
+    "adminAudit": 1000,
+    "events": 1000,
+    "memberships": 1000,
+    "messages": 100,
+    "people": 1000,
+    "rooms": 1000,
+    "team": 1000,
+    "teams": 1000,
+    "webhooks": 100,
+}
+
+DEFAULT_MAX_PAGE_SIZE = 1000
+
+DEFAULT_LOADER_WINDOW = 0.01
+
+DEFAULT_CACHE_MAX_ENTRIES = 10000
+
+DEFAULT_CACHE_TTL = 300
+
+DEFAULT_CACHE_NEGATIVE_TTL = 30
+
+DEFAULT_COALESCE_GETS = False
+
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+
+DEFAULT_RETRY_BASE_DELAY = 0.5
+
+DEFAULT_RETRY_MAX_DELAY = 30
+
+# The request methods safely retried (idempotent methods)
+RETRYABLE_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+RETRYABLE_STATUS_CODES = (502, 503, 504)
+
 ACCESS_TOKEN_ENVIRONMENT_VARIABLE = "WEBEX_TEAMS_ACCESS_TOKEN"
 
 LEGACY_ACCESS_TOKEN_ENVIRONMENT_VARIABLES = [
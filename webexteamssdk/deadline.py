@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Deadlines (overall time budgets) for Webex Teams API operations.
+
+Classes:
+    Deadline: The point in time by which an operation must complete.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import time
+
+from .exceptions import DeadlineExceededError
+from .utils import check_type
+
+
+class Deadline(object):
+    """The point in time by which an operation must complete.
+
+    A deadline is set `seconds` from its creation (on the monotonic clock).
+    The requests made under a deadline (see :meth:`RestSession.deadline`)
+    are sent only while time remains, with their timeouts capped at the
+    remaining time, and the waits between them (for rate limits and
+    retries) raise :class:`DeadlineExceededError` rather than outlast it.
+
+    """
+
+    def __init__(self, seconds):
+        """Init a new Deadline, `seconds` from now.
+
+        Args:
+            seconds(int, float): The time budget (seconds).
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `seconds` is negative.
+
+        """
+        check_type(seconds, (int, float))
+        if seconds < 0:
+            raise ValueError("seconds must be zero or positive.")
+
+        super(Deadline, self).__init__()
+        self.seconds = seconds
+        self.expires = time.monotonic() + seconds
+
+    def __repr__(self):
+        return "<{}(seconds={}, remaining={:.3f})>".format(
+            self.__class__.__name__, self.seconds, self.remaining(),
+        )
+
+    def remaining(self):
+        """The time (seconds) remaining until the deadline (0 once past)."""
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self):
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires
+
+    def check(self):
+        """Raise :class:`DeadlineExceededError` if the deadline has passed."""
+        if self.expired:
+            raise DeadlineExceededError(self)
+
+    def cap_timeout(self, timeout):
+        """Cap a requests `timeout` at the remaining time.
+
+        Args:
+            timeout: A requests timeout: None, a number of seconds, or a
+                (connect, read) tuple.
+
+        Returns:
+            The timeout, with each of its values capped at the remaining time.
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed.
+
+        """
+        self.check()
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if value is None else min(value, remaining)
+                         for value in timeout)
+        return min(timeout, remaining)
+
+    def sleep(self, seconds):
+        """Sleep, unless the deadline would pass before the sleep is over.
+
+        Raises:
+            DeadlineExceededError: If fewer than `seconds` seconds remain.
+
+        """
+        if seconds > self.remaining():
+            raise DeadlineExceededError(self)
+        time.sleep(seconds)
+
+    @staticmethod
+    def earliest(*deadlines):
+        """Return the earliest of the deadlines (ignoring None values)."""
+        deadlines = [deadline for deadline in deadlines
+                     if deadline is not None]
+        if not deadlines:
+            return None
+        return min(deadlines, key=lambda deadline: deadline.expires)
@@ -162,6 +162,31 @@ class RateLimitWarning(ApiWarning, RateLimitError):
     pass
 
 
+class RateLimiterBackendError(webexteamssdkException):
+    """Raised when a rate-limiter backend is unable to update its state."""
+    pass
+
+
 class MalformedResponse(webexteamssdkException):
     """Raised when a malformed response is received from Webex Teams."""
     pass
+
+
+class DeadlineExceededError(webexteamssdkException):
+    """Raised when an operation's deadline (time budget) is used up.
+
+    Raised instead of making a request, waiting (for a rate limit or before
+    a retry) or continuing to wait for a response, once the deadline set
+    with :meth:`RestSession.deadline` (or a request's `deadline` argument)
+    has passed, or would pass before the wait is over.
+    """
+
+    def __init__(self, deadline):
+        self.deadline = deadline
+        """The :class:`Deadline` that was exceeded."""
+
+        super(DeadlineExceededError, self).__init__(
+            "The deadline of {:g} seconds was exceeded.".format(
+                deadline.seconds
+            )
+        )
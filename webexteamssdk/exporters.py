@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+"""Streaming exporters for Webex Teams list results.
+
+Functions:
+    export_ndjson: Write pages of items as newline-delimited JSON.
+    export_csv: Write pages of items as CSV, with flattened nested fields.
+    export_arrow: Write pages of items as an Arrow IPC file.
+    export_parquet: Write pages of items as a Parquet file.
+
+The exporters write the items page by page: only the current page of items
+is held in memory.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import bz2
+import contextlib
+import csv
+import gzip
+import io
+import json
+import lzma
+from collections import OrderedDict
+
+from past.builtins import basestring
+
+from .json_codec import get_json_codec, JSONCodec
+from .utils import check_type
+
+
+# The file openers of the supported compression formats, by name
+COMPRESSION_OPENERS = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+# The compression formats inferred from file name extensions
+COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+}
+
+
+def _compression(destination, compression):
+    """The compression format of a destination ("infer" from its name)."""
+    if compression == "infer":
+        compression = None
+        if isinstance(destination, basestring):
+            for extension, name in COMPRESSION_EXTENSIONS.items():
+                if destination.endswith(extension):
+                    compression = name
+    if compression is not None and compression not in COMPRESSION_OPENERS:
+        raise ValueError("Unknown compression: {!r}; expected one of: {}"
+                         "".format(compression,
+                                   ", ".join(COMPRESSION_OPENERS)))
+    return compression
+
+
+@contextlib.contextmanager
+def _open_binary(destination, compression):
+    """Open a destination (file path or binary file object) for writing."""
+    compression = _compression(destination, compression)
+    if isinstance(destination, basestring):
+        opener = COMPRESSION_OPENERS.get(compression, io.open)
+        with opener(destination, "wb") as file_object:
+            yield file_object
+    elif compression is not None:
+        opener = COMPRESSION_OPENERS[compression]
+        with opener(destination, "wb") as file_object:
+            yield file_object
+    else:
+        yield destination
+
+
+@contextlib.contextmanager
+def _open_text(destination, compression):
+    """Open a destination (file path or text file object) for writing."""
+    if isinstance(destination, basestring) \
+            or _compression(destination, compression) is not None:
+        with _open_binary(destination, compression) as binary_file:
+            text_file = io.TextIOWrapper(binary_file, encoding="utf-8",
+                                         newline="")
+            try:
+                yield text_file
+            finally:
+                text_file.flush()
+                text_file.detach()
+    else:
+        yield destination
+
+
+def _import_pyarrow(feature):
+    """Import the (optional) pyarrow package."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("{} requires the pyarrow package; install it with "
+                          "`pip install pyarrow`.".format(feature))
+    return pyarrow
+
+
+def flatten_item(item, separator="."):
+    """Flatten a JSON item's nested objects into `separator`-joined keys.
+
+    Nested objects are flattened (``{"data": {"actorId": ...}}`` becomes
+    ``{"data.actorId": ...}``); lists are encoded as JSON strings.
+
+    Args:
+        item(dict): The JSON item.
+        separator(basestring): The separator of the flattened keys.
+
+    Returns:
+        OrderedDict: The flattened item.
+
+    """
+    flattened = OrderedDict()
+
+    def flatten(value, prefix):
+        for key, nested_value in value.items():
+            name = prefix + key
+            if isinstance(nested_value, dict):
+                flatten(nested_value, name + separator)
+            elif isinstance(nested_value, list):
+                flattened[name] = json.dumps(nested_value,
+                                             separators=(",", ":"),
+                                             ensure_ascii=False)
+            else:
+                flattened[name] = nested_value
+
+    flatten(item, "")
+    return flattened
+
+
+def export_ndjson(item_pages, destination, compression="infer", codec=None):
+    """Write pages of items as newline-delimited JSON (one item per line).
+
+    Raw items (:class:`RawJSON`) are written as they were received, unless
+    they span several lines.
+
+    Args:
+        item_pages(iterable): The pages of items (lists of JSON items).
+        destination(basestring, file): A file path, or a binary file object.
+        compression(basestring): "gzip", "bz2", "xz", None, or "infer" (from
+            the file path's extension).
+        codec(JSONCodec, basestring): The JSON codec used to encode decoded
+            items.  Defaults to the standard library codec.
+
+    Returns:
+        int: The number of items written.
+
+    Raises:
+        ValueError: If the compression format is unknown.
+
+    """
+    check_type(compression, basestring, optional=True)
+    check_type(codec, (basestring, JSONCodec), optional=True)
+
+    codec = get_json_codec(codec or "stdlib")
+    count = 0
+    with _open_binary(destination, compression) as file_object:
+        for items in item_pages:
+            lines = []
+            for item in items:
+                if isinstance(item, bytes):
+                    if b"\n" in item or b"\r" in item:
+                        item = codec.dumps(codec.loads(item))
+                else:
+                    item = codec.dumps(item)
+                lines.append(item)
+            if lines:
+                lines.append(b"")
+                file_object.write(b"\n".join(lines))
+            count += len(items)
+    return count
+
+
+def export_csv(item_pages, destination, columns=None, compression="infer",
+               separator="."):
+    """Write pages of items as CSV, with flattened nested fields.
+
+    Nested objects are flattened into `separator`-joined column names (for
+    example, "data.actorId"); lists are written as JSON strings; missing
+    values are written as empty fields.
+
+    Args:
+        item_pages(iterable): The pages of items (lists of JSON items).
+        destination(basestring, file): A file path, or a text file object
+            (opened with ``newline=""``).
+        columns(list): The (flattened) names of the columns to write.
+            Defaults to the fields of the first page's items; fields first
+            seen in later pages are not written.
+        compression(basestring): "gzip", "bz2", "xz", None, or "infer" (from
+            the file path's extension).
+        separator(basestring): The separator of the flattened column names.
+
+    Returns:
+        int: The number of items (rows) written.
+
+    Raises:
+        ValueError: If the compression format is unknown.
+
+    """
+    check_type(columns, list, optional=True)
+    check_type(compression, basestring, optional=True)
+    check_type(separator, basestring)
+
+    count = 0
+    with _open_text(destination, compression) as file_object:
+        writer = None
+        for items in item_pages:
+            rows = [flatten_item(item, separator) for item in items]
+            if writer is None:
+                if columns is None:
+                    if not rows:
+                        continue
+                    columns = list(OrderedDict(
+                        (name, None) for row in rows for name in row
+                    ))
+                writer = csv.DictWriter(file_object, columns,
+                                        extrasaction="ignore")
+                writer.writeheader()
+            writer.writerows(rows)
+            count += len(rows)
+
+        if writer is None and columns:
+            csv.DictWriter(file_object, columns).writeheader()
+    return count
+
+
+def _arrow_tables(pyarrow, item_pages, schema):
+    """Yield the pages of items as Arrow tables (sharing one schema)."""
+    for items in item_pages:
+        if not items:
+            continue
+        table = pyarrow.Table.from_pylist(items, schema=schema)
+        schema = table.schema
+        yield table
+
+
+def export_arrow(item_pages, destination, schema=None):
+    """Write pages of items as an Arrow IPC file, one record batch per page.
+
+    Requires the (optional) `pyarrow` package.
+
+    Args:
+        item_pages(iterable): The pages of items (lists of JSON items).
+        destination(basestring, file): A file path, or a binary file object.
+        schema(pyarrow.Schema): The schema of the items.  Defaults to the
+            schema inferred from the first page; fields first seen in later
+            pages are not written.
+
+    Returns:
+        int: The number of items written.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    """
+    pyarrow = _import_pyarrow("Arrow export")
+
+    count = 0
+    writer = None
+    try:
+        for table in _arrow_tables(pyarrow, item_pages, schema):
+            if writer is None:
+                writer = pyarrow.ipc.new_file(destination, table.schema)
+            writer.write_table(table)
+            count += table.num_rows
+        if writer is None:
+            writer = pyarrow.ipc.new_file(destination,
+                                          schema or pyarrow.schema([]))
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def export_parquet(item_pages, destination, schema=None, compression=None):
+    """Write pages of items as a Parquet file, one row group per page.
+
+    Requires the (optional) `pyarrow` package.
+
+    Args:
+        item_pages(iterable): The pages of items (lists of JSON items).
+        destination(basestring, file): A file path, or a binary file object.
+        schema(pyarrow.Schema): The schema of the items.  Defaults to the
+            schema inferred from the first page; fields first seen in later
+            pages are not written.
+        compression(basestring): The Parquet compression codec ("snappy",
+            "gzip", "zstd", etc.).  Defaults to the pyarrow default.
+
+    Returns:
+        int: The number of items written.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    """
+    check_type(compression, basestring, optional=True)
+    pyarrow = _import_pyarrow("Parquet export")
+    import pyarrow.parquet
+
+    options = {}
+    if compression is not None:
+        options["compression"] = compression
+
+    count = 0
+    writer = None
+    try:
+        for table in _arrow_tables(pyarrow, item_pages, schema):
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(
+                    destination, table.schema, **options
+                )
+            writer.write_table(table, row_group_size=max(table.num_rows, 1))
+            count += table.num_rows
+        if writer is None:
+            writer = pyarrow.parquet.ParquetWriter(
+                destination, schema or pyarrow.schema([]), **options
+            )
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
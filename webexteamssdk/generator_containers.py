@@ -3,6 +3,9 @@
 
 Classes:
     GeneratorContainer: Makes generator functions sage for reuse.
+    CachedGeneratorContainer: Materializes the results of a
+        GeneratorContainer, with a TTL.
+    AsyncGeneratorContainer: Makes async generator functions safe for reuse.
 
 Functions:
     generator_container: Function decorator for wrapping a generator function
@@ -41,7 +44,23 @@ from builtins import *
 import functools
 import inspect
 from itertools import islice
+import os
+import pickle
 import sys
+import threading
+import time
+
+from past.builtins import basestring
+
+from .checkpoints import PaginationCheckpoint
+from .columnar import column_batches
+from .config import DEFAULT_PARALLEL_CONCURRENCY, DEFAULT_SCAN_SHARDS
+from .exceptions import MalformedResponse
+from .exporters import (
+    export_arrow, export_csv, export_ndjson, export_parquet,
+)
+from .sharding import ShardedScan
+from .utils import check_type
 
 
 class GeneratorContainer(object):
@@ -136,6 +155,701 @@ class GeneratorContainer(object):
             raise IndexError("GeneratorContainers support slicing only. "
                              "Indexing is not supported.")
 
+    def parallel(self, concurrency=DEFAULT_PARALLEL_CONCURRENCY, ordered=True,
+                 offset_param=None, page_size=None, page_size_param="max",
+                 page_numbers=False):
+        """Iterate with the pages fetched concurrently, by offset.
+
+        For list methods of endpoints paged by a numeric offset (for example,
+        `TelephonyAPI.list_aa()` and `AdminAuditEventsAPI.list()`), the page
+        offsets are computed up front and up to `concurrency` pages are
+        fetched at once; see :meth:`RestSession.get_pages_parallel`.  Do not
+        use this with endpoints paged only by RFC5988 Link headers.
+
+        Args:
+            concurrency(int): The maximum number of pages fetched at once.
+            ordered(bool): Yield the items in offset order.  When False, the
+                items of each page are yielded as soon as the page is
+                received.
+            offset_param(basestring): The name of the offset parameter.
+                Defaults to "offset" when the request has an "offset"
+                parameter, and to "start" otherwise.
+            page_size(int): The number of items requested per page.  Defaults
+                to the `max` parameter of the request.
+            page_size_param(basestring): The name of the page size parameter.
+            page_numbers(bool): The offset parameter numbers pages, rather
+                than items.
+
+        Returns:
+            generator: A generator yielding the list method's items.
+
+        Raises:
+            TypeError: If the container does not wrap an API list method.
+
+        """
+        session = getattr(self.arguments.get("self"), "_session", None)
+        if not hasattr(session, "parallel_pagination"):
+            raise TypeError("Parallel pagination is supported for the list "
+                            "methods of the Webex Teams API wrappers only.")
+
+        return self._within(session.parallel_pagination, dict(
+            concurrency=concurrency,
+            ordered=ordered,
+            offset_param=offset_param,
+            page_size=page_size,
+            page_size_param=page_size_param,
+            page_numbers=page_numbers,
+        ))
+
+    def adaptive(self, ceiling=None, growth=2.0, tolerance=0.1,
+                 max_backoffs=3):
+        """Iterate with the page size tuned to the observed latency.
+
+        The crawl starts at the request's page size (its `max` parameter)
+        and raises it while the time per item improves, up to the endpoint's
+        largest page size; it backs off on timeouts and 5xx responses.  See
+        :class:`AdaptivePageSize`.
+
+        Args:
+            ceiling(int): The largest page size requested.  Defaults to the
+                endpoint's largest page size.
+            growth(int, float): The factor the page size is raised by.
+            tolerance(float): The relative improvement of the time per item
+                required to keep raising the page size.
+            max_backoffs(int): The number of times a crawl backs off (and
+                retries a page) before the error is raised.
+
+        Returns:
+            generator: A generator yielding the list method's items.
+
+        Raises:
+            TypeError: If the container does not wrap an API list method.
+
+        """
+        session = getattr(self.arguments.get("self"), "_session", None)
+        if not hasattr(session, "adaptive_pagination"):
+            raise TypeError("Adaptive pagination is supported for the list "
+                            "methods of the Webex Teams API wrappers only.")
+
+        return self._within(session.adaptive_pagination, dict(
+            ceiling=ceiling,
+            growth=growth,
+            tolerance=tolerance,
+            max_backoffs=max_backoffs,
+        ))
+
+    def _within(self, context_manager, options):
+        """Yield from a new generator, advanced within a session context."""
+        generator = self.new_generator()
+        try:
+            while True:
+                with context_manager(**options):
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        return
+                yield item
+        finally:
+            generator.close()
+
+    def sharded(self, shards=DEFAULT_SCAN_SHARDS, concurrency=None,
+                ordered=True, newest_first=True, split=True):
+        """Scan the `_from` / `to` time range as concurrent shards.
+
+        For time-bounded list methods (`EventsAPI.list()` and
+        `AdminAuditEventsAPI.list()`), the time range is split into `shards`
+        sub-ranges that are paginated concurrently, and busy shards are split
+        again while workers are idle; see :class:`ShardedScan`.
+
+        Args:
+            shards(int): The number of shards the time range is split into.
+            concurrency(int): The number of shards paginated at once.
+                Defaults to `shards`.
+            ordered(bool): Yield the items in time order.  When False, items
+                are yielded as soon as they are received, which is faster.
+            newest_first(bool): The time order of the ordered output.
+            split(bool): Split the unscanned part of busy shards when workers
+                are idle.
+
+        Returns:
+            ShardedScan: An iterable yielding the list method's items.
+
+        Raises:
+            TypeError: If the container does not wrap a time-bounded list
+                method.
+            ValueError: If the container's `_from` argument is not set.
+
+        """
+        return ShardedScan(self, shards, concurrency=concurrency,
+                           ordered=ordered, newest_first=newest_first,
+                           split=split)
+
+    def batches(self, columns, arrow=False):
+        """Iterate over the pages of results as columnar batches.
+
+        Each page of the list method's results is yielded as a
+        :class:`ColumnBatch` holding the requested columns (struct of
+        arrays), without creating a data object per item.
+
+        Args:
+            columns(list): The names of the columns to extract; dotted names
+                reach into nested objects (for example, "data.actorId").
+            arrow(bool): Yield :class:`pyarrow.RecordBatch` objects, rather
+                than ColumnBatches (requires the optional `pyarrow` package).
+
+        Returns:
+            generator: A generator yielding a batch per page.
+
+        Raises:
+            TypeError: If the container does not wrap an API list method.
+
+        """
+        check_type(columns, list)
+        check_type(arrow, bool)
+
+        item_pages = self._item_pages("Columnar batches")
+        return column_batches(item_pages, columns, arrow=arrow)
+
+    def to_ndjson(self, destination, compression="infer", codec=None):
+        """Export the results as newline-delimited JSON, page by page.
+
+        The items are written as they were received (without being decoded
+        and re-encoded), so only the current page is held in memory.
+
+        Args:
+            destination(basestring, file): A file path, or a binary file
+                object.
+            compression(basestring): "gzip", "bz2", "xz", None, or "infer"
+                (from the file path's extension).
+            codec(JSONCodec, basestring): The JSON codec used to re-encode
+                items spanning several lines.
+
+        Returns:
+            int: The number of items written.
+
+        Raises:
+            TypeError: If the container does not wrap an API list method.
+            ValueError: If the compression format is unknown.
+
+        """
+        item_pages = self._item_pages("Exports", raw=True)
+        return export_ndjson(item_pages, destination,
+                             compression=compression, codec=codec)
+
+    def to_csv(self, destination, columns=None, compression="infer",
+               separator="."):
+        """Export the results as CSV, page by page.
+
+        Nested objects are flattened into `separator`-joined column names
+        (for example, "data.actorId"); see :func:`export_csv`.
+
+        Args:
+            destination(basestring, file): A file path, or a text file object
+                (opened with ``newline=""``).
+            columns(list): The (flattened) names of the columns to write.
+                Defaults to the fields of the first page's items.
+            compression(basestring): "gzip", "bz2", "xz", None, or "infer"
+                (from the file path's extension).
+            separator(basestring): The separator of the flattened column
+                names.
+
+        Returns:
+            int: The number of items (rows) written.
+
+        Raises:
+            TypeError: If the container does not wrap an API list method.
+            ValueError: If the compression format is unknown.
+
+        """
+        item_pages = self._item_pages("Exports")
+        return export_csv(item_pages, destination, columns=columns,
+                          compression=compression, separator=separator)
+
+    def to_arrow(self, destination, schema=None):
+        """Export the results as an Arrow IPC file, one batch per page.
+
+        Requires the (optional) `pyarrow` package.
+
+        Args:
+            destination(basestring, file): A file path, or a binary file
+                object.
+            schema(pyarrow.Schema): The schema of the items.  Defaults to the
+                schema inferred from the first page.
+
+        Returns:
+            int: The number of items written.
+
+        Raises:
+            TypeError: If the container does not wrap an API list method.
+            ImportError: If pyarrow is not installed.
+
+        """
+        item_pages = self._item_pages("Exports")
+        return export_arrow(item_pages, destination, schema=schema)
+
+    def to_parquet(self, destination, schema=None, compression=None):
+        """Export the results as a Parquet file, one row group per page.
+
+        The row groups follow the request's page size (its `max` parameter).
+        Requires the (optional) `pyarrow` package.
+
+        Args:
+            destination(basestring, file): A file path, or a binary file
+                object.
+            schema(pyarrow.Schema): The schema of the items.  Defaults to the
+                schema inferred from the first page.
+            compression(basestring): The Parquet compression codec.
+
+        Returns:
+            int: The number of items written.
+
+        Raises:
+            TypeError: If the container does not wrap an API list method.
+            ImportError: If pyarrow is not installed.
+
+        """
+        item_pages = self._item_pages("Exports")
+        return export_parquet(item_pages, destination, schema=schema,
+                              compression=compression)
+
+    def cached(self, ttl=None, path=None):
+        """Return a container that materializes the results on first use.
+
+        The first iteration crawls the results (as usual) and keeps the
+        items; later iterations are served from memory until `ttl` seconds
+        after the crawl completed.  Iterations started while a crawl is in
+        progress share the in-flight crawl, rather than starting their own.
+        See :class:`CachedGeneratorContainer`.
+
+        Args:
+            ttl(int, float): The time (seconds) the results are kept.
+                Defaults to keeping the results until invalidated.
+            path(basestring): Also keep the results in a (pickle) file, so
+                that they are reused across processes until the `ttl` runs
+                out.
+
+        Returns:
+            CachedGeneratorContainer: The caching container.
+
+        """
+        return CachedGeneratorContainer(self, ttl=ttl, path=path)
+
+    def checkpointed(self, checkpoint=None, path=None, every=1):
+        """Iterate from (and into) a resumable pagination checkpoint.
+
+        The list method's crawl starts at the checkpoint's cursor (from the
+        beginning for a new checkpoint), and the checkpoint is updated as the
+        items are consumed; see :class:`PaginationCheckpoint`.  With a `path`,
+        the checkpoint is loaded from the file (if it exists) and saved to it
+        every `every` pages, at the end of the crawl, and when the iteration
+        stops early.
+
+        Args:
+            checkpoint(PaginationCheckpoint): The checkpoint.  Defaults to the
+                checkpoint saved at `path`, or a new checkpoint.
+            path(basestring): The path of the checkpoint file.
+            every(int): Save the checkpoint every `every` pages.
+
+        Returns:
+            generator: A generator yielding the list method's items.
+
+        Raises:
+            TypeError: If the container does not wrap an API list method.
+            ValueError: If the checkpoint was started by a different request.
+
+        """
+        check_type(checkpoint, PaginationCheckpoint, optional=True)
+        check_type(path, basestring, optional=True)
+        check_type(every, int)
+        if every < 1:
+            raise ValueError("every must be a positive integer")
+
+        session = getattr(self.arguments.get("self"), "_session", None)
+        if not hasattr(session, "checkpointing"):
+            raise TypeError("Checkpoints are supported for the list methods "
+                            "of the Webex Teams API wrappers only.")
+
+        if checkpoint is None:
+            checkpoint = PaginationCheckpoint.load(path) if path \
+                else PaginationCheckpoint()
+
+        return self._checkpointed(session, checkpoint, path, every)
+
+    def _checkpointed(self, session, checkpoint, path, every):
+        """Yield from a new generator, with checkpointing enabled."""
+        saved = (checkpoint.pages, checkpoint.items)
+        generator = self.new_generator()
+        try:
+            while True:
+                with session.checkpointing(checkpoint):
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        return
+                if path and checkpoint.pages - saved[0] >= every:
+                    checkpoint.save(path)
+                    saved = (checkpoint.pages, checkpoint.items)
+                yield item
+        finally:
+            generator.close()
+            if path and (checkpoint.pages, checkpoint.items) != saved:
+                checkpoint.save(path)
+
+    def pages(self):
+        """Iterate over the results page by page.
+
+        Each page of the list method's results is yielded as a list of the
+        items (data objects) the list method yields.  Like the container,
+        the returned container is lazy and reusable: each iteration requests
+        the pages again.
+
+        Returns:
+            GeneratorContainer: A container yielding a list per page.
+
+        Raises:
+            TypeError: If the container does not wrap an API list method.
+
+        """
+        self._list_session("Pages")
+        return GeneratorContainer(_container_pages, self)
+
+    def chunks(self, size):
+        """Iterate over the results in fixed-size lists.
+
+        The pages of results are re-batched into lists of `size` items (the
+        last list may be shorter), for example to bulk-insert the items or to
+        look up 85 people IDs at a time.  Like the container, the returned
+        container is lazy and reusable.
+
+        Args:
+            size(int): The number of items per list.
+
+        Returns:
+            GeneratorContainer: A container yielding lists of `size` items.
+
+        Raises:
+            TypeError: If the container does not wrap an API list method.
+            ValueError: If `size` is not a positive integer.
+
+        """
+        check_type(size, int)
+        if size < 1:
+            raise ValueError("size must be a positive integer")
+
+        self._list_session("Chunks")
+        return GeneratorContainer(_container_chunks, self, size)
+
+    def _list_session(self, feature):
+        """Return the RestSession of the wrapped API list method.
+
+        Raises:
+            TypeError: If the container does not wrap an API list method.
+
+        """
+        session = getattr(self.arguments.get("self"), "_session", None)
+        if not hasattr(session, "recording_item_requests"):
+            raise TypeError("{} are supported for the list methods of the "
+                            "Webex Teams API wrappers only.".format(feature))
+        return session
+
+    def _item_pages(self, feature, raw=False):
+        """Return a generator yielding the pages of items of the list method.
+
+        The item request made by the list method is recorded (see
+        :meth:`RestSession.recording_item_requests`) and paginated directly,
+        so that the items are not passed to the object factory.
+
+        Args:
+            feature(basestring): The name of the calling feature (for error
+                messages).
+            raw(bool): Leave the items undecoded; see
+                :meth:`RestSession.get_pages`.  None requests the items as the
+                list method does.
+
+        Raises:
+            TypeError: If the container does not wrap an API list method
+                making a single item request.
+
+        """
+        session = self._list_session(feature)
+
+        # Record the item request made by the list method
+        with session.recording_item_requests() as recorded:
+            for _ in self.new_generator():
+                pass
+        if len(recorded) != 1:
+            raise TypeError("{} are supported for list methods making a "
+                            "single item request only.".format(feature))
+
+        url, params, items_param, kwargs = recorded[0]
+        recorded_raw = kwargs.pop("raw", False)
+        if raw is None:
+            raw = recorded_raw
+        pages = session.get_pages(url, params=params, raw=raw, **kwargs)
+        return _page_items(pages, items_param)
+
+
+def _container_pages(container):
+    """Yield the list method's items (data objects), a list per page."""
+    session = container._list_session("Pages")
+    item_pages = container._item_pages("Pages", raw=None)
+    try:
+        for items in item_pages:
+            # Convert the page's items, as the list method does
+            with session.feeding_items(items):
+                page = list(container.new_generator())
+            yield page
+    finally:
+        item_pages.close()
+
+
+def _container_chunks(container, size):
+    """Yield the list method's items (data objects) in lists of `size`."""
+    pages = _container_pages(container)
+    try:
+        chunk = []
+        for page in pages:
+            if not chunk and len(page) == size:
+                yield page
+                continue
+
+            chunk.extend(page)
+            while len(chunk) >= size:
+                yield chunk[:size]
+                chunk = chunk[size:]
+        if chunk:
+            yield chunk
+    finally:
+        pages.close()
+
+
+def _page_items(pages, items_param):
+    """Yield the items (list) of each page."""
+    try:
+        for page in pages:
+            items = page if items_param is None else page.get(items_param)
+            if not isinstance(items, list):
+                raise MalformedResponse(
+                    "'{}' key not found in JSON data: {!r}"
+                    "".format(items_param, page)
+                )
+            yield items
+    finally:
+        pages.close()
+
+
+class _Crawl(object):
+    """The items of a (possibly in-flight) crawl, shared by its iterators."""
+
+    def __init__(self, generator=None, items=None, completed=None):
+        super(_Crawl, self).__init__()
+        self.generator = generator
+        self.items = items if items is not None else []
+        self.completed = completed
+        self.error = None
+        self.lock = threading.Lock()
+
+
+class CachedGeneratorContainer(object):
+    """Materialize the results of a GeneratorContainer, with a TTL.
+
+    The first iteration runs the wrapped container's generator, keeping the
+    items it yields; iterations started before that crawl completes share it
+    (each item is requested once, by whichever iterator gets to it first).
+    Once complete, the items are served from memory (and optionally from a
+    file) until `ttl` seconds have passed, after which the next iteration
+    starts a new crawl.  A failed crawl is discarded: its error is raised by
+    the iterations sharing it, and the next iteration starts a new crawl.
+
+    """
+
+    def __init__(self, container, ttl=None, path=None):
+        """Init a new CachedGeneratorContainer.
+
+        Args:
+            container(GeneratorContainer): The container whose results are
+                cached.
+            ttl(int, float): The time (seconds) the results are kept after
+                the crawl completes.  Defaults to keeping the results until
+                :meth:`invalidate` is called.
+            path(basestring): The path of a file the results are also kept
+                in (pickled), for reuse across processes.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `ttl` is negative.
+
+        """
+        check_type(container, GeneratorContainer)
+        check_type(ttl, (int, float), optional=True)
+        check_type(path, basestring, optional=True)
+        if ttl is not None and ttl < 0:
+            raise ValueError("ttl must be zero or positive.")
+
+        super(CachedGeneratorContainer, self).__init__()
+        self.container = container
+        self.ttl = ttl
+        self.path = path
+        self._lock = threading.Lock()
+        self._crawl = None
+
+    def __repr__(self):
+        """A string representation of this object."""
+        return '<CachedGeneratorContainer {!r} (ttl={!r})>'.format(
+            self.container, self.ttl,
+        )
+
+    def _is_fresh(self, completed):
+        """Whether results completed at `completed` are still valid."""
+        return self.ttl is None or time.time() - completed < self.ttl
+
+    def _load(self):
+        """Load a fresh crawl from the cache file, if there is one."""
+        try:
+            with open(self.path, "rb") as cache_file:
+                completed, items = pickle.load(cache_file)
+        except (IOError, OSError, EOFError, ValueError, pickle.PickleError):
+            return None
+        if not self._is_fresh(completed):
+            return None
+        return _Crawl(items=items, completed=completed)
+
+    def _save(self, crawl):
+        """Save a completed crawl to the cache file (atomically)."""
+        temporary_path = "{}.{}.tmp".format(self.path, os.getpid())
+        with open(temporary_path, "wb") as cache_file:
+            pickle.dump((crawl.completed, crawl.items), cache_file,
+                        pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, self.path)
+
+    def _current_crawl(self):
+        """Return the fresh or in-flight crawl, or start a new one."""
+        with self._lock:
+            crawl = self._crawl
+            if crawl is not None and crawl.error is None \
+                    and (crawl.completed is None
+                         or self._is_fresh(crawl.completed)):
+                return crawl
+
+            crawl = self._load() if self.path else None
+            if crawl is None:
+                crawl = _Crawl(generator=self.container.new_generator())
+            self._crawl = crawl
+            return crawl
+
+    def _next_item(self, crawl, index):
+        """Return the item at `index`, advancing the crawl if needed.
+
+        Raises:
+            StopIteration: If the crawl completed before `index`.
+
+        """
+        with crawl.lock:
+            if crawl.error is not None:
+                raise crawl.error
+            if index < len(crawl.items):
+                return crawl.items[index]
+            if crawl.completed is not None:
+                raise StopIteration
+
+            try:
+                item = next(crawl.generator)
+            except StopIteration:
+                crawl.completed = time.time()
+                crawl.generator = None
+                if self.path:
+                    self._save(crawl)
+                raise
+            except Exception as error:
+                crawl.error = error
+                crawl.generator = None
+                raise
+
+            crawl.items.append(item)
+            return item
+
+    def __iter__(self):
+        """Iterate over the cached (or shared in-flight) results."""
+        crawl = self._current_crawl()
+        if crawl.completed is not None:
+            return iter(crawl.items)
+        return self._iterate(crawl)
+
+    def _iterate(self, crawl):
+        """Yield the items of an in-flight crawl."""
+        index = 0
+        while True:
+            try:
+                item = self._next_item(crawl, index)
+            except StopIteration:
+                return
+            yield item
+            index += 1
+
+    def invalidate(self):
+        """Discard the cached results (in memory and in the cache file).
+
+        Iterations sharing an in-flight crawl are not interrupted.
+
+        """
+        with self._lock:
+            self._crawl = None
+            if self.path:
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+
+
+class AsyncGeneratorContainer(object):
+    """Store an async generator function call, making it safe for reuse.
+
+    The asyncio counterpart of :class:`GeneratorContainer`.  Return a fresh
+    async generator every time __aiter__() is called on the container object.
+
+    """
+
+    def __init__(self, async_generator_function, *args, **kwargs):
+        """Init a new AsyncGeneratorContainer.
+
+        Args:
+            async_generator_function(func): The async generator function.
+            *args: The arguments passed to the async generator function.
+            **kwargs: The keyword arguments passed to the async generator
+                function.
+
+        """
+        if not inspect.isasyncgenfunction(async_generator_function):
+            raise TypeError("async_generator_function must be an async "
+                            "generator function.")
+
+        self.async_generator_function = async_generator_function
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self):
+        """A string representation of this object."""
+        return '<AsyncGeneratorContainer {func_name}({arguments})>'.format(
+            func_name=self.async_generator_function.__name__,
+            arguments=", ".join(
+                [repr(arg) for arg in self.args]
+                + [str(key) + '=' + repr(value)
+                   for key, value in self.kwargs.items()]
+            ),
+        )
+
+    def __str__(self):
+        """A human-readable string representation of this object."""
+        return self.__repr__()
+
+    def new_generator(self):
+        """Create a new async generator object."""
+        return self.async_generator_function(*self.args, **self.kwargs)
+
+    def __aiter__(self):
+        """Return a fresh async iterator."""
+        return self.new_generator()
+
 
 def generator_container(generator_function):
     """Function Decorator: Containerize calls to a generator function.
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Request lifecycle hooks for Webex Teams API sessions.
+
+Classes:
+    RequestEvent: The details of a request lifecycle event.
+    RequestHooks: Base class for request lifecycle hooks.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+
+class RequestEvent(object):
+    """The details of a request lifecycle event.
+
+    Attributes:
+        method(str): The request method.
+        url(str): The absolute URL of the request.
+        endpoint(str): The templated endpoint (the endpoint path, with its
+            IDs collapsed; see :meth:`RestSession.endpoint_template`).
+        attempt(int): The attempt number of the request (1 for the first
+            attempt; retries and rate-limited requests are attempted again).
+        start_time(float): The time (seconds since the epoch) the attempt
+            (or page, or wait) started.
+        elapsed(float): The duration (seconds) of the attempt (or of the
+            page's parsing); None before the response is received.
+        status_code(int): The response status code (None before the response
+            is received, or if no response was received).
+        tracking_id(str): The Webex Tracking ID of the response (None before
+            the response is received).
+        error(Exception): The transport error of an attempt that failed
+            without a response, or the error of a retried (or rate-limited)
+            response; see `status_code` for error responses.
+        wait(float): The time (seconds) waited before a retry, or for a rate
+            limit.
+        items(int): The number of items of a page.
+        context(dict): Storage for the hooks' own state; the same event
+            object is passed to the `before_request` and `after_response`
+            hooks of an attempt.
+
+    """
+
+    def __init__(self, method, url, endpoint, attempt=None, start_time=None,
+                 elapsed=None, status_code=None, tracking_id=None,
+                 error=None, wait=None, items=None):
+        super(RequestEvent, self).__init__()
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.start_time = start_time
+        self.elapsed = elapsed
+        self.status_code = status_code
+        self.tracking_id = tracking_id
+        self.error = error
+        self.wait = wait
+        self.items = items
+        self.context = {}
+
+    def __repr__(self):
+        return "<{}({} {}, attempt={}, status_code={})>".format(
+            self.__class__.__name__, self.method, self.endpoint,
+            self.attempt, self.status_code,
+        )
+
+
+class RequestHooks(object):
+    """Base class for request lifecycle hooks.
+
+    Register hooks with a session (see the `hooks` argument of
+    :class:`WebexTeamsAPI`) and override the methods of the events to be
+    observed; each receives a :class:`RequestEvent`.  Hooks are called on
+    the thread making the request (which, for prefetched and parallel
+    pages, is a background thread); errors raised by hooks are logged and
+    otherwise ignored.
+
+    """
+
+    def before_request(self, event):
+        """Called before each attempt of a request is sent."""
+        pass
+
+    def after_response(self, event):
+        """Called after each attempt, once its response is received (or it
+        failed without a response; see `event.error`)."""
+        pass
+
+    def on_retry(self, event):
+        """Called before waiting `event.wait` seconds to retry a request."""
+        pass
+
+    def on_rate_limit_wait(self, event):
+        """Called before waiting `event.wait` seconds for a rate limit (a
+        `Retry-After` period or the client-side rate limiter)."""
+        pass
+
+    def on_page(self, event):
+        """Called for each page of paginated results, once it is parsed."""
+        pass
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""Pluggable JSON codecs used to encode and decode Webex Teams JSON data.
+
+Classes:
+    JSONCodec: Base class for JSON codecs.
+    StdlibJSONCodec: JSON codec using the Python standard library.
+    OrjsonCodec: JSON codec using the (optional) orjson package.
+    UjsonCodec: JSON codec using the (optional) ujson package.
+    RawJSON: The raw (undecoded) JSON text of an object.
+
+Functions:
+    get_json_codec: Return a JSON codec, by name.
+    split_json_page: Decode a page of JSON data, keeping its objects raw.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import json
+import re
+from collections import OrderedDict
+
+from past.builtins import basestring
+
+
+class JSONCodec(object):
+    """Base class for JSON codecs.
+
+    A codec decodes JSON documents from `bytes` (or text) and encodes Python
+    objects to UTF-8 encoded JSON `bytes`.
+
+    """
+
+    name = None
+    """The name of the codec."""
+
+    def loads(self, data):
+        """Decode a JSON document (bytes or text) to Python objects."""
+        raise NotImplementedError
+
+    def dumps(self, obj):
+        """Encode Python objects to a UTF-8 encoded JSON document (bytes)."""
+        raise NotImplementedError
+
+    def __repr__(self):
+        return "<{}>".format(self.__class__.__name__)
+
+
+class StdlibJSONCodec(JSONCodec):
+    """JSON codec using the Python standard library `json` module."""
+
+    name = "stdlib"
+
+    def __init__(self, ordered=True):
+        """Init a new StdlibJSONCodec.
+
+        Args:
+            ordered(bool): Decode JSON objects to OrderedDicts (the package's
+                historical behavior).  When False, JSON objects are decoded to
+                plain dicts, which is faster.
+
+        """
+        super(StdlibJSONCodec, self).__init__()
+        self.ordered = ordered
+        self._object_hook = OrderedDict if ordered else None
+
+    def loads(self, data):
+        return json.loads(data, object_hook=self._object_hook)
+
+    def dumps(self, obj):
+        return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+    def __repr__(self):
+        return "<{}(ordered={})>".format(self.__class__.__name__, self.ordered)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec using the `orjson` package.
+
+    Decodes JSON objects to plain dicts.
+
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        super(OrjsonCodec, self).__init__()
+        self._orjson = orjson
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj)
+
+
+class UjsonCodec(JSONCodec):
+    """JSON codec using the `ujson` package.
+
+    Decodes JSON objects to plain dicts.
+
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        super(UjsonCodec, self).__init__()
+        self._ujson = ujson
+
+    def loads(self, data):
+        return self._ujson.loads(data)
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# The codecs tried (in order) by get_json_codec("auto")
+FAST_JSON_CODECS = [OrjsonCodec, UjsonCodec]
+
+
+def get_json_codec(codec):
+    """Return a JSON codec, by name.
+
+    Args:
+        codec(basestring, JSONCodec): A JSONCodec, or the name of a codec:
+
+            * "stdlib": The standard library `json` module, decoding JSON
+              objects to OrderedDicts.
+            * "stdlib-dict": The standard library `json` module, decoding JSON
+              objects to plain dicts.
+            * "orjson", "ujson": The named (optional) package.
+            * "auto": The fastest installed codec (orjson, ujson, then
+              "stdlib-dict"), decoding JSON objects to plain dicts.
+
+    Returns:
+        JSONCodec: The JSON codec.
+
+    Raises:
+        ValueError: If the codec name is unknown.
+        ImportError: If the package of a named codec is not installed.
+
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    elif not isinstance(codec, basestring):
+        raise TypeError("codec must be a JSONCodec or the name of a codec; "
+                        "received: {!r}".format(codec))
+
+    if codec == "stdlib":
+        return StdlibJSONCodec()
+    elif codec == "stdlib-dict":
+        return StdlibJSONCodec(ordered=False)
+    elif codec == "auto":
+        for codec_class in FAST_JSON_CODECS:
+            try:
+                return codec_class()
+            except ImportError:
+                continue
+        return StdlibJSONCodec(ordered=False)
+
+    for codec_class in FAST_JSON_CODECS:
+        if codec == codec_class.name:
+            return codec_class()
+
+    raise ValueError("Unknown JSON codec: {!r}".format(codec))
+
+
+class RawJSON(bytes):
+    """The raw (undecoded) JSON text of an object, as UTF-8 encoded bytes."""
+
+    __slots__ = ()
+
+
+# JSON text without brackets: strings and scalar values
+_JSON_FLAT = br'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*'
+
+# Matches the next bracket of a JSON document, skipping over strings
+_JSON_BRACKET_RE = re.compile(_JSON_FLAT + br'([\[\]{}])')
+
+# Matches a JSON object or array nested up to three levels deep
+_JSON_CONTAINER_RE = re.compile(
+    br'[\[{]' + _JSON_FLAT + br'(?:[\[{]' + _JSON_FLAT + br'(?:[\[{]'
+    + _JSON_FLAT + br'[\]}]' + _JSON_FLAT + br')*[\]}]' + _JSON_FLAT
+    + br')*[\]}]'
+)
+
+# Matches the separators between the elements of a JSON array
+_JSON_SEPARATORS_RE = re.compile(br'[ \t\n\r,]*')
+
+# Stands in for a raw array while the rest of a page is decoded
+_RAW_ARRAY_PLACEHOLDER = "\u0000raw-json-{}"
+
+
+def _container_end(data, start):
+    """Return the end of the JSON object or array starting at `start`."""
+    match = _JSON_CONTAINER_RE.match(data, start)
+    if match:
+        return match.end()
+
+    # Deeply nested; count the brackets
+    depth = 0
+    position = start
+    while True:
+        match = _JSON_BRACKET_RE.match(data, position)
+        if match is None:
+            raise ValueError("Unterminated JSON object or array.")
+        position = match.end()
+        if match.group(1) in (b"[", b"{"):
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return position
+
+
+def _object_spans(data, start):
+    """Return the spans of the objects of the JSON array starting at `start`.
+
+    Returns:
+        tuple: The (start, end) spans of the array's objects (or None, if the
+        array holds other values), and the end of the array.
+
+    """
+    spans = []
+    position = start + 1
+    while True:
+        position = _JSON_SEPARATORS_RE.match(data, position).end()
+        char = data[position:position + 1]
+        if char == b"]":
+            return spans, position + 1
+        elif char != b"{":
+            return None, _container_end(data, start)
+        end = _container_end(data, position)
+        spans.append((position, end))
+        position = end
+
+
+def split_json_page(data, codec=None):
+    """Decode a page of JSON data, keeping its objects in arrays raw.
+
+    The arrays of JSON objects of the page (the top-level array, or the arrays
+    held by the top-level object; for example, its "items") are not decoded:
+    each of their objects is returned as a :class:`RawJSON` slice of `data`.
+    The rest of the page is decoded as usual.
+
+    Args:
+        data(bytes): The UTF-8 encoded JSON document.
+        codec(JSONCodec): The JSON codec used to decode the rest of the page.
+            Defaults to the standard library codec.
+
+    Returns:
+        The decoded page: a list of RawJSON objects, or a dictionary whose
+        arrays of objects are lists of RawJSON objects.
+
+    Raises:
+        ValueError: If the data is not valid JSON.
+
+    """
+    loads = (codec or StdlibJSONCodec()).loads
+
+    def raw_objects(spans):
+        return [RawJSON(data[start:end]) for start, end in spans]
+
+    start = len(data) - len(data.lstrip())
+    container = data[start:start + 1]
+    if container == b"[":
+        spans, _ = _object_spans(data, start)
+        return raw_objects(spans) if spans else loads(data)
+    elif container != b"{":
+        return loads(data)
+
+    # Find the arrays of objects held by the top-level object
+    arrays = []
+    position = start + 1
+    while True:
+        match = _JSON_BRACKET_RE.match(data, position)
+        if match is None:
+            break
+        bracket, position = match.group(1), match.start(1)
+        if bracket == b"[":
+            spans, end = _object_spans(data, position)
+            if spans:
+                arrays.append((position, end, spans))
+            position = end
+        elif bracket == b"{":
+            position = _container_end(data, position)
+        else:
+            break
+
+    if not arrays:
+        return loads(data)
+
+    # Decode the rest of the page, with placeholders for the raw arrays
+    pieces = []
+    placeholders = {}
+    previous_end = 0
+    for index, (start, end, spans) in enumerate(arrays):
+        placeholder = _RAW_ARRAY_PLACEHOLDER.format(index)
+        placeholders[placeholder] = spans
+        pieces.append(data[previous_end:start])
+        pieces.append(json.dumps(placeholder).encode("utf-8"))
+        previous_end = end
+    pieces.append(data[previous_end:])
+    page = loads(b"".join(pieces))
+
+    for key, value in list(page.items()):
+        if isinstance(value, basestring) and value in placeholders:
+            page[key] = raw_objects(placeholders[value])
+    return page
@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+"""Batching loaders for Webex Teams get-by-id lookups.
+
+Classes:
+    PeopleLoader: Batches people lookups into `people.list(id=...)` calls.
+    AsyncPeopleLoader: The asyncio counterpart of PeopleLoader.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from past.builtins import basestring
+
+from .config import DEFAULT_LOADER_WINDOW
+from .utils import check_type
+
+
+# The largest number of person IDs accepted by a people.list(id=...) call
+MAX_PEOPLE_IDS_PER_REQUEST = 85
+
+
+class _Batch(object):
+    """The pending lookups of a batch, by ID."""
+
+    def __init__(self):
+        super(_Batch, self).__init__()
+        self.futures = OrderedDict()
+        self.full = threading.Event()
+
+
+class _AsyncBatch(object):
+    """The pending lookups of an asyncio batch, by ID."""
+
+    def __init__(self):
+        super(_AsyncBatch, self).__init__()
+        self.futures = OrderedDict()
+        self.full = asyncio.Event()
+
+
+class PeopleLoader(object):
+    """Batches people lookups into `people.list(id=...)` calls.
+
+    Concurrent :meth:`get` calls (from different threads) made within
+    `window` seconds of each other are collected into a batch, and each
+    batch of up to 85 person IDs is looked up with a single
+    `PeopleAPI.list(id=...)` call, whose results are fanned back out to the
+    callers.  :meth:`get_many` looks up a list of IDs in batches directly.
+
+    The IDs missing from a batch's results are looked up individually with
+    `PeopleAPI.get()`, so that a missing person raises the same error as
+    `PeopleAPI.get()` would.
+
+    The people are loaded from the list endpoint, whose results can lack
+    fields returned by `PeopleAPI.get()`, such as the presence fields
+    (`status` and `lastActivity`).  Use `PeopleAPI.get()` when those fields
+    are needed.
+
+    """
+
+    def __init__(self, people_api, window=DEFAULT_LOADER_WINDOW,
+                 max_batch_size=MAX_PEOPLE_IDS_PER_REQUEST,
+                 callingData=False):
+        """Init a new PeopleLoader.
+
+        Args:
+            people_api(PeopleAPI): The People API wrapper.
+            window(int, float): The time (seconds) a batch collects lookups
+                before it is sent.
+            max_batch_size(int): The largest number of IDs looked up with a
+                single call (at most 85); full batches are sent at once.
+            callingData(bool): Include Webex Calling user details.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `window` or `max_batch_size` is out of range.
+
+        """
+        check_type(window, (int, float))
+        check_type(max_batch_size, int)
+        check_type(callingData, bool)
+        if window < 0:
+            raise ValueError("window must be zero or positive.")
+        if not 1 <= max_batch_size <= MAX_PEOPLE_IDS_PER_REQUEST:
+            raise ValueError("max_batch_size must be between 1 and {}."
+                             "".format(MAX_PEOPLE_IDS_PER_REQUEST))
+
+        super(PeopleLoader, self).__init__()
+        self._people = people_api
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.callingData = callingData
+        self._lock = threading.Lock()
+        self._batch = None
+
+    def get(self, personId):
+        """Get a person's details, by ID, batched with concurrent lookups.
+
+        Args:
+            personId(basestring): The ID of the person to be retrieved.
+
+        Returns:
+            Person: A Person object with the details of the requested person.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ApiError: If the Webex Teams cloud returns an error.
+
+        """
+        check_type(personId, basestring)
+
+        with self._lock:
+            batch = self._batch
+            leader = batch is None
+            if leader:
+                batch = self._batch = _Batch()
+            future = batch.futures.get(personId)
+            if future is None:
+                future = batch.futures[personId] = Future()
+            if len(batch.futures) >= self.max_batch_size:
+                self._batch = None
+                batch.full.set()
+
+        if leader:
+            # Collect lookups until the window closes (or the batch is full)
+            batch.full.wait(self.window)
+            with self._lock:
+                if self._batch is batch:
+                    self._batch = None
+            self._load(batch.futures)
+
+        return future.result()
+
+    def get_many(self, personIds):
+        """Get the details of several people, by ID, in batches.
+
+        Args:
+            personIds(list): The IDs of the people to be retrieved.
+
+        Returns:
+            list: The Person objects, in the order of `personIds`.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ApiError: If the Webex Teams cloud returns an error (including
+                for the first missing person).
+
+        """
+        check_type(personIds, list)
+
+        futures = OrderedDict()
+        for personId in personIds:
+            check_type(personId, basestring)
+            futures.setdefault(personId, None)
+
+        unique_ids = list(futures)
+        for start in range(0, len(unique_ids), self.max_batch_size):
+            batch = OrderedDict(
+                (personId, Future())
+                for personId in unique_ids[start:start + self.max_batch_size]
+            )
+            self._load(batch)
+            futures.update(batch)
+
+        return [futures[personId].result() for personId in personIds]
+
+    def _load(self, futures):
+        """Look up a batch of IDs; resolve their futures."""
+        try:
+            people = self._people.list(
+                id=",".join(futures), max=len(futures),
+                callingData=self.callingData,
+            )
+            found = {person.id: person for person in people}
+        except Exception as e:
+            for future in futures.values():
+                future.set_exception(e)
+            return
+
+        for personId, future in futures.items():
+            if personId in found:
+                future.set_result(found[personId])
+                continue
+
+            # Raise the error (or return the person) `get` would
+            try:
+                person = self._people.get(personId,
+                                          callingData=self.callingData)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(person)
+
+
+class AsyncPeopleLoader(object):
+    """The asyncio counterpart of :class:`PeopleLoader`.
+
+    Concurrent :meth:`get` calls (from different tasks) made within `window`
+    seconds of each other are collected into a batch, and each batch of up
+    to 85 person IDs is looked up with a single `people.list(id=...)` call of
+    the :class:`AsyncWebexTeamsAPI`.  Created by `api.people.loader()`.
+
+    As with :class:`PeopleLoader`, the people are loaded from the list
+    endpoint, whose results can lack fields returned by `people.get()`, such
+    as the presence fields (`status` and `lastActivity`).
+
+    """
+
+    def __init__(self, people_api, window=DEFAULT_LOADER_WINDOW,
+                 max_batch_size=MAX_PEOPLE_IDS_PER_REQUEST,
+                 callingData=False):
+        """Init a new AsyncPeopleLoader.
+
+        Args:
+            people_api(AsyncAPIWrapper): The asyncio People API wrapper.
+            window(int, float): The time (seconds) a batch collects lookups
+                before it is sent.
+            max_batch_size(int): The largest number of IDs looked up with a
+                single call (at most 85); full batches are sent at once.
+            callingData(bool): Include Webex Calling user details.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `window` or `max_batch_size` is out of range.
+
+        """
+        check_type(window, (int, float))
+        check_type(max_batch_size, int)
+        check_type(callingData, bool)
+        if window < 0:
+            raise ValueError("window must be zero or positive.")
+        if not 1 <= max_batch_size <= MAX_PEOPLE_IDS_PER_REQUEST:
+            raise ValueError("max_batch_size must be between 1 and {}."
+                             "".format(MAX_PEOPLE_IDS_PER_REQUEST))
+
+        super(AsyncPeopleLoader, self).__init__()
+        self._people = people_api
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.callingData = callingData
+        self._batch = None
+
+    async def get(self, personId):
+        """Get a person's details, by ID, batched with concurrent lookups.
+
+        Args:
+            personId(basestring): The ID of the person to be retrieved.
+
+        Returns:
+            Person: A Person object with the details of the requested person.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ApiError: If the Webex Teams cloud returns an error.
+
+        """
+        check_type(personId, basestring)
+
+        batch = self._batch
+        if batch is None:
+            batch = self._batch = _AsyncBatch()
+            # The batch is sent by its own task, so that cancelling a caller
+            # doesn't cancel the other callers' lookups
+            asyncio.ensure_future(self._send(batch))
+        future = batch.futures.get(personId)
+        if future is None:
+            future = batch.futures[personId] = \
+                asyncio.get_running_loop().create_future()
+        if len(batch.futures) >= self.max_batch_size:
+            self._batch = None
+            batch.full.set()
+
+        return await asyncio.shield(future)
+
+    async def get_many(self, personIds):
+        """Get the details of several people, by ID, in batches.
+
+        Args:
+            personIds(list): The IDs of the people to be retrieved.
+
+        Returns:
+            list: The Person objects, in the order of `personIds`.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ApiError: If the Webex Teams cloud returns an error (including
+                for the first missing person).
+
+        """
+        check_type(personIds, list)
+
+        futures = OrderedDict()
+        for personId in personIds:
+            check_type(personId, basestring)
+            futures.setdefault(personId, None)
+
+        loop = asyncio.get_running_loop()
+        unique_ids = list(futures)
+        for start in range(0, len(unique_ids), self.max_batch_size):
+            batch = OrderedDict(
+                (personId, loop.create_future())
+                for personId in unique_ids[start:start + self.max_batch_size]
+            )
+            await self._load(batch)
+            futures.update(batch)
+
+        return [futures[personId].result() for personId in personIds]
+
+    async def _send(self, batch):
+        """Send a batch once its window closes (or once it is full)."""
+        try:
+            await asyncio.wait_for(batch.full.wait(), self.window)
+        except asyncio.TimeoutError:
+            pass
+        if self._batch is batch:
+            self._batch = None
+        await self._load(batch.futures)
+
+    async def _load(self, futures):
+        """Look up a batch of IDs; resolve their futures."""
+        try:
+            found = {}
+            async for person in self._people.list(
+                id=",".join(futures), max=len(futures),
+                callingData=self.callingData,
+            ):
+                found[person.id] = person
+        except Exception as e:
+            for future in futures.values():
+                future.set_exception(e)
+            return
+
+        for personId, future in futures.items():
+            if personId in found:
+                future.set_result(found[personId])
+                continue
+
+            # Raise the error (or return the person) `get` would
+            try:
+                person = await self._people.get(personId,
+                                                callingData=self.callingData)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(person)
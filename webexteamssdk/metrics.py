@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+"""Request metrics for Webex Teams API sessions.
+
+Classes:
+    Histogram: A cumulative histogram of observed values.
+    MetricsRegistry: Per-endpoint request metrics of one or more sessions.
+
+Functions:
+    endpoint_template: Collapse the IDs of an endpoint path.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import re
+import threading
+
+from past.builtins import basestring
+
+from .utils import check_type
+
+
+# The upper bounds of the latency (seconds) histogram buckets
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# The upper bounds of the response size (bytes) histogram buckets
+DEFAULT_SIZE_BUCKETS = (
+    256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304,
+)
+
+# The placeholder replacing the IDs of endpoint paths
+ID_PLACEHOLDER = "{id}"
+
+_UUID_SEGMENT = re.compile(
+    r"^[0-9a-fA-F]{8}-([0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$"
+)
+_OPAQUE_ID_SEGMENT = re.compile(r"^[A-Za-z0-9_\-=+%.:]{16,}$")
+
+
+def _is_id(segment):
+    """Whether a path segment is an ID (rather than an endpoint name)."""
+    if segment.isdigit() or "@" in segment or "%40" in segment:
+        return True
+    if _UUID_SEGMENT.match(segment):
+        return True
+    # Webex Teams IDs are long base64 strings; endpoint names have no digits
+    return bool(_OPAQUE_ID_SEGMENT.match(segment)) \
+        and any(character.isdigit() for character in segment)
+
+
+def endpoint_template(path):
+    """Collapse the IDs of an endpoint path.
+
+    Args:
+        path(basestring): A URL path, such as "rooms/Y2lzY29zcGFyazovL3Vz".
+
+    Returns:
+        str: The path with its ID segments (numbers, UUIDs, email addresses
+        and Webex Teams IDs) replaced by "{id}"; for example, "rooms/{id}".
+
+    """
+    return "/".join(
+        ID_PLACEHOLDER if segment and _is_id(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+class Histogram(object):
+    """A cumulative histogram of observed values (Prometheus style)."""
+
+    def __init__(self, buckets):
+        """Init a new Histogram.
+
+        Args:
+            buckets(tuple): The (ascending) upper bounds of the buckets.
+
+        """
+        super(Histogram, self).__init__()
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        """Record an observed value."""
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self):
+        """Return the histogram as a dictionary.
+
+        Returns:
+            dict: The cumulative `buckets` counts (by upper bound, including
+            "+Inf"), and the `count` and `sum` of the observed values.
+
+        """
+        buckets = dict(zip(self.buckets, self.counts))
+        buckets["+Inf"] = self.count
+        return {"buckets": buckets, "count": self.count, "sum": self.sum}
+
+
+class _EndpointMetrics(object):
+    """The metrics of a method and endpoint."""
+
+    def __init__(self, latency_buckets, size_buckets):
+        super(_EndpointMetrics, self).__init__()
+        self.requests = 0
+        self.status_codes = {}
+        self.errors = {}
+        self.retries = 0
+        self.pages = 0
+        self.rate_limit_sleep = 0.0
+        self.request_bytes = 0
+        self.latency = Histogram(latency_buckets)
+        self.response_bytes = Histogram(size_buckets)
+
+    def snapshot(self):
+        return {
+            "requests": self.requests,
+            "status_codes": dict(self.status_codes),
+            "errors": dict(self.errors),
+            "retries": self.retries,
+            "pages": self.pages,
+            "rate_limit_sleep_seconds": self.rate_limit_sleep,
+            "request_bytes": self.request_bytes,
+            "latency_seconds": self.latency.snapshot(),
+            "response_bytes": self.response_bytes.snapshot(),
+        }
+
+
+def _escape_label(value):
+    """Escape a Prometheus label value."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n") \
+        .replace('"', '\\"')
+
+
+def _labels(**labels):
+    return "{" + ",".join(
+        '{}="{}"'.format(name, _escape_label(value))
+        for name, value in sorted(labels.items())
+    ) + "}"
+
+
+def _format_value(value):
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry(object):
+    """Per-endpoint request metrics of one or more sessions.
+
+    A session configured with a registry (see the `metrics` argument of
+    :class:`WebexTeamsAPI`) records every HTTP request attempt (including
+    retries) under its method and templated endpoint (the endpoint path,
+    with IDs collapsed to "{id}"): the number of requests, their status
+    codes or transport errors, their latency and payload sizes, the retries
+    made, the pages of paginated results fetched, and the time spent waiting
+    on rate limits.
+
+    Read the metrics with :meth:`snapshot`, or export them in the Prometheus
+    text exposition format with :meth:`to_prometheus`.  A registry may be
+    shared by several sessions (and threads).
+
+    """
+
+    def __init__(self, latency_buckets=DEFAULT_LATENCY_BUCKETS,
+                 size_buckets=DEFAULT_SIZE_BUCKETS):
+        """Init a new MetricsRegistry.
+
+        Args:
+            latency_buckets(tuple): The upper bounds (seconds) of the latency
+                histogram buckets.
+            size_buckets(tuple): The upper bounds (bytes) of the response
+                size histogram buckets.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(latency_buckets, (list, tuple))
+        check_type(size_buckets, (list, tuple))
+
+        super(MetricsRegistry, self).__init__()
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self.size_buckets = tuple(sorted(size_buckets))
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def __repr__(self):
+        return "<{}(endpoints={})>".format(self.__class__.__name__,
+                                           len(self._endpoints))
+
+    def _metrics(self, method, endpoint):
+        """The metrics of a method and endpoint (call with the lock held)."""
+        key = (method, endpoint)
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = self._endpoints[key] = _EndpointMetrics(
+                self.latency_buckets, self.size_buckets,
+            )
+        return metrics
+
+    def record_request(self, method, endpoint, status_code=None, error=None,
+                       latency=0.0, request_bytes=0, response_bytes=None):
+        """Record a request attempt.
+
+        Args:
+            method(basestring): The request method.
+            endpoint(basestring): The templated endpoint.
+            status_code(int): The response status code (None if no response
+                was received).
+            error(basestring): The name of the transport error that prevented
+                a response (None if a response was received).
+            latency(float): The time (seconds) taken by the attempt.
+            request_bytes(int): The size of the request body.
+            response_bytes(int): The size of the response body.
+
+        """
+        with self._lock:
+            metrics = self._metrics(method, endpoint)
+            metrics.requests += 1
+            if status_code is not None:
+                metrics.status_codes[status_code] = \
+                    metrics.status_codes.get(status_code, 0) + 1
+            if error is not None:
+                metrics.errors[error] = metrics.errors.get(error, 0) + 1
+            metrics.latency.observe(latency)
+            metrics.request_bytes += request_bytes
+            if response_bytes is not None:
+                metrics.response_bytes.observe(response_bytes)
+
+    def record_retry(self, method, endpoint):
+        """Record the retry of a failed request."""
+        with self._lock:
+            self._metrics(method, endpoint).retries += 1
+
+    def record_page(self, method, endpoint):
+        """Record a page of paginated results."""
+        with self._lock:
+            self._metrics(method, endpoint).pages += 1
+
+    def record_rate_limit_sleep(self, method, endpoint, seconds):
+        """Record time spent waiting on rate limits."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._metrics(method, endpoint).rate_limit_sleep += seconds
+
+    def reset(self):
+        """Discard the recorded metrics."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self):
+        """Return the recorded metrics.
+
+        Returns:
+            dict: The metrics of each `(method, endpoint)` pair: the number
+            of `requests`, their `status_codes` and transport `errors` (by
+            error class name), the `retries` made, the `pages` fetched,
+            the `rate_limit_sleep_seconds`, the total `request_bytes`, and
+            the `latency_seconds` and `response_bytes` histograms (see
+            :meth:`Histogram.snapshot`).
+
+        """
+        with self._lock:
+            return {key: metrics.snapshot()
+                    for key, metrics in self._endpoints.items()}
+
+    def to_prometheus(self, prefix="webexteamssdk"):
+        """Export the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix(basestring): The prefix of the metric names.
+
+        Returns:
+            str: The metrics, in the Prometheus text format (version 0.0.4).
+
+        """
+        check_type(prefix, basestring)
+
+        snapshot = sorted(self.snapshot().items())
+        lines = []
+
+        def family(name, metric_type, description, samples):
+            name = prefix + "_" + name
+            lines.append("# HELP {} {}".format(name, description))
+            lines.append("# TYPE {} {}".format(name, metric_type))
+            for suffix, labels, value in samples:
+                lines.append("{}{}{} {}".format(
+                    name, suffix, _labels(**labels), _format_value(value),
+                ))
+
+        def histogram_samples(key):
+            for (method, endpoint), metrics in snapshot:
+                histogram = metrics[key]
+                for bound, count in sorted(
+                    histogram["buckets"].items(),
+                    key=lambda item: float(item[0]),
+                ):
+                    yield "_bucket", dict(method=method, endpoint=endpoint,
+                                          le=_format_value(bound)
+                                          if bound != "+Inf" else bound), \
+                        count
+                yield "_sum", dict(method=method, endpoint=endpoint), \
+                    histogram["sum"]
+                yield "_count", dict(method=method, endpoint=endpoint), \
+                    histogram["count"]
+
+        family("requests_total", "counter",
+               "HTTP requests made, by response status code.",
+               [("", dict(method=method, endpoint=endpoint, status=status),
+                 count)
+                for (method, endpoint), metrics in snapshot
+                for status, count in sorted(metrics["status_codes"].items())])
+        family("request_errors_total", "counter",
+               "HTTP requests that failed without a response, by error.",
+               [("", dict(method=method, endpoint=endpoint, error=error),
+                 count)
+                for (method, endpoint), metrics in snapshot
+                for error, count in sorted(metrics["errors"].items())])
+        for name, key, description in (
+            ("retries_total", "retries", "Retries of failed requests."),
+            ("pages_total", "pages", "Pages of paginated results fetched."),
+            ("rate_limit_sleep_seconds_total", "rate_limit_sleep_seconds",
+             "Time spent waiting on rate limits."),
+            ("request_size_bytes_total", "request_bytes",
+             "Request body bytes sent."),
+        ):
+            family(name, "counter", description,
+                   [("", dict(method=method, endpoint=endpoint),
+                     metrics[key])
+                    for (method, endpoint), metrics in snapshot])
+        family("request_duration_seconds", "histogram",
+               "HTTP request latency.",
+               histogram_samples("latency_seconds"))
+        family("response_size_bytes", "histogram",
+               "HTTP response body sizes.",
+               histogram_samples("response_bytes"))
+
+        return "\n".join(lines) + "\n"
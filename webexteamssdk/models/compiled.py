@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+"""Model Webex Teams JSON objects as compiled, slot-based Python objects.
+
+Classes:
+    CompiledData: Models Webex Teams JSON objects as slot-based objects.
+
+Functions:
+    compile_model: Compile an ImmutableData model into a CompiledData model.
+    compiled_data_factory: Factory function for creating CompiledData objects.
+
+The CompiledData models are drop-in, faster and smaller alternatives to the
+ImmutableData models: they have the same attributes and the same `to_dict()`
+and `to_json()` behavior.  Each model class is generated from its
+ImmutableData counterpart with `__slots__` (no per-object `__dict__`) and the
+model's mixin properties copied into the class.  JSON attributes without a
+property are looked up directly in the object's JSON data, and nested JSON
+objects are wrapped once, on first access, and cached.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import json
+from collections import defaultdict
+
+from webexteamssdk.utils import json_dict
+from . import immutable
+from .immutable import ImmutableData, immutable_data_models
+
+
+class CompiledData(object):
+    """Model a Webex Teams JSON object as a slot-based Python object."""
+
+    __slots__ = (
+        "_json_data", "_nested", "_compare_by_identity", "_frozen", "_hash",
+        "_datetimes",
+    )
+
+    # The JSON attribute holding the version of an object, used (with the
+    # object's ID) to compare objects by identity
+    version_attribute = "lastModified"
+
+    def __init__(self, json_data, compare_by_identity=False):
+        """Init a new CompiledData object from a dictionary or JSON string.
+
+        Args:
+            json_data(dict, basestring): Input JSON string or dictionary.
+            compare_by_identity(bool): Compare (and hash) the object by its
+                :meth:`identity_key` (its ID and version), rather than by its
+                complete JSON data.
+
+        Raises:
+            TypeError: If the input object is not a dictionary or string.
+
+        """
+        self._json_data = json_dict(json_data)
+        self._nested = None
+        self._compare_by_identity = compare_by_identity
+        self._frozen = None
+        self._hash = None
+        self._datetimes = None
+
+    def __getattr__(self, item):
+        """Provide native attribute access to the JSON object attributes.
+
+        Called for the JSON attributes that do not have a model property (the
+        properties are generated by :func:`compile_model`).  Nested JSON
+        objects are returned as CompiledData objects, which are created on
+        first access and cached.
+
+        Args:
+            item(str): Name of the Attribute being accessed.
+
+        Raises:
+            AttributeError:  If the JSON object does not contain the attribute
+                requested.
+
+        """
+        if item in CompiledData.__slots__:
+            # The slot has not been set (for example, while unpickling)
+            raise AttributeError(item)
+
+        if item not in self._json_data:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'"
+                "".format(self.__class__.__name__, item)
+            )
+
+        item_data = self._json_data[item]
+        if isinstance(item_data, dict):
+            return self._get_nested(item, CompiledData)
+        else:
+            return item_data
+
+    def _get_nested(self, item, model_class):
+        """Return the cached model object wrapping a nested JSON object."""
+        nested = self._nested
+        if nested is None:
+            nested = self._nested = {}
+        try:
+            return nested[item]
+        except KeyError:
+            value = nested[item] = model_class(self._json_data.get(item))
+            return value
+
+    def __getstate__(self):
+        return self._json_data, self._compare_by_identity
+
+    def __setstate__(self, state):
+        self._json_data, self._compare_by_identity = state
+        self._nested = None
+        self._frozen = None
+        self._hash = None
+        self._datetimes = None
+
+    def __str__(self):
+        """A human-readable string representation of this object."""
+        class_str = self.__class__.__name__
+        json_str = json.dumps(self._json_data, indent=2)
+        return "Webex Teams {}:\n{}".format(class_str, json_str)
+
+    def __repr__(self):
+        """A string representing this object as valid Python expression."""
+        class_str = self.__class__.__name__
+        json_str = json.dumps(self._json_data, ensure_ascii=False)
+        return "{}({})".format(class_str, repr(json_str))
+
+    def _freeze(self):
+        """Freeze this object's JSON data (computed once, on first use)."""
+        frozen = self._frozen
+        if frozen is None:
+            frozen = self._frozen = ImmutableData._serialize(self._json_data)
+        return frozen
+
+    _datetime = ImmutableData._datetime
+    identity_key = ImmutableData.identity_key
+    _comparison_key = ImmutableData._comparison_key
+
+    def __eq__(self, other):
+        """Determine if two objects are equal."""
+        return isinstance(other, self.__class__) \
+            and self._comparison_key() == other._comparison_key()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        """Hash the data object (computed once, on first use)."""
+        object_hash = self._hash
+        if object_hash is None:
+            object_hash = self._hash = hash(self._comparison_key())
+        return object_hash
+
+    @property
+    def json_data(self):
+        """A copy of the data object's JSON data (OrderedDict)."""
+        return self._json_data.copy()
+
+    def to_dict(self):
+        """Convert the Webex Teams object data to a dictionary."""
+        return dict(self._json_data)
+
+    def to_json(self, **kwargs):
+        """Convert the Webex Teams object data to JSON.
+
+        Any keyword arguments provided are passed through the Python JSON
+        encoder.
+
+        """
+        return json.dumps(self._json_data, **kwargs)
+
+
+def _nested_property(item, model_class, doc=None):
+    """Build a property returning a (cached) nested model object."""
+    def getter(self):
+        return self._get_nested(item, model_class)
+
+    return property(getter, doc=doc)
+
+
+def compile_model(model_class, nested_models=None):
+    """Compile an ImmutableData model into a slot-based CompiledData model.
+
+    The compiled model has the same name and attributes as `model_class`; the
+    properties and methods of its mixins (the model's known fields) are
+    copied into the compiled class, once, here.  Compiled classes are never
+    modified afterwards: JSON attributes without a property are found by
+    :meth:`CompiledData.__getattr__`.
+    Properties defined by `model_class` itself (rather than by a mixin) are
+    replaced with cached nested-object properties: by default, nested JSON
+    objects are wrapped as CompiledData objects; `nested_models` maps
+    attribute names to other compiled models.
+
+    Args:
+        model_class(type): An ImmutableData subclass.
+        nested_models(dict): Compiled models for nested JSON objects, by
+            attribute name.
+
+    Returns:
+        type: A CompiledData subclass.
+
+    """
+    nested_models = nested_models or {}
+    namespace = {
+        "__slots__": (),
+        "__doc__": model_class.__doc__,
+        "__module__": __name__,
+    }
+
+    # Copy the mixin members, in reverse MRO order (so overrides apply)
+    for cls in reversed(model_class.__mro__):
+        if cls is object or issubclass(ImmutableData, cls) \
+                or issubclass(cls, ImmutableData):
+            continue
+        for name, value in vars(cls).items():
+            if not name.startswith("__"):
+                namespace[name] = value
+
+    # Nested objects, wrapped once and cached
+    for name, value in vars(model_class).items():
+        if isinstance(value, property):
+            namespace[name] = _nested_property(
+                name, nested_models.get(name, CompiledData), value.__doc__,
+            )
+    for name, nested_model in nested_models.items():
+        namespace.setdefault(name, _nested_property(name, nested_model))
+
+    return type(str(model_class.__name__), (CompiledData,), namespace)
+
+
+AdminAuditEventData = compile_model(immutable.AdminAuditEventData)
+
+# The compiled models of nested JSON objects, by model and attribute name
+nested_data_models = {
+    "admin_audit_event": {"data": AdminAuditEventData},
+}
+
+compiled_data_models = defaultdict(lambda: CompiledData, {
+    model: compile_model(model_class, nested_data_models.get(model))
+    for model, model_class in immutable_data_models.items()
+})
+
+# Make the compiled models importable (and picklable) from this module
+globals().update({
+    model_class.__name__: model_class
+    for model_class in compiled_data_models.values()
+})
+
+
+def compiled_data_factory(model, json_data):
+    """Factory function for creating CompiledData objects.
+
+    Args:
+        model(basestring): The data model to use when creating the
+            CompiledData object (message, room, membership, etc.).
+        json_data(basestring, dict): The JSON string or dictionary data with
+            which to initialize the object.
+
+    Returns:
+        CompiledData: The created CompiledData object.
+
+    Raises:
+        TypeError: If the json_data parameter is not a JSON string or
+            dictionary.
+
+    """
+    return compiled_data_models[model](json_data)
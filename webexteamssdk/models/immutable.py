@@ -39,7 +39,7 @@ from builtins import *
 import json
 from collections import defaultdict
 
-from webexteamssdk.utils import json_dict
+from webexteamssdk.utils import WebexTeamsDateTime, json_dict
 from .mixins.access_token import AccessTokenBasicPropertiesMixin
 from .mixins.admin_audit_event import (
     AdminAuditEventBasicPropertiesMixin,
@@ -65,11 +65,24 @@ from .mixins.webhook_event import WebhookEventBasicPropertiesMixin
 class ImmutableData(object):
     """Model a Webex Teams JSON object as an immutable native Python object."""
 
-    def __init__(self, json_data):
+    # The JSON attribute holding the version of an object, used (with the
+    # object's ID) to compare objects by identity
+    version_attribute = "lastModified"
+
+    # Defaults for the lazily computed (and cached) comparison data
+    _compare_by_identity = False
+    _frozen = None
+    _hash = None
+    _datetimes = None
+
+    def __init__(self, json_data, compare_by_identity=False):
         """Init a new ImmutableData object from a dictionary or JSON string.
 
         Args:
             json_data(dict, basestring): Input JSON string or dictionary.
+            compare_by_identity(bool): Compare (and hash) the object by its
+                :meth:`identity_key` (its ID and version), rather than by its
+                complete JSON data.
 
         Raises:
             TypeError: If the input object is not a dictionary or string.
@@ -77,6 +90,8 @@ class ImmutableData(object):
         """
         super(ImmutableData, self).__init__()
         self._json_data = json_dict(json_data)
+        if compare_by_identity:
+            self._compare_by_identity = True
 
     def __getattr__(self, item):
         """Provide native attribute access to the JSON object attributes.
@@ -110,6 +125,17 @@ class ImmutableData(object):
                 "".format(self.__class__.__name__, item)
             )
 
+    def __getstate__(self):
+        """Pickle the JSON data (not the lazily computed caches)."""
+        return {
+            key: value for key, value in self.__dict__.items()
+            if key in ("_json_data", "_compare_by_identity")
+        }
+
+    def __setstate__(self, state):
+        """Restore a pickled object."""
+        self.__dict__.update(state)
+
     def __str__(self):
         """A human-readable string representation of this object."""
         class_str = self.__class__.__name__
@@ -122,6 +148,28 @@ class ImmutableData(object):
         json_str = json.dumps(self._json_data, ensure_ascii=False)
         return "{}({})".format(class_str, repr(json_str))
 
+    def _datetime(self, item):
+        """Parse a JSON date and time attribute (parsed once, on first use).
+
+        Args:
+            item(str): Name of the date and time attribute.
+
+        Returns:
+            WebexTeamsDateTime: The parsed date and time, or None if the
+            attribute is not set.
+
+        """
+        datetimes = self._datetimes
+        if datetimes is None:
+            datetimes = self._datetimes = {}
+        try:
+            return datetimes[item]
+        except KeyError:
+            value = self._json_data.get(item)
+            value = datetimes[item] = \
+                WebexTeamsDateTime.strptime(value) if value else None
+            return value
+
     @classmethod
     def _serialize(cls, data):
         """Serialize data to an frozen tuple."""
@@ -146,17 +194,37 @@ class ImmutableData(object):
             )
 
     def _freeze(self):
-        """Freeze this object's JSON data."""
-        return self._serialize(self._json_data)
+        """Freeze this object's JSON data (computed once, on first use)."""
+        frozen = self._frozen
+        if frozen is None:
+            frozen = self._frozen = self._serialize(self._json_data)
+        return frozen
+
+    def identity_key(self):
+        """The object's identity: its ID and version (or None)."""
+        return (
+            self._json_data.get("id"),
+            self._json_data.get(self.version_attribute),
+        )
+
+    def _comparison_key(self):
+        """The key used to compare and hash the object."""
+        if self._compare_by_identity:
+            return self.identity_key()
+        else:
+            return self._freeze()
 
     def __eq__(self, other):
         """Determine if two objects are equal."""
         return isinstance(other, self.__class__) \
-            and self._freeze() == other._freeze()
+            and self._comparison_key() == other._comparison_key()
 
     def __hash__(self):
-        """Hash the data object."""
-        return hash(self._freeze())
+        """Hash the data object (computed once, on first use)."""
+        object_hash = self._hash
+        if object_hash is None:
+            object_hash = self._hash = hash(self._comparison_key())
+        return object_hash
 
     @property
     def json_data(self):
@@ -310,3 +378,28 @@ def immutable_data_factory(model, json_data):
 
     """
     return immutable_data_models[model](json_data)
+
+
+def identity_data_factory(model, json_data):
+    """Factory function for creating ImmutableData objects compared by ID.
+
+    Creates the same objects as :func:`immutable_data_factory`; the objects
+    are compared and hashed by their :meth:`ImmutableData.identity_key` (their
+    ID and `lastModified` version), which makes deduplicating large numbers
+    of objects (in sets and dictionaries) cheap.
+
+    Args:
+        model(basestring): The data model to use when creating the
+            ImmutableData object (message, room, membership, etc.).
+        json_data(basestring, dict): The JSON string or dictionary data with
+            which to initialize the object.
+
+    Returns:
+        ImmutableData: The created ImmutableData object.
+
+    Raises:
+        TypeError: If the json_data parameter is not a JSON string or
+            dictionary.
+
+    """
+    return immutable_data_models[model](json_data, compare_by_identity=True)
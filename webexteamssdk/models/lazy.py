@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""Model Webex Teams JSON objects as lazily-decoded Python objects.
+
+Classes:
+    LazyData: Models a Webex Teams JSON object, decoded on first access.
+    LazyDataFactory: Factory for creating LazyData objects.
+
+Objects:
+    lazy_data_factory: The default LazyDataFactory.
+
+A LazyData object keeps the raw JSON text of an object, as it was received
+from the Webex Teams APIs, and decodes it (into the data object created by its
+wrapped object factory) only when one of its attributes is accessed.  The raw
+JSON text can be written out unchanged, without decoding and re-encoding it.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+from past.builtins import basestring
+
+from webexteamssdk.json_codec import (
+    get_json_codec, JSONCodec, StdlibJSONCodec,
+)
+from webexteamssdk.utils import check_type, json_dict
+from .immutable import immutable_data_factory
+
+
+class LazyData(object):
+    """Model a Webex Teams JSON object, decoded on first access.
+
+    Attribute access is delegated to the data object created (by the wrapped
+    object factory) when the object is first decoded.
+
+    """
+
+    __slots__ = ("_model", "_raw_json", "_data", "_object_factory", "_codec")
+
+    def __init__(self, model, json_data, object_factory=immutable_data_factory,
+                 codec=None):
+        """Init a new LazyData object.
+
+        Args:
+            model(basestring): The data model of the object (message, room,
+                membership, etc.).
+            json_data(bytes, basestring, dict): The raw (UTF-8 encoded) JSON
+                text of the object, or a dictionary.  Dictionaries are wrapped
+                immediately.
+            object_factory(callable): The factory function used to create the
+                data object when the JSON text is decoded.
+            codec(JSONCodec): The JSON codec used to decode (and encode) the
+                JSON text.  Defaults to the standard library codec.
+
+        Raises:
+            TypeError: If the json_data is not JSON text or a dictionary.
+
+        """
+        self._model = model
+        self._object_factory = object_factory
+        self._codec = codec
+        if isinstance(json_data, dict):
+            self._raw_json = None
+            self._data = object_factory(model, json_data)
+        elif isinstance(json_data, bytes):
+            self._raw_json = json_data
+            self._data = None
+        elif isinstance(json_data, basestring):
+            self._raw_json = json_data.encode("utf-8")
+            self._data = None
+        else:
+            raise TypeError(
+                "'json_data' must be a dictionary or valid JSON string; "
+                "received: {!r}".format(json_data)
+            )
+
+    @property
+    def decoded(self):
+        """Whether the object's JSON text has been decoded."""
+        return self._data is not None
+
+    @property
+    def data(self):
+        """The data object (the JSON text is decoded on first access)."""
+        data = self._data
+        if data is None:
+            data = self._data = self._object_factory(
+                self._model, json_dict(self._raw_json, codec=self._codec),
+            )
+        return data
+
+    @property
+    def raw_json(self):
+        """The object's JSON text (bytes), as it was received."""
+        if self._raw_json is None:
+            codec = self._codec or StdlibJSONCodec()
+            self._raw_json = codec.dumps(self._data.to_dict())
+        return self._raw_json
+
+    def __getattr__(self, item):
+        """Provide attribute access to the (decoded) data object."""
+        if item in LazyData.__slots__:
+            # The slot has not been set (for example, while unpickling)
+            raise AttributeError(item)
+        return getattr(self.data, item)
+
+    def __getstate__(self):
+        return self._model, self.raw_json, self._object_factory, self._codec
+
+    def __setstate__(self, state):
+        self._model, self._raw_json, self._object_factory, self._codec = state
+        self._data = None
+
+    def __str__(self):
+        """A human-readable string representation of this object."""
+        return str(self.data)
+
+    def __repr__(self):
+        """A string representing this object."""
+        return "{}({!r}, {!r})".format(
+            self.__class__.__name__, self._model, self.raw_json,
+        )
+
+    def __eq__(self, other):
+        """Determine if two objects are equal."""
+        if not isinstance(other, LazyData):
+            return False
+        if self._raw_json is not None and self._raw_json == other._raw_json:
+            return True
+        return self.data == other.data
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        """Hash the (decoded) data object."""
+        return hash(self.data)
+
+    def to_dict(self):
+        """Convert the Webex Teams object data to a dictionary."""
+        return self.data.to_dict()
+
+    def to_json(self, **kwargs):
+        """Convert the Webex Teams object data to JSON.
+
+        Without keyword arguments, the object's JSON text is returned as it
+        was received (decoded from UTF-8, but not re-encoded).  Any keyword
+        arguments provided are passed through the Python JSON encoder.
+
+        """
+        if kwargs:
+            return self.data.to_json(**kwargs)
+        return self.raw_json.decode("utf-8")
+
+
+class LazyDataFactory(object):
+    """Factory for creating LazyData objects.
+
+    A :class:`WebexTeamsAPI` using a LazyDataFactory as its `object_factory`
+    does not decode the objects of the pages returned by list methods; each
+    object keeps its raw JSON text, and is decoded on first attribute access.
+
+    """
+
+    raw_json = True
+    """Pass the raw JSON text of the objects of list pages to the factory."""
+
+    def __init__(self, object_factory=immutable_data_factory, codec=None):
+        """Init a new LazyDataFactory.
+
+        Args:
+            object_factory(callable): The factory function used to create the
+                data objects when they are decoded.
+            codec(JSONCodec, basestring): The JSON codec (or codec name; see
+                :func:`get_json_codec`) used to decode the objects.  Defaults
+                to the standard library codec.
+
+        """
+        check_type(codec, (basestring, JSONCodec), optional=True)
+
+        self.object_factory = object_factory
+        self.codec = get_json_codec(codec) if codec is not None else None
+
+    def __call__(self, model, json_data):
+        """Create a LazyData object.
+
+        Args:
+            model(basestring): The data model of the object (message, room,
+                membership, etc.).
+            json_data(bytes, basestring, dict): The raw JSON text of the
+                object, or a dictionary.
+
+        Returns:
+            LazyData: The created LazyData object.
+
+        Raises:
+            TypeError: If the json_data is not JSON text or a dictionary.
+
+        """
+        return LazyData(model, json_data, self.object_factory, self.codec)
+
+    def __repr__(self):
+        return "<{}(object_factory={!r}, codec={!r})>".format(
+            self.__class__.__name__, self.object_factory, self.codec,
+        )
+
+
+lazy_data_factory = LazyDataFactory()
@@ -32,8 +32,6 @@ from __future__ import (
 
 from builtins import *
 
-from webexteamssdk.utils import WebexTeamsDateTime
-
 
 class AdminAuditEventDataBasicPropertiesMixin(object):
     """Admin Audit Event Data basic properties."""
@@ -135,8 +133,4 @@ class AdminAuditEventBasicPropertiesMixin(object):
     @property
     def created(self):
         """The date and time the event took place."""
-        created = self._json_data.get('created')
-        if created:
-            return WebexTeamsDateTime.strptime(created)
-        else:
-            return None
+        return self._datetime('created')
@@ -32,8 +32,6 @@ from __future__ import (
 
 from builtins import *
 
-from webexteamssdk.utils import WebexTeamsDateTime
-
 
 class AttachmentActionBasicPropertiesMixin(object):
     """Attachment Action basic properties."""
@@ -75,8 +73,4 @@ class AttachmentActionBasicPropertiesMixin(object):
     @property
     def created(self):
         """The date and time the action was created."""
-        created = self._json_data.get('created')
-        if created:
-            return WebexTeamsDateTime.strptime(created)
-        else:
-            return None
+        return self._datetime('created')
@@ -32,8 +32,6 @@ from __future__ import (
 
 from builtins import *
 
-from webexteamssdk.utils import WebexTeamsDateTime
-
 
 class EventBasicPropertiesMixin(object):
     """Event basic properties."""
@@ -82,8 +80,4 @@ class EventBasicPropertiesMixin(object):
     @property
     def created(self):
         """The date and time of the event."""
-        created = self._json_data.get('created')
-        if created:
-            return WebexTeamsDateTime.strptime(created)
-        else:
-            return None
+        return self._datetime('created')
@@ -34,8 +34,6 @@ from builtins import *
 
 import warnings
 
-from webexteamssdk.utils import WebexTeamsDateTime
-
 
 class MembershipBasicPropertiesMixin(object):
     """Membership basic properties."""
@@ -87,8 +85,4 @@ class MembershipBasicPropertiesMixin(object):
     @property
     def created(self):
         """The date and time when the membership was created."""
-        created = self._json_data.get('created')
-        if created:
-            return WebexTeamsDateTime.strptime(created)
-        else:
-            return None
+        return self._datetime('created')
@@ -32,8 +32,6 @@ from __future__ import (
 
 from builtins import *
 
-from webexteamssdk.utils import WebexTeamsDateTime
-
 
 class MessageBasicPropertiesMixin(object):
     """Message basic properties."""
@@ -124,17 +122,9 @@ class MessageBasicPropertiesMixin(object):
     @property
     def created(self):
         """The date and time the message was created."""
-        created = self._json_data.get("created")
-        if created:
-            return WebexTeamsDateTime.strptime(created)
-        else:
-            return None
+        return self._datetime("created")
 
     @property
     def updated(self):
         """The date and time the message was created."""
-        created = self._json_data.get("updated")
-        if created:
-            return WebexTeamsDateTime.strptime(created)
-        else:
-            return None
+        return self._datetime("updated")
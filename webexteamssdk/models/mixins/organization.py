@@ -32,8 +32,6 @@ from __future__ import (
 
 from builtins import *
 
-from webexteamssdk.utils import WebexTeamsDateTime
-
 
 class OrganizationBasicPropertiesMixin(object):
     """Organization basic properties."""
@@ -51,8 +49,4 @@ class OrganizationBasicPropertiesMixin(object):
     @property
     def created(self):
         """The date and time the organization was created."""
-        created = self._json_data.get('created')
-        if created:
-            return WebexTeamsDateTime.strptime(created)
-        else:
-            return None
+        return self._datetime('created')
@@ -32,8 +32,6 @@ from __future__ import (
 
 from builtins import *
 
-from webexteamssdk.utils import WebexTeamsDateTime
-
 
 class PersonBasicPropertiesMixin(object):
     """Person basic properties."""
@@ -100,20 +98,12 @@ class PersonBasicPropertiesMixin(object):
     @property
     def created(self):
         """The date and time the person was created."""
-        created = self._json_data.get("created")
-        if created:
-            return WebexTeamsDateTime.strptime(created)
-        else:
-            return None
+        return self._datetime("created")
 
     @property
     def lastModified(self):
         """The date and time the person was last changed."""
-        last_modified = self._json_data.get("lastModified")
-        if last_modified:
-            return WebexTeamsDateTime.strptime(last_modified)
-        else:
-            return None
+        return self._datetime("lastModified")
 
     @property
     def timezone(self):
@@ -128,11 +118,7 @@ class PersonBasicPropertiesMixin(object):
     def lastActivity(self):
         """The date and time of the person"s last activity within Webex
         Teams. """
-        last_activity = self._json_data.get("lastActivity")
-        if last_activity:
-            return WebexTeamsDateTime.strptime(last_activity)
-        else:
-            return None
+        return self._datetime("lastActivity")
 
     @property
     def status(self):
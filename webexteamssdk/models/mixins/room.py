@@ -32,8 +32,6 @@ from __future__ import (
 
 from builtins import *
 
-from webexteamssdk.utils import WebexTeamsDateTime
-
 
 class RoomBasicPropertiesMixin(object):
     """Room basic properties."""
@@ -72,11 +70,7 @@ class RoomBasicPropertiesMixin(object):
     @property
     def lastActivity(self):
         """The date and time of the room"s last activity."""
-        last_activity = self._json_data.get("lastActivity")
-        if last_activity:
-            return WebexTeamsDateTime.strptime(last_activity)
-        else:
-            return None
+        return self._datetime("lastActivity")
 
     @property
     def creatorId(self):
@@ -86,11 +80,7 @@ class RoomBasicPropertiesMixin(object):
     @property
     def created(self):
         """The date and time the room was created."""
-        created = self._json_data.get("created")
-        if created:
-            return WebexTeamsDateTime.strptime(created)
-        else:
-            return None
+        return self._datetime("created")
 
     @property
     def ownerId(self):
@@ -32,8 +32,6 @@ from __future__ import (
 
 from builtins import *
 
-from webexteamssdk.utils import WebexTeamsDateTime
-
 
 class TeamBasicPropertiesMixin(object):
     """Team basic properties."""
@@ -56,8 +54,4 @@ class TeamBasicPropertiesMixin(object):
     @property
     def created(self):
         """The date and time the team was created."""
-        created = self._json_data.get('created')
-        if created:
-            return WebexTeamsDateTime.strptime(created)
-        else:
-            return None
+        return self._datetime('created')
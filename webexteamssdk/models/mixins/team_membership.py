@@ -32,8 +32,6 @@ from __future__ import (
 
 from builtins import *
 
-from webexteamssdk.utils import WebexTeamsDateTime
-
 
 class TeamMembershipBasicPropertiesMixin(object):
     """Team Membership basic properties."""
@@ -76,8 +74,4 @@ class TeamMembershipBasicPropertiesMixin(object):
     @property
     def created(self):
         """The date and time when the team membership was created."""
-        created = self._json_data.get('created')
-        if created:
-            return WebexTeamsDateTime.strptime(created)
-        else:
-            return None
+        return self._datetime('created')
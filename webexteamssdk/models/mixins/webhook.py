@@ -32,8 +32,6 @@ from __future__ import (
 
 from builtins import *
 
-from webexteamssdk.utils import WebexTeamsDateTime
-
 
 class WebhookBasicPropertiesMixin(object):
     """Webhook basic properties."""
@@ -133,8 +131,4 @@ class WebhookBasicPropertiesMixin(object):
     @property
     def created(self):
         """The date and time the webhook was created."""
-        created = self._json_data.get('created')
-        if created:
-            return WebexTeamsDateTime.strptime(created)
-        else:
-            return None
+        return self._datetime('created')
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Adaptive page-size tuning for paginated Webex Teams API requests.
+
+Classes:
+    AdaptivePageSize: Tunes the page size of a crawl to its latency.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import logging
+
+import requests
+
+from .exceptions import ApiError, RateLimitError
+from .utils import check_type
+
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptivePageSize(object):
+    """Tunes the page size (`max`) of a crawl to its observed latency.
+
+    The crawl starts at the request's page size.  While the time per item of
+    full pages keeps improving (by more than `tolerance`), the page size is
+    multiplied by `growth`, up to `ceiling`; once it stops improving, the
+    page size settles at the best size observed.  When a page request times
+    out or fails with a 5xx response (or with a 400 response, after the page
+    size was raised), the page size is halved, capped there, and the page is
+    requested again, up to `max_backoffs` times per crawl.
+
+    """
+
+    def __init__(self, initial, ceiling, floor=1, growth=2.0, tolerance=0.1,
+                 max_backoffs=3):
+        """Init a new AdaptivePageSize.
+
+        Args:
+            initial(int): The page size of the first page.
+            ceiling(int): The largest page size requested.
+            floor(int): The smallest page size requested when backing off.
+            growth(int, float): The factor the page size is raised by.
+            tolerance(float): The relative improvement of the time per item
+                required to keep raising the page size.
+            max_backoffs(int): The number of times a crawl backs off (and
+                retries a page) before the error is raised.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If the sizes or factors are out of range.
+
+        """
+        check_type(initial, int)
+        check_type(ceiling, int)
+        check_type(floor, int)
+        check_type(growth, (int, float))
+        check_type(tolerance, (int, float))
+        check_type(max_backoffs, int)
+        if not 1 <= floor <= initial:
+            raise ValueError("The page sizes must satisfy "
+                             "1 <= floor <= initial.")
+        if growth <= 1:
+            raise ValueError("growth must be greater than 1.")
+        if not 0 <= tolerance < 1:
+            raise ValueError("tolerance must be in [0, 1).")
+
+        super(AdaptivePageSize, self).__init__()
+        self.initial = initial
+        self.ceiling = max(ceiling, initial)
+        self.floor = floor
+        self.growth = growth
+        self.tolerance = tolerance
+        self.max_backoffs = max_backoffs
+
+        self.page_size = initial
+        self.settled = self.page_size >= self.ceiling
+        self.backoffs = 0
+        self._best_size = None
+        self._best_latency = None
+
+    def __repr__(self):
+        return "<{}(page_size={}, ceiling={}, settled={})>".format(
+            self.__class__.__name__, self.page_size, self.ceiling,
+            self.settled,
+        )
+
+    def record(self, page_size, items, elapsed):
+        """Record the latency of a page; adjust the page size.
+
+        Args:
+            page_size(int): The page size requested.
+            items(int): The number of items received.
+            elapsed(float): The duration (seconds) of the page's HTTP
+                exchange, excluding rate-limit waits and retry backoffs.
+
+        """
+        if self.settled or items < page_size or items == 0:
+            # Short pages (the last page) say nothing about the page size
+            return
+
+        latency = elapsed / items
+        if self._best_latency is None \
+                or latency < self._best_latency * (1 - self.tolerance):
+            self._best_size, self._best_latency = page_size, latency
+            self._resize(min(self.ceiling, int(page_size * self.growth)))
+            self.settled = self.page_size >= self.ceiling
+        else:
+            self._resize(self._best_size)
+            self.settled = True
+
+    def back_off(self, error):
+        """Reduce the page size after a failed page request.
+
+        Args:
+            error(Exception): The error raised by the page request.
+
+        Returns:
+            bool: True if the page should be requested again (with the
+                reduced page size); False if the error should be raised.
+
+        """
+        if isinstance(error, requests.exceptions.Timeout):
+            pass
+        elif isinstance(error, ApiError) \
+                and not isinstance(error, RateLimitError) \
+                and (error.status_code >= 500
+                     or (error.status_code == 400
+                         and self.page_size > self.initial)):
+            pass
+        else:
+            return False
+
+        if self.backoffs >= self.max_backoffs or self.page_size <= self.floor:
+            return False
+
+        self.backoffs += 1
+        self.ceiling = max(self.floor, self.page_size // 2)
+        self._resize(self.ceiling)
+        self.settled = True
+        return True
+
+    def _resize(self, page_size):
+        if page_size != self.page_size:
+            logger.debug("Adaptive page size: %s -> %s",
+                         self.page_size, page_size)
+        self.page_size = page_size
@@ -0,0 +1,588 @@
+# -*- coding: utf-8 -*-
+"""Client-side rate limiting for Webex Teams API requests.
+
+Classes:
+    TokenBucket: A token bucket metering requests at a steady rate.
+    RateLimiterBackend: Base class for rate-limiter state backends.
+    InProcessBackend: Shares rate-limiter state within a process.
+    FileLockBackend: Shares rate-limiter state between processes on a host.
+    RedisBackend: Shares rate-limiter state between hosts using Redis.
+    RateLimiter: Paces the requests made by a session.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import json
+import os
+import socket
+import threading
+import time
+
+from past.builtins import basestring
+
+from .exceptions import RateLimiterBackendError
+from .utils import check_type, to_bytes, to_unicode
+
+
+# The key of the bucket shared by all endpoints
+GLOBAL_BUCKET = "*"
+
+
+class TokenBucket(object):
+    """A token bucket metering requests at a steady rate.
+
+    The bucket holds up to `burst` tokens and is refilled at `rate` tokens per
+    second.  Each request takes a token; when the bucket is empty, requests
+    reserve future tokens and are told how long to wait for them.
+
+    """
+
+    def __init__(self, rate, burst=None):
+        """Init a new TokenBucket.
+
+        Args:
+            rate(int, float): The number of requests permitted per second.
+            burst(int): The maximum number of requests that may be made
+                back-to-back.  Defaults to one second's worth of requests
+                (minimum 1).
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `rate` or `burst` are not positive.
+
+        """
+        check_type(rate, (int, float))
+        check_type(burst, int, optional=True)
+        if rate <= 0:
+            raise ValueError("rate must be a positive number")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be a positive integer")
+
+        super(TokenBucket, self).__init__()
+
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, int(rate))
+
+    def reserve(self, tokens, updated, now):
+        """Take a token from a bucket state.
+
+        Args:
+            tokens(float): The tokens in the bucket when it was last updated
+                (may be negative when future tokens have been reserved).
+            updated(float): The time the bucket was last updated.
+            now(float): The current time.
+
+        Returns:
+            tuple: The new (tokens, updated) bucket state, and the time
+            (seconds) the caller must wait for its token.
+
+        """
+        if updated is None:
+            tokens = float(self.burst)
+        else:
+            tokens = min(float(self.burst),
+                         tokens + (now - updated) * self.rate)
+
+        tokens -= 1
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        return (tokens, now), wait
+
+
+class RateLimiterBackend(object):
+    """Base class for rate-limiter state backends.
+
+    A backend stores the token bucket states and the pause gate deadline of a
+    :class:`RateLimiter`, and updates them atomically.  Rate limiters that
+    share a backend (and the same backend location) share a request budget
+    and a `Retry-After` deadline.
+
+    Subclasses implement :meth:`reserve`, :meth:`pause` and
+    :meth:`pause_remaining`.
+
+    """
+
+    @staticmethod
+    def _take(buckets, states, now):
+        """Take a token from each bucket.
+
+        Args:
+            buckets(dict): The TokenBuckets, keyed by bucket key.
+            states(dict): The current (tokens, updated) bucket states, keyed by
+                bucket key.
+            now(float): The current time.
+
+        Returns:
+            tuple: The new bucket states (dict), and the time (seconds) to wait
+            for the tokens.
+
+        """
+        new_states = {}
+        wait = 0.0
+        for key, bucket in buckets.items():
+            tokens, updated = states.get(key) or (None, None)
+            new_states[key], bucket_wait = bucket.reserve(tokens, updated, now)
+            wait = max(wait, bucket_wait)
+        return new_states, wait
+
+    def reserve(self, buckets):
+        """Take a token from each bucket; return the time to wait for them.
+
+        The returned wait includes any time remaining on the pause gate.
+
+        """
+        raise NotImplementedError
+
+    def pause(self, seconds):
+        """Extend the pause gate deadline to `seconds` from now."""
+        raise NotImplementedError
+
+    def pause_remaining(self):
+        """The time (seconds) remaining until the pause gate opens."""
+        raise NotImplementedError
+
+
+class InProcessBackend(RateLimiterBackend):
+    """Shares rate-limiter state between the threads of a process."""
+
+    def __init__(self):
+        super(InProcessBackend, self).__init__()
+        self._lock = threading.Lock()
+        self._states = {}
+        self._paused_until = 0.0
+
+    def reserve(self, buckets):
+        now = time.time()
+        with self._lock:
+            new_states, wait = self._take(buckets, self._states, now)
+            self._states.update(new_states)
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds):
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.time() + seconds)
+
+    def pause_remaining(self):
+        return max(0.0, self._paused_until - time.time())
+
+
+class FileLockBackend(RateLimiterBackend):
+    """Shares rate-limiter state between the processes on a host.
+
+    The state is kept in a small JSON file, updated under an exclusive
+    `fcntl` file lock; place the file on a memory-backed filesystem (such as
+    /dev/shm) to keep the updates in shared memory.  Available on POSIX
+    platforms.
+
+    """
+
+    def __init__(self, path):
+        """Init a new FileLockBackend.
+
+        Args:
+            path(basestring): The path of the state file.  The file is created
+                if it doesn't exist.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            RateLimiterBackendError: If file locking isn't supported on this
+                platform.
+
+        """
+        check_type(path, basestring)
+
+        try:
+            import fcntl
+        except ImportError:
+            raise RateLimiterBackendError(
+                "FileLockBackend requires fcntl file locking (POSIX)."
+            )
+
+        super(FileLockBackend, self).__init__()
+
+        self._fcntl = fcntl
+        self.path = path
+
+    def _update(self, update):
+        """Apply an update function to the state, under the file lock."""
+        with open(self.path, "a+") as state_file:
+            self._fcntl.flock(state_file, self._fcntl.LOCK_EX)
+            try:
+                state_file.seek(0)
+                content = state_file.read()
+                state = json.loads(content) if content else {}
+                result = update(state, time.time())
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(json.dumps(state))
+                state_file.flush()
+                return result
+            finally:
+                self._fcntl.flock(state_file, self._fcntl.LOCK_UN)
+
+    def reserve(self, buckets):
+        def update(state, now):
+            states = state.setdefault("buckets", {})
+            new_states, wait = self._take(buckets, states, now)
+            states.update(new_states)
+            return max(wait, state.get("paused_until", 0.0) - now)
+
+        return self._update(update)
+
+    def pause(self, seconds):
+        def update(state, now):
+            state["paused_until"] = max(state.get("paused_until", 0.0),
+                                        now + seconds)
+
+        self._update(update)
+
+    def pause_remaining(self):
+        return self._update(
+            lambda state, now: max(0.0, state.get("paused_until", 0.0) - now)
+        )
+
+
+class _RedisConnection(object):
+    """A minimal Redis Serialization Protocol (RESP) client connection."""
+
+    def __init__(self, host, port, socket_timeout=None):
+        self.pid = os.getpid()
+        self._socket = socket.create_connection((host, port), socket_timeout)
+        self._file = self._socket.makefile("rb")
+
+    def close(self):
+        self._file.close()
+        self._socket.close()
+
+    def send(self, *commands):
+        """Send one or more (pipelined) commands."""
+        buffer = []
+        for command in commands:
+            buffer.append(b"*" + to_bytes(str(len(command))) + b"\r\n")
+            for argument in command:
+                argument = to_bytes(str(argument))
+                buffer.append(b"$" + to_bytes(str(len(argument))) + b"\r\n")
+                buffer.append(argument + b"\r\n")
+        self._socket.sendall(b"".join(buffer))
+
+    def read_reply(self):
+        """Read and decode a reply."""
+        line = self._file.readline()
+        if not line.endswith(b"\r\n"):
+            raise RateLimiterBackendError("Connection closed by Redis server.")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return to_unicode(payload)
+        elif kind == b"-":
+            raise RateLimiterBackendError(
+                "Redis error: " + to_unicode(payload)
+            )
+        elif kind == b":":
+            return int(payload)
+        elif kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._file.read(length + 2)
+            return to_unicode(data[:-2])
+        elif kind == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [self.read_reply() for _ in range(length)]
+        else:
+            raise RateLimiterBackendError(
+                "Unexpected reply from Redis server: {!r}".format(line)
+            )
+
+    def execute(self, *command):
+        """Send a command and return its reply."""
+        self.send(command)
+        return self.read_reply()
+
+
+class RedisBackend(RateLimiterBackend):
+    """Shares rate-limiter state between hosts using a Redis server.
+
+    Speaks the Redis protocol directly (no Redis client library is required).
+    Bucket states are updated with optimistic WATCH / MULTI / EXEC
+    transactions, and timestamps are taken from the Redis server clock, so the
+    hosts sharing the state do not need synchronized clocks.
+
+    """
+
+    def __init__(self, host="localhost", port=6379, db=0, password=None,
+                 key_prefix="webexteamssdk:ratelimit:", socket_timeout=5,
+                 max_attempts=25):
+        """Init a new RedisBackend.
+
+        Args:
+            host(basestring): The Redis server host.
+            port(int): The Redis server port.
+            db(int): The Redis database number.
+            password(basestring): Optional Redis password.
+            key_prefix(basestring): Prefix for the Redis keys holding the
+                rate-limiter state.  Rate limiters using the same prefix share
+                a request budget.
+            socket_timeout(int, float): Socket timeout (seconds).
+            max_attempts(int): The maximum number of attempts for a state
+                update before giving up under contention.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(host, basestring)
+        check_type(port, int)
+        check_type(db, int)
+        check_type(password, basestring, optional=True)
+        check_type(key_prefix, basestring)
+        check_type(socket_timeout, (int, float), optional=True)
+        check_type(max_attempts, int)
+
+        super(RedisBackend, self).__init__()
+
+        self.host = host
+        self.port = port
+        self.db = db
+        self.key_prefix = key_prefix
+        self._password = password
+        self._socket_timeout = socket_timeout
+        self._max_attempts = max_attempts
+        self._local = threading.local()
+
+    def _connection(self):
+        """Return this thread's connection, (re)connecting as needed."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and connection.pid == os.getpid():
+            return connection
+
+        # Connect; also reconnect in a forked process (for example, a
+        # pre-fork server worker) rather than sharing the parent's socket.
+        connection = _RedisConnection(self.host, self.port,
+                                      self._socket_timeout)
+        if self._password:
+            connection.execute("AUTH", self._password)
+        if self.db:
+            connection.execute("SELECT", self.db)
+        self._local.connection = connection
+        return connection
+
+    def _transaction(self, keys, update):
+        """Atomically update the values stored at `keys`.
+
+        Args:
+            keys(list): The Redis keys to be read and updated.
+            update(func): Called with the current values (dict keyed by
+                Redis key) and the server time; returns a tuple of the new
+                values (dict keyed by Redis key, values may be None to leave
+                the key unchanged) and the transaction result.
+
+        Returns:
+            The result of the update function from the successful attempt.
+
+        Raises:
+            RateLimiterBackendError: If the Redis server returns an error, the
+                connection fails, or the update doesn't succeed within
+                `max_attempts` attempts.
+
+        """
+        try:
+            connection = self._connection()
+            for _ in range(self._max_attempts):
+                connection.send(["WATCH"] + keys, ["MGET"] + keys, ["TIME"])
+                connection.read_reply()
+                values = dict(zip(keys, connection.read_reply()))
+                seconds, microseconds = connection.read_reply()
+                now = int(seconds) + int(microseconds) / 1e6
+
+                new_values, result = update(values, now)
+                commands = [["MULTI"]]
+                for key, (value, ttl) in new_values.items():
+                    commands.append(
+                        ["SET", key, value, "PX", max(1, int(ttl * 1000))]
+                    )
+                commands.append(["EXEC"])
+                connection.send(*commands)
+                replies = [connection.read_reply() for _ in commands]
+                if replies[-1] is not None:
+                    return result
+
+        except (socket.error, RateLimiterBackendError):
+            connection = getattr(self._local, "connection", None)
+            if connection is not None:
+                connection.close()
+                self._local.connection = None
+            raise
+
+        raise RateLimiterBackendError(
+            "Unable to update the rate-limiter state in Redis after {} "
+            "attempts.".format(self._max_attempts)
+        )
+
+    def _pause_key(self):
+        return self.key_prefix + "paused_until"
+
+    def reserve(self, buckets):
+        bucket_keys = {self.key_prefix + key: key for key in buckets}
+        pause_key = self._pause_key()
+
+        def update(values, now):
+            states = {}
+            for redis_key, key in bucket_keys.items():
+                if values.get(redis_key):
+                    tokens, updated = values[redis_key].split()
+                    states[key] = (float(tokens), float(updated))
+            new_states, wait = self._take(buckets, states, now)
+
+            new_values = {}
+            for redis_key, key in bucket_keys.items():
+                tokens, updated = new_states[key]
+                # Expire idle buckets once they would have refilled
+                bucket = buckets[key]
+                ttl = (bucket.burst - tokens) / bucket.rate + 1
+                new_values[redis_key] = ("{!r} {!r}".format(tokens, updated),
+                                         ttl)
+
+            paused_until = float(values.get(pause_key) or 0.0)
+            return new_values, max(wait, paused_until - now)
+
+        return self._transaction(list(bucket_keys) + [pause_key], update)
+
+    def pause(self, seconds):
+        pause_key = self._pause_key()
+
+        def update(values, now):
+            paused_until = max(float(values.get(pause_key) or 0.0),
+                               now + seconds)
+            return {pause_key: (repr(paused_until),
+                                paused_until - now + 1)}, None
+
+        self._transaction([pause_key], update)
+
+    def pause_remaining(self):
+        pause_key = self._pause_key()
+
+        def update(values, now):
+            paused_until = float(values.get(pause_key) or 0.0)
+            return {}, max(0.0, paused_until - now)
+
+        return self._transaction([pause_key], update)
+
+
+class RateLimiter(object):
+    """Paces the requests made by a session.
+
+    Every request takes a token from the global bucket and, when configured,
+    from the bucket of the endpoint it calls (the first path segment of the
+    API endpoint URL; for example "messages", "people" or "telephony").  The
+    limiter also provides a global pause gate: when any request receives a
+    `Retry-After`, every request made through the limiter is held until the
+    `Retry-After` period has elapsed.
+
+    A single RateLimiter is safe to share between threads, and between
+    sessions that should share a request budget.  To share a request budget
+    between processes or hosts, give each process's RateLimiter the same
+    limits and a :class:`FileLockBackend` (processes on one host) or
+    :class:`RedisBackend` (several hosts) pointing at the same location.
+
+    """
+
+    def __init__(self, rate=None, burst=None, endpoint_rates=None,
+                 backend=None):
+        """Init a new RateLimiter.
+
+        Args:
+            rate(int, float): The number of requests permitted per second,
+                across all endpoints.  `None` disables the global bucket; the
+                limiter then applies the endpoint buckets and pause gate only.
+            burst(int): The global bucket's burst capacity.
+            endpoint_rates(dict): Per-endpoint limits, keyed by endpoint name.
+                Values are a rate, or a (rate, burst) tuple.
+            backend(RateLimiterBackend): Where the rate-limiter state is kept.
+                Defaults to a new :class:`InProcessBackend`.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If a rate or burst value is not positive.
+
+        """
+        check_type(rate, (int, float), optional=True)
+        check_type(endpoint_rates, dict, optional=True)
+        check_type(backend, RateLimiterBackend, optional=True)
+
+        super(RateLimiter, self).__init__()
+
+        self._buckets = {}
+        if rate is not None:
+            self._buckets[GLOBAL_BUCKET] = TokenBucket(rate, burst)
+        for endpoint, endpoint_rate in (endpoint_rates or {}).items():
+            if isinstance(endpoint_rate, tuple):
+                self._buckets[endpoint] = TokenBucket(*endpoint_rate)
+            else:
+                self._buckets[endpoint] = TokenBucket(endpoint_rate)
+
+        self.backend = backend if backend is not None else InProcessBackend()
+
+    def reserve(self, endpoint=None):
+        """Reserve a request slot.
+
+        Args:
+            endpoint(basestring): The name of the endpoint to be called.
+
+        Returns:
+            float: The time (seconds) the caller must wait before making the
+            request.
+
+        """
+        buckets = {
+            key: self._buckets[key]
+            for key in (GLOBAL_BUCKET, endpoint) if key in self._buckets
+        }
+        return self.backend.reserve(buckets)
+
+    def pause_remaining(self):
+        """The time (seconds) remaining until the pause gate opens."""
+        return self.backend.pause_remaining()
+
+    def pause(self, seconds):
+        """Hold all requests for the provided number of seconds.
+
+        Extends (never shortens) the current pause.
+
+        """
+        self.backend.pause(seconds)
+
+    def acquire(self, endpoint=None):
+        """Block until a request to the endpoint may be made."""
+        wait = self.reserve(endpoint)
+        while wait > 0:
+            time.sleep(wait)
+            wait = self.pause_remaining()
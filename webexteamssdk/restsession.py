@@ -35,22 +35,52 @@ from builtins import *
 from future import standard_library
 standard_library.install_aliases()
 
+import contextlib
+import copy
+import hashlib
 import json
 import logging
 import platform
+import queue
+import socket
 import sys
+import threading
 import time
 import urllib
 import urllib.parse
 import warnings
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ThreadPoolExecutor, wait,
+)
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 import requests
 from past.builtins import basestring
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 
 from ._metadata import __title__, __version__
-from .config import DEFAULT_SINGLE_REQUEST_TIMEOUT, DEFAULT_WAIT_ON_RATE_LIMIT
-from .exceptions import MalformedResponse, RateLimitError, RateLimitWarning
+from .cache import EntityCache
+from .checkpoints import PaginationCheckpoint
+from .config import (
+    DEFAULT_COALESCE_GETS, DEFAULT_JSON_CODEC, DEFAULT_POOL_BLOCK,
+    DEFAULT_POOL_CONNECTIONS, DEFAULT_PARALLEL_CONCURRENCY,
+    DEFAULT_POOL_MAXSIZE, DEFAULT_PREFETCH,
+    DEFAULT_SINGLE_REQUEST_TIMEOUT, DEFAULT_WAIT_ON_RATE_LIMIT,
+    DEFAULT_MAX_PAGE_SIZE, MAX_PAGE_SIZES,
+)
+from .deadline import Deadline
+from .exceptions import (
+    ApiError, DeadlineExceededError, MalformedResponse, RateLimitError,
+    RateLimitWarning,
+)
+from .hooks import RequestEvent, RequestHooks
+from .json_codec import get_json_codec, split_json_page
+from .metrics import MetricsRegistry, endpoint_template
+from .page_size import AdaptivePageSize
+from .ratelimit import RateLimiter
 from .response_codes import EXPECTED_RESPONSE_CODE
+from .retry import RetryPolicy
 from .utils import (
     check_response_code, check_type, extract_and_parse_json, validate_base_url,
 )
@@ -103,6 +133,170 @@ def _fix_next_url(next_url):
     return urllib.parse.urlunparse(parsed_url)
 
 
+def _set_url_param(url, name, value):
+    """Set (or replace) a query parameter of a URL."""
+    parsed_url = urllib.parse.urlparse(url)
+    query = [
+        (key, query_value) for key, query_value
+        in urllib.parse.parse_qsl(parsed_url.query, keep_blank_values=True)
+        if key != name
+    ]
+    query.append((name, str(value)))
+    return urllib.parse.urlunparse(
+        parsed_url._replace(query=urllib.parse.urlencode(query))
+    )
+
+
+def _prefetch(iterator, depth):
+    """Consume an iterator on a background thread, `depth` items ahead.
+
+    The background thread buffers up to `depth` items from `iterator` while
+    the caller consumes the items already produced.  Exceptions raised by the
+    iterator are re-raised to the caller, in order.  When the returned
+    generator is closed (or garbage collected) before the iterator is
+    exhausted, the background thread stops once any in-flight item has been
+    produced and closes the iterator.
+
+    Args:
+        iterator: The iterator to be consumed.
+        depth(int): The maximum number of items buffered ahead of the caller.
+
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(entry):
+        # Wait for buffer space, giving up if the consumer has gone away
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterator:
+                if not put((True, item)):
+                    break
+            else:
+                put((False, None))
+        except Exception as e:
+            put((False, e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, name="webexteamssdk-prefetch")
+    thread.daemon = True
+    thread.start()
+
+    try:
+        while True:
+            has_item, item = buffer.get()
+            if has_item:
+                yield item
+            elif item is None:
+                break
+            else:
+                raise item
+    finally:
+        stopped.set()
+
+
+def _cached_response(cached, url, params):
+    """Rebuild a (404) response from its entity cache description."""
+    response = requests.Response()
+    response.status_code = cached["status_code"]
+    response.reason = cached["reason"]
+    response.headers.update(cached["headers"])
+    response._content = cached["content"].encode("utf-8")
+    response.encoding = "utf-8"
+    response.request = requests.Request("GET", url, params=params).prepare()
+    response.url = response.request.url
+    return response
+
+
+def _body_size(body):
+    """The size (bytes) of a request body (0 if unknown)."""
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, str)):
+        return len(body)
+    # Streamed bodies, such as MultipartEncoders, expose their length
+    size = getattr(body, "len", None)
+    return size if isinstance(size, int) else 0
+
+
+def _copy_error(error):
+    """A copy of an exception, without its traceback."""
+    copied = error.__class__.__new__(error.__class__)
+    copied.__dict__.update(getattr(error, "__dict__", {}))
+    copied.args = error.args
+    return copied
+
+
+def tcp_keepalive_socket_options(idle):
+    """Build socket options enabling TCP keep-alive probes.
+
+    Args:
+        idle(int): The time (seconds) a connection must be idle before TCP
+            keep-alive probes are sent.
+
+    Returns:
+        list: Socket options for the connections made by urllib3.
+
+    """
+    socket_options = list(HTTPConnection.default_socket_options)
+    socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+    # The idle-time option is named TCP_KEEPIDLE on Linux and TCP_KEEPALIVE
+    # on macOS; platforms without either keep their default idle time.
+    keepidle = getattr(socket, "TCP_KEEPIDLE",
+                       getattr(socket, "TCP_KEEPALIVE", None))
+    if keepidle is not None:
+        socket_options.append((socket.IPPROTO_TCP, keepidle, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        socket_options.append(
+            (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, idle // 4))
+        )
+
+    return socket_options
+
+
+class PoolingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies socket options to its pooled connections."""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["socket_options"]
+
+    def __init__(self, socket_options=None, **kwargs):
+        """Init a new PoolingHTTPAdapter.
+
+        Args:
+            socket_options(list): Socket options for new connections; None to
+                use the urllib3 defaults.
+            **kwargs: Passed on to requests.adapters.HTTPAdapter.
+
+        """
+        # HTTPAdapter.__init__() creates the pool manager
+        self.socket_options = socket_options
+        super(PoolingHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.socket_options is not None:
+            kwargs["socket_options"] = self.socket_options
+        super(PoolingHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        if self.socket_options is not None:
+            proxy_kwargs["socket_options"] = self.socket_options
+        return super(PoolingHTTPAdapter, self).proxy_manager_for(
+            proxy, **proxy_kwargs
+        )
+
+
 def user_agent(be_geo_id=None, caller=None):
     """Build a User-Agent HTTP header string."""
 
@@ -173,7 +367,18 @@ def user_agent(be_geo_id=None, caller=None):
 
 # Main module interface
 class RestSession(object):
-    """RESTful HTTP session class for making calls to the Webex Teams APIs."""
+    """RESTful HTTP session class for making calls to the Webex Teams APIs.
+
+    A RestSession is safe to share between threads.  Requests made by any
+    thread reuse the pooled (keep-alive) connections of the session, so TCP
+    and TLS connection setup costs are paid once per pooled connection.  When
+    a session is shared by many threads, size the connection pool
+    (`pool_maxsize`) to the number of concurrent requests; with the default
+    non-blocking pool, connections opened beyond `pool_maxsize` are closed
+    after use rather than returned to the pool ("Connection pool is full"
+    warnings).
+
+    """
 
     def __init__(self, access_token, base_url,
                  single_request_timeout=DEFAULT_SINGLE_REQUEST_TIMEOUT,
@@ -181,7 +386,20 @@ class RestSession(object):
                  proxies=None,
                  be_geo_id=None,
                  caller=None,
-                 disable_ssl_verify=False):
+                 disable_ssl_verify=False,
+                 rate_limiter=None,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 pool_block=DEFAULT_POOL_BLOCK,
+                 tcp_keepalive=None,
+                 json_codec=DEFAULT_JSON_CODEC,
+                 prefetch=DEFAULT_PREFETCH,
+                 raw_items=False,
+                 entity_cache=None,
+                 coalesce_gets=DEFAULT_COALESCE_GETS,
+                 retry_policy=None,
+                 metrics=None,
+                 hooks=None):
         """Initialize a new RestSession object.
 
         Args:
@@ -204,9 +422,50 @@ class RestSession(object):
             disable_ssl_verify(bool): Optional boolean flag to disable ssl
                 verification. Defaults to False. If set to true, the requests
                 session won't verify ssl certs anymore.
+            rate_limiter(RateLimiter): Optional client-side rate limiter used
+                to pace the requests made by this session.
+            pool_connections(int): The number of connection pools (one per
+                host) to cache.
+            pool_maxsize(int): The maximum number of connections kept in each
+                connection pool; set this to (at least) the number of threads
+                sharing the session.
+            pool_block(bool): Whether requests should wait for a pooled
+                connection to become available, rather than opening (and then
+                discarding) connections beyond `pool_maxsize`.
+            tcp_keepalive(int): Optional idle time (seconds) after which TCP
+                keep-alive probes are sent on pooled connections; keeps idle
+                connections open through NAT devices and load balancers.
+                Defaults to None (TCP keep-alive probes disabled).
+            json_codec(JSONCodec, basestring): The JSON codec (or codec name;
+                see :func:`get_json_codec`) used to parse response bodies and
+                encode JSON request bodies.
+            prefetch(int): The number of pages fetched ahead (on a background
+                thread) while the current page is consumed, when iterating
+                over paginated results.  Defaults to 0 (pages are fetched as
+                they are needed).
+            raw_items(bool): Do not decode the items of paginated results;
+                :meth:`get_items` yields the raw JSON text (:class:`RawJSON`)
+                of each item.
+            entity_cache(EntityCache): Optional cache of the responses of
+                get-by-id (`{resource}/{id}`) :meth:`get` requests; PUT,
+                PATCH and DELETE requests invalidate the cached responses of
+                the entity they address.
+            coalesce_gets(bool): Coalesce identical concurrent :meth:`get`
+                requests (same URL and parameters) into a single in-flight
+                request, whose result (or error) all the callers receive.
+                Defaults to webexteamssdk.config.DEFAULT_COALESCE_GETS
+                (False).
+            retry_policy(RetryPolicy): Optional policy retrying the requests
+                that fail with transport errors or (by default) 502, 503 or
+                504 responses.
+            metrics(MetricsRegistry): Optional registry recording the
+                per-endpoint metrics of the requests made by this session.
+            hooks(list): Optional :class:`RequestHooks` called as the
+                session's requests are made; see :meth:`add_hooks`.
 
         Raises:
             TypeError: If the parameter types are incorrect.
+            ValueError: If `prefetch` is negative.
 
         """
         check_type(access_token, basestring)
@@ -215,6 +474,22 @@ class RestSession(object):
         check_type(wait_on_rate_limit, bool)
         check_type(proxies, dict, optional=True)
         check_type(disable_ssl_verify, bool, optional=True)
+        check_type(rate_limiter, RateLimiter, optional=True)
+        check_type(pool_connections, int)
+        check_type(pool_maxsize, int)
+        check_type(pool_block, bool)
+        check_type(tcp_keepalive, int, optional=True)
+        check_type(prefetch, int)
+        check_type(raw_items, bool)
+        check_type(entity_cache, EntityCache, optional=True)
+        check_type(coalesce_gets, bool)
+        check_type(retry_policy, RetryPolicy, optional=True)
+        check_type(metrics, MetricsRegistry, optional=True)
+        check_type(hooks, list, optional=True)
+        for request_hooks in hooks or ():
+            check_type(request_hooks, RequestHooks)
+        if prefetch < 0:
+            raise ValueError("prefetch must be a non-negative integer")
 
         super(RestSession, self).__init__()
 
@@ -223,10 +498,35 @@ class RestSession(object):
         self._access_token = str(access_token)
         self._single_request_timeout = single_request_timeout
         self._wait_on_rate_limit = wait_on_rate_limit
+        self._rate_limiter = rate_limiter
+        self._json_codec = get_json_codec(json_codec)
+        self._prefetch = prefetch
+        self._raw_items = raw_items
+        self._entity_cache = entity_cache
+        self._coalesce_gets = coalesce_gets
+        self._retry_policy = retry_policy
+        self._metrics = metrics
+        self._hooks = tuple(hooks or ())
+        self._hooks_lock = threading.Lock()
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+        self._deadline_context = threading.local()
+        self._pagination_context = threading.local()
 
         # Initialize a new session
         self._req_session = requests.session()
 
+        # Configure the session's connection pools
+        adapter = PoolingHTTPAdapter(
+            socket_options=tcp_keepalive_socket_options(tcp_keepalive)
+            if tcp_keepalive else None,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._req_session.mount("https://", adapter)
+        self._req_session.mount("http://", adapter)
+
         # Disable ssl cert verification if chosen by user
         if disable_ssl_verify:
             self._req_session.verify = False
@@ -283,6 +583,130 @@ class RestSession(object):
         check_type(value, bool)
         self._wait_on_rate_limit = value
 
+    @property
+    def rate_limiter(self):
+        """The client-side rate limiter pacing this session's requests.
+
+        When a rate limiter is set, requests wait for a request slot before
+        they are sent, and a rate-limit response (and its `Retry-After`
+        period) holds every request made through the rate limiter, not only
+        the rate-limited one.
+
+        """
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value):
+        """Set or remove (None) the session's client-side rate limiter."""
+        check_type(value, RateLimiter, optional=True)
+        self._rate_limiter = value
+
+    @property
+    def prefetch(self):
+        """The number of pages fetched ahead when iterating over pages.
+
+        When greater than zero, the next pages of paginated results are
+        fetched on a background thread while the current page is consumed.
+
+        """
+        return self._prefetch
+
+    @prefetch.setter
+    def prefetch(self, value):
+        """Set the number of pages fetched ahead (0 to disable)."""
+        check_type(value, int)
+        if value < 0:
+            raise ValueError("prefetch must be a non-negative integer")
+        self._prefetch = value
+
+    @property
+    def raw_items(self):
+        """Whether the items of paginated results are left undecoded.
+
+        When True, :meth:`get_items` and :meth:`get_items_list` yield the raw
+        JSON text (:class:`RawJSON`) of each item, rather than dictionaries.
+
+        """
+        return self._raw_items
+
+    @raw_items.setter
+    def raw_items(self, value):
+        """Enable or disable raw (undecoded) items."""
+        check_type(value, bool)
+        self._raw_items = value
+
+    @property
+    def retry_policy(self):
+        """The policy retrying failed requests (None when disabled)."""
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, value):
+        """Set (or, with None, disable) the retry policy."""
+        check_type(value, RetryPolicy, optional=True)
+        self._retry_policy = value
+
+    @property
+    def metrics(self):
+        """The registry of request metrics (None when disabled)."""
+        return self._metrics
+
+    @property
+    def hooks(self):
+        """The registered request lifecycle hooks."""
+        return self._hooks
+
+    def add_hooks(self, hooks):
+        """Register request lifecycle hooks.
+
+        Args:
+            hooks(RequestHooks): The hooks to be called as the session's
+                requests are made.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(hooks, RequestHooks)
+        with self._hooks_lock:
+            self._hooks = self._hooks + (hooks,)
+
+    def remove_hooks(self, hooks):
+        """Unregister request lifecycle hooks."""
+        with self._hooks_lock:
+            self._hooks = tuple(registered for registered in self._hooks
+                                if registered is not hooks)
+
+    def _fire(self, hook_name, event):
+        """Call a hook of the registered hooks; log (and ignore) errors."""
+        for hooks in self._hooks:
+            try:
+                getattr(hooks, hook_name)(event)
+            except Exception:
+                logger.exception("Error in request hook %s.%s",
+                                 hooks.__class__.__name__, hook_name)
+
+    @property
+    def entity_cache(self):
+        """The cache of get-by-id responses (None when disabled)."""
+        return self._entity_cache
+
+    @property
+    def coalesce_gets(self):
+        """Whether identical concurrent GET requests are coalesced."""
+        return self._coalesce_gets
+
+    @coalesce_gets.setter
+    def coalesce_gets(self, value):
+        """Enable or disable the coalescing of concurrent GET requests."""
+        check_type(value, bool)
+        self._coalesce_gets = value
+
+    @property
+    def json_codec(self):
+        """The JSON codec used to parse and encode JSON data."""
+        return self._json_codec
+
     @property
     def headers(self):
         """The HTTP headers used for requests in this session."""
@@ -321,14 +745,117 @@ class RestSession(object):
             # url is already an absolute URL; return as is
             return url
 
+    def endpoint_name(self, url):
+        """Return the name of the API endpoint called by a URL.
+
+        The endpoint name is the first path segment following the base URL;
+        for example, "rooms" for https://webexapis.com/v1/rooms/<roomId>.
+
+        Args:
+            url(basestring): A relative or absolute URL.
+
+        Returns:
+            str: The endpoint name, or None if the URL is outside the base URL.
+
+        """
+        path = urllib.parse.urlparse(self.abs_url(url)).path
+        base_path = urllib.parse.urlparse(self.base_url).path
+        if not path.startswith(base_path):
+            return None
+        return path[len(base_path):].lstrip("/").split("/", 1)[0] or None
+
+    def _entity_url(self, url):
+        """Return the URL of the entity (`{resource}/{id}`) a URL addresses.
+
+        For example, https://webexapis.com/v1/rooms/<roomId> for both
+        rooms/<roomId> and rooms/<roomId>/meetingInfo.  Returns None for the
+        URLs that don't address an entity (such as people/me), and for the
+        URLs outside the base URL.
+
+        """
+        path = urllib.parse.urlparse(self.abs_url(url)).path
+        base_path = urllib.parse.urlparse(self.base_url).path
+        if not path.startswith(base_path):
+            return None
+        segments = path[len(base_path):].strip("/").split("/")
+        if len(segments) < 2 or not all(segments[:2]) \
+                or segments[1] == "me":
+            return None
+        return self.abs_url("/".join(segments[:2]))
+
+    def _cache_scope(self):
+        """The entity cache scope of the session: its access token's hash."""
+        return hashlib.sha256(
+            self.access_token.encode("utf-8")
+        ).hexdigest()
+
+    def endpoint_template(self, url):
+        """Return the templated endpoint of a URL, for metrics.
+
+        The templated endpoint is the URL's path following the base URL (or
+        its full path, for URLs outside the base URL), with its IDs
+        collapsed; for example, "rooms/{id}" for
+        https://webexapis.com/v1/rooms/<roomId>.
+
+        """
+        path = urllib.parse.urlparse(self.abs_url(url)).path
+        base_path = urllib.parse.urlparse(self.base_url).path
+        if path.startswith(base_path):
+            path = path[len(base_path):].lstrip("/")
+        return endpoint_template(path.rstrip("/"))
+
+    def _encode_json_body(self, kwargs):
+        """Encode a `json` request body with the session's JSON codec."""
+        if kwargs.get("json") is not None and kwargs.get("data") is None:
+            kwargs["data"] = self._json_codec.dumps(kwargs.pop("json"))
+        else:
+            kwargs.pop("json", None)
+
+    def _parse_json(self, response):
+        """Parse the JSON body of a response with the session's JSON codec."""
+        return extract_and_parse_json(response, codec=self._json_codec)
+
+    def _parse_page(self, response, raw=False):
+        """Parse a page of JSON data; see :func:`split_json_page` for `raw`."""
+        if self._metrics is None and not self._hooks:
+            return self._parse_page_content(response, raw)
+
+        endpoint = self.endpoint_template(response.url)
+        if self._metrics is not None:
+            self._metrics.record_page(response.request.method, endpoint)
+        if not self._hooks:
+            return self._parse_page_content(response, raw)
+
+        start_time = time.time()
+        started = time.monotonic()
+        page = self._parse_page_content(response, raw)
+        items = page if isinstance(page, list) else \
+            next((value for value in page.values()
+                  if isinstance(value, list)), None)
+        self._fire("on_page", RequestEvent(
+            response.request.method, response.url, endpoint,
+            start_time=start_time, elapsed=time.monotonic() - started,
+            status_code=response.status_code,
+            tracking_id=response.headers.get("trackingId"),
+            items=None if items is None else len(items),
+        ))
+        return page
+
+    def _parse_page_content(self, response, raw=False):
+        if raw:
+            return split_json_page(response.content, codec=self._json_codec)
+        return self._parse_json(response)
+
     def request(self, method, url, erc, **kwargs):
-        #print(method, url, erc, kwargs)
         """Abstract base method for making requests to the Webex Teams APIs.
 
         This base method:
             * Expands the API endpoint URL to an absolute URL
             * Makes the actual HTTP request to the API endpoint
             * Provides support for Webex Teams rate-limiting
+            * Retries failed requests, as permitted by the retry policy
+            * Bounds the request (including its retries and waits) by the
+              current deadline
             * Inspects response codes and raises exceptions as appropriate
 
         Args:
@@ -336,11 +863,17 @@ class RestSession(object):
             url(basestring): The URL of the API endpoint to be called.
             erc(int): The expected response code that should be returned by the
                 Webex Teams API endpoint to indicate success.
-            **kwargs: Passed on to the requests package.
+            **kwargs:
+                deadline(int, float, Deadline): An overall time budget
+                    (seconds) for the request, including its retries and
+                    rate-limit waits; see :meth:`deadline`.
+                others: Passed on to the requests package.
 
         Raises:
             ApiError: If anything other than the expected response code is
                 returned by the Webex Teams API endpoint.
+            DeadlineExceededError: If the deadline passes before a response
+                is received.
 
         """
         # Ensure the url is an absolute URL
@@ -348,28 +881,213 @@ class RestSession(object):
 
         # Update request kwargs with session defaults
         kwargs.setdefault("timeout", self.single_request_timeout)
+        self._encode_json_body(kwargs)
+        deadline = self._resolve_deadline(kwargs.pop("deadline", None))
+        timeout = kwargs["timeout"]
+
+        rate_limiter = self._rate_limiter
+        if rate_limiter is not None:
+            endpoint = self.endpoint_name(abs_url)
+
+        metrics = self._metrics
+        hooks = self._hooks
+        template = None
+        if metrics is not None or hooks:
+            template = self.endpoint_template(abs_url)
+        if metrics is not None:
+            request_bytes = _body_size(kwargs.get("data"))
+
+        # Write-through invalidation of the cached responses of the entity
+        invalidate = self._entity_cache is not None \
+            and method in ("PUT", "PATCH", "DELETE") \
+            and self._entity_url(abs_url)
+        if invalidate:
+            self._entity_cache.invalidate(invalidate, self._cache_scope())
+
+        retry_policy = self._retry_policy
+        if retry_policy is not None:
+            retry_policy.request_started()
+        attempts = 0
 
         while True:
+            # Wait for a request slot from the client-side rate limiter
+            if rate_limiter is not None:
+                started = time.monotonic()
+                wait = rate_limiter.reserve(endpoint)
+                while wait > 0:
+                    if hooks:
+                        self._fire("on_rate_limit_wait", RequestEvent(
+                            method, abs_url, template, attempt=attempts + 1,
+                            start_time=time.time(), wait=wait,
+                        ))
+                    self._sleep(wait, deadline)
+                    wait = rate_limiter.pause_remaining()
+                if metrics is not None:
+                    metrics.record_rate_limit_sleep(
+                        method, template, time.monotonic() - started,
+                    )
+
             # Make the HTTP request to the API endpoint
-            response = self._req_session.request(method, abs_url, **kwargs)
-            #print(abs_url, kwargs)
-            #print(response)  # see what response code specific API reponds with
+            attempts += 1
+            if deadline is not None:
+                kwargs["timeout"] = deadline.cap_timeout(timeout)
+            if hooks:
+                event = RequestEvent(method, abs_url, template,
+                                     attempt=attempts, start_time=time.time())
+                self._fire("before_request", event)
+            started = time.monotonic()
+            try:
+                response = self._req_session.request(method, abs_url,
+                                                     **kwargs)
+            except requests.exceptions.RequestException as e:
+                if hooks:
+                    event.elapsed = time.monotonic() - started
+                    event.error = e
+                    self._fire("after_response", event)
+                if metrics is not None:
+                    metrics.record_request(
+                        method, template, error=e.__class__.__name__,
+                        latency=time.monotonic() - started,
+                        request_bytes=request_bytes,
+                    )
+                if isinstance(e, requests.exceptions.Timeout) \
+                        and kwargs["timeout"] != timeout:
+                    # The timeout was capped at the remaining time
+                    raise DeadlineExceededError(deadline)
+                if self._retry(retry_policy, method, abs_url, attempts, e,
+                               deadline, template):
+                    continue
+                raise
+            if hooks:
+                event.elapsed = time.monotonic() - started
+                event.status_code = response.status_code
+                event.tracking_id = response.headers.get("trackingId")
+                self._fire("after_response", event)
+            if metrics is not None:
+                metrics.record_request(
+                    method, template, status_code=response.status_code,
+                    latency=time.monotonic() - started,
+                    request_bytes=request_bytes,
+                    response_bytes=len(response.content),
+                )
             try:
                 # Check the response code for error conditions
                 check_response_code(response, erc)
             except RateLimitError as e:
+                # Hold every request made through the rate limiter
+                if rate_limiter is not None:
+                    rate_limiter.pause(e.retry_after)
+
                 # Catch rate-limit errors
                 # Wait and retry if automatic rate-limit handling is enabled
                 if self.wait_on_rate_limit:
                     warnings.warn(RateLimitWarning(response))
-                    time.sleep(e.retry_after)
+                    if rate_limiter is None:
+                        if hooks:
+                            self._fire("on_rate_limit_wait", RequestEvent(
+                                method, abs_url, template, attempt=attempts,
+                                start_time=time.time(),
+                                status_code=response.status_code,
+                                tracking_id=e.tracking_id,
+                                error=e, wait=e.retry_after,
+                            ))
+                        self._sleep(e.retry_after, deadline)
+                        if metrics is not None:
+                            metrics.record_rate_limit_sleep(
+                                method, template, e.retry_after,
+                            )
                     continue
                 else:
                     # Re-raise the RateLimitError
                     raise
+            except ApiError as e:
+                if self._retry(retry_policy, method, abs_url, attempts, e,
+                               deadline, template):
+                    continue
+                raise
             else:
+                if invalidate:
+                    # Drop responses cached while the request was in flight
+                    self._entity_cache.invalidate(invalidate,
+                                                  self._cache_scope())
                 return response
 
+    @staticmethod
+    def _sleep(seconds, deadline=None):
+        """Sleep, unless the sleep would outlast the (optional) deadline."""
+        if deadline is None:
+            time.sleep(seconds)
+        else:
+            deadline.sleep(seconds)
+
+    def _retry(self, retry_policy, method, url, attempts, error,
+               deadline=None, template=None):
+        """Wait before retrying a failed request, if the policy permits.
+
+        Returns:
+            bool: True if the request should be retried.
+
+        """
+        if retry_policy is None:
+            return False
+        delay = retry_policy.retry_delay(method, attempts, error)
+        if delay is None:
+            return False
+        if self._metrics is not None:
+            self._metrics.record_retry(method, template)
+        if self._hooks:
+            response = getattr(error, "response", None)
+            self._fire("on_retry", RequestEvent(
+                method, url, template, attempt=attempts,
+                start_time=time.time(),
+                status_code=getattr(response, "status_code", None),
+                tracking_id=getattr(error, "tracking_id", None),
+                error=error, wait=delay,
+            ))
+        self._sleep(delay, deadline)
+        return True
+
+    @property
+    def current_deadline(self):
+        """The deadline set with :meth:`deadline` (in this thread), or None."""
+        return getattr(self._deadline_context, "deadline", None)
+
+    @contextlib.contextmanager
+    def deadline(self, seconds):
+        """Context manager: bound the requests made within to a deadline.
+
+        Within the context (in the calling thread), the requests made through
+        the session, including the pages of paginated results, their retries
+        and their rate-limit waits, must complete within `seconds` of
+        entering the context: each request's timeout is capped at the
+        remaining time, and :class:`DeadlineExceededError` is raised when the
+        time is used up, or when a wait would outlast it.  A nested context
+        cannot extend the deadline of an enclosing context.
+
+        Paginated results that start being iterated within the context keep
+        its deadline until they are exhausted (including the pages fetched
+        by background threads).
+
+        Args:
+            seconds(int, float, Deadline): The time budget (seconds), or a
+                :class:`Deadline`.
+
+        """
+        if not isinstance(seconds, Deadline):
+            seconds = Deadline(seconds)
+        previous = self.current_deadline
+        self._deadline_context.deadline = Deadline.earliest(seconds, previous)
+        try:
+            yield self._deadline_context.deadline
+        finally:
+            self._deadline_context.deadline = previous
+
+    def _resolve_deadline(self, deadline=None):
+        """The earliest of a `deadline` argument and the current deadline."""
+        if deadline is not None and not isinstance(deadline, Deadline):
+            deadline = Deadline(deadline)
+        return Deadline.earliest(deadline, self.current_deadline)
+
     def get(self, url, params=None, **kwargs):
         """Sends a GET request.
 
@@ -378,6 +1096,8 @@ class RestSession(object):
             params(dict): The parameters for the HTTP GET request.
             **kwargs:
                 erc(int): The expected (success) response code for the request.
+                deadline(int, float, Deadline): An overall time budget
+                    (seconds) for the request; see :meth:`deadline`.
                 others: Passed on to the requests package.
 
         Raises:
@@ -391,10 +1111,116 @@ class RestSession(object):
         # Expected response code
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
 
+        deadline = self._resolve_deadline(kwargs.pop("deadline", None))
+        if deadline is not None:
+            deadline.check()
+
+        if self._coalesce_gets and not kwargs:
+            return self._get_coalesced(url, params, erc, deadline)
+
+        if deadline is not None:
+            kwargs["deadline"] = deadline
+
+        return self._get(url, params, erc, **kwargs)
+
+    def _get(self, url, params, erc, **kwargs):
+        """Send a GET request (through the entity cache, if any)."""
+        if self._entity_cache is not None:
+            abs_url = self.abs_url(url)
+            entity_url = self._entity_url(abs_url)
+            if entity_url is not None and \
+                    urllib.parse.urlparse(abs_url).path.rstrip("/") \
+                    == urllib.parse.urlparse(entity_url).path:
+                return self._get_cached(abs_url, params, erc, **kwargs)
+
         response = self.request("GET", url, erc, params=params, **kwargs)
-        return extract_and_parse_json(response)
+        return self._parse_json(response)
 
-    def get_pages(self, url, params=None, **kwargs):
+    def _get_coalesced(self, url, params, erc, deadline=None):
+        """Send a GET request, or join an identical in-flight request.
+
+        The first caller (the leader) sends the request; the callers that
+        request the same URL and parameters while it is in flight wait for
+        it (up to their deadline), and receive a copy of its parsed result
+        (or of its exception, including the leader's Tracking ID).  When the
+        leader's deadline is exceeded, callers with time remaining send the
+        request themselves.
+        """
+        key = (
+            self.abs_url(url),
+            tuple(sorted((str(name), str(value))
+                         for name, value in params.items()))
+            if params else (),
+            erc,
+        )
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+
+        if not leader:
+            try:
+                result = future.result(
+                    timeout=deadline.remaining() if deadline else None
+                )
+            except FuturesTimeoutError:
+                raise DeadlineExceededError(deadline)
+            except DeadlineExceededError:
+                if deadline is not None and deadline.expired:
+                    raise DeadlineExceededError(deadline)
+                return self._get_coalesced(url, params, erc, deadline)
+            except Exception as e:
+                # Raise a copy, so the callers don't share a traceback
+                error = _copy_error(e)
+            else:
+                return copy.deepcopy(result)
+            raise error
+
+        try:
+            if deadline is None:
+                result = self._get(url, params, erc)
+            else:
+                result = self._get(url, params, erc, deadline=deadline)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    def _get_cached(self, abs_url, params, erc, **kwargs):
+        """Send a get-by-id GET request through the entity cache."""
+        cache = self._entity_cache
+        scope = self._cache_scope()
+
+        cached = cache.lookup(abs_url, params, scope)
+        if cached is not None:
+            found, cached_response = cached
+            if not found:
+                raise ApiError(
+                    _cached_response(cached_response, abs_url, params)
+                )
+            return self._json_codec.loads(cached_response)
+
+        resource = self.endpoint_name(abs_url)
+        try:
+            response = self.request("GET", abs_url, erc, params=params,
+                                    **kwargs)
+        except ApiError as e:
+            if e.status_code == 404:
+                cache.store_missing(abs_url, params, resource, e.response,
+                                    scope)
+            raise
+
+        cache.store(abs_url, params, resource, response.text, scope)
+        return self._parse_json(response)
+
+    def get_pages(self, url, params=None, prefetch=None, raw=False,
+                  adaptive=None, **kwargs):
         """Return a generator that GETs and yields pages of data.
 
         Provides native support for RFC5988 Web Linking.
@@ -402,8 +1228,18 @@ class RestSession(object):
         Args:
             url(basestring): The URL of the API endpoint.
             params(dict): The parameters for the HTTP GET request.
+            prefetch(int): The number of pages fetched ahead (on a background
+                thread) while the current page is consumed.  Defaults to the
+                session's `prefetch` setting.
+            raw(bool): Leave the objects of the pages' arrays undecoded, as
+                :class:`RawJSON` (see :func:`split_json_page`).
+            adaptive(AdaptivePageSize): Tune the page size (the `max`
+                parameter) of the requests to their latency, backing off on
+                timeouts and 5xx responses.
             **kwargs:
                 erc(int): The expected (success) response code for the request.
+                deadline(int, float, Deadline): An overall time budget
+                    (seconds) for all the pages; see :meth:`deadline`.
                 others: Passed on to the requests package.
 
         Raises:
@@ -413,7 +1249,34 @@ class RestSession(object):
         """
         check_type(url, basestring)
         check_type(params, dict, optional=True)
+        check_type(prefetch, int, optional=True)
+        check_type(raw, bool)
+        check_type(adaptive, AdaptivePageSize, optional=True)
+
+        if prefetch is None:
+            prefetch = self.prefetch
 
+        # Bind the deadline to the requests (also made by prefetch threads)
+        deadline = self._resolve_deadline(kwargs.pop("deadline", None))
+        if deadline is not None:
+            kwargs["deadline"] = deadline
+
+        if adaptive is not None:
+            pages = self._get_adaptive_pages(url, params, raw, adaptive,
+                                             **kwargs)
+        else:
+            pages = self._get_pages(url, params, raw, **kwargs)
+        if prefetch > 0:
+            pages = _prefetch(pages, prefetch)
+
+        try:
+            for page in pages:
+                yield page
+        finally:
+            pages.close()
+
+    def _get_pages(self, url, params=None, raw=False, **kwargs):
+        """GET and yield pages of data, following the RFC5988 `next` links."""
         # Expected response code
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
 
@@ -421,7 +1284,7 @@ class RestSession(object):
         response = self.request("GET", url, erc, params=params, **kwargs)
 
         while True:
-            yield extract_and_parse_json(response)
+            yield self._parse_page(response, raw)
 
             if response.links.get("next"):
                 next_url = response.links.get("next").get("url")
@@ -438,7 +1301,421 @@ class RestSession(object):
             else:
                 break
 
-    def get_items(self, url, params=None, items_param = "items" , **kwargs):
+    def _get_adaptive_pages(self, url, params, raw, adaptive, **kwargs):
+        """GET and yield pages of data, tuning their size as they arrive."""
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
+        params = dict(params) if params else {}
+        items_param = kwargs.pop("items_param", "items")
+
+        while True:
+            page_size = adaptive.page_size
+            if params is not None:
+                params["max"] = page_size
+            else:
+                url = _set_url_param(url, "max", page_size)
+
+            try:
+                response = self.request("GET", url, erc, params=params,
+                                        **kwargs)
+                page = self._parse_page(response, raw)
+            except (requests.exceptions.Timeout, ApiError) as e:
+                if adaptive.back_off(e):
+                    continue
+                raise
+
+            # Time the final HTTP exchange only, excluding the rate-limit
+            # waits and retry backoffs of the request
+            items = page if items_param is None else page.get(items_param)
+            adaptive.record(page_size, len(items or ()),
+                            response.elapsed.total_seconds())
+            yield page
+
+            if not response.links.get("next"):
+                break
+            url = _fix_next_url(response.links.get("next").get("url"))
+            params = None
+
+    @contextlib.contextmanager
+    def adaptive_pagination(self, ceiling=None, growth=2.0, tolerance=0.1,
+                            max_backoffs=3):
+        """Context manager: tune the page size of item GETs to their latency.
+
+        Within the context, :meth:`get_items` and :meth:`get_items_list` calls
+        made by the current thread (for requests with a `max` parameter)
+        start at the requested page size and raise it while the time per
+        item improves, up to the endpoint's largest page size; they back off
+        on timeouts and 5xx responses.  See :class:`AdaptivePageSize`.
+
+        Args:
+            ceiling(int): The largest page size requested.  Defaults to the
+                endpoint's largest page size (see
+                :data:`webexteamssdk.config.MAX_PAGE_SIZES`).
+            growth(int, float): The factor the page size is raised by.
+            tolerance(float): The relative improvement of the time per item
+                required to keep raising the page size.
+            max_backoffs(int): The number of times a crawl backs off (and
+                retries a page) before the error is raised.
+
+        """
+        check_type(ceiling, int, optional=True)
+
+        previous = getattr(self._pagination_context, "adaptive", None)
+        self._pagination_context.adaptive = dict(
+            ceiling=ceiling,
+            growth=growth,
+            tolerance=tolerance,
+            max_backoffs=max_backoffs,
+        )
+        try:
+            yield
+        finally:
+            self._pagination_context.adaptive = previous
+
+    def _get_adaptive_page_size(self, url, params, items_param, kwargs):
+        """Set up adaptive page sizes in `kwargs`, if active."""
+        options = getattr(self._pagination_context, "adaptive", None)
+        if options is None or not params or not params.get("max"):
+            return
+
+        options = dict(options)
+        ceiling = options.pop("ceiling")
+        if ceiling is None:
+            ceiling = MAX_PAGE_SIZES.get(self.endpoint_name(url),
+                                         DEFAULT_MAX_PAGE_SIZE)
+        kwargs["adaptive"] = AdaptivePageSize(int(params["max"]), ceiling,
+                                              **options)
+        kwargs["items_param"] = items_param
+
+    @contextlib.contextmanager
+    def parallel_pagination(self, concurrency=DEFAULT_PARALLEL_CONCURRENCY,
+                            ordered=True, offset_param=None, page_size=None,
+                            page_size_param="max", page_numbers=False):
+        """Context manager: paginate item GETs concurrently, by offset.
+
+        Within the context, :meth:`get_items` and :meth:`get_items_list` calls
+        made by the current thread fetch their pages with
+        :meth:`get_pages_parallel` (using the arguments provided here) rather
+        than by following the RFC5988 `next` links.  Use it only with
+        endpoints paged by a numeric offset.
+
+        Args:
+            concurrency(int): The maximum number of pages fetched at once.
+            ordered(bool): Yield the pages in offset order.
+            offset_param(basestring): The name of the offset parameter.
+            page_size(int): The number of items requested per page.
+            page_size_param(basestring): The name of the page size parameter.
+            page_numbers(bool): The offset parameter numbers pages, rather
+                than items.
+
+        """
+        previous = getattr(self._pagination_context, "parallel", None)
+        self._pagination_context.parallel = dict(
+            concurrency=concurrency,
+            ordered=ordered,
+            offset_param=offset_param,
+            page_size=page_size,
+            page_size_param=page_size_param,
+            page_numbers=page_numbers,
+        )
+        try:
+            yield
+        finally:
+            self._pagination_context.parallel = previous
+
+    def get_pages_parallel(self, url, params=None, offset_param=None,
+                           page_size=None, page_size_param="max",
+                           page_numbers=False,
+                           concurrency=DEFAULT_PARALLEL_CONCURRENCY,
+                           ordered=True, items_param="items", raw=False,
+                           **kwargs):
+        """Return a generator that GETs pages of data concurrently, by offset.
+
+        For endpoints paged by a numeric offset (for example, `start` or
+        `offset` parameters), the offsets of the pages are computed up front
+        and up to `concurrency` pages are fetched at once.  Pagination stops
+        at the first short (or empty) page.  Link headers are ignored.
+
+        The page size is capped at the endpoint's largest page size (see
+        :data:`webexteamssdk.config.MAX_PAGE_SIZES`).  The first page is
+        fetched on its own: when it is short, the second page is fetched on
+        its own too, and if it has items, the server caps the page size; the
+        pages are then stepped by the number of items of the first page.
+
+        Args:
+            url(basestring): The URL of the API endpoint.
+            params(dict): The parameters for the HTTP GET request.  The offset
+                parameter (if present) sets the offset of the first page.
+            offset_param(basestring): The name of the offset parameter.
+                Defaults to "offset" when `params` contains an "offset"
+                parameter, and to "start" otherwise.
+            page_size(int): The number of items requested per page.  Defaults
+                to the value of the page size parameter in `params`.
+            page_size_param(basestring): The name of the page size parameter.
+            page_numbers(bool): The offset parameter numbers pages (0, 1, 2,
+                ...), rather than items.
+            concurrency(int): The maximum number of pages fetched at once.
+                Keep this within the session's connection pool size.
+            ordered(bool): Yield the pages in offset order.  When False, pages
+                are yielded as soon as they are received.
+            items_param(basestring): The key of the items list in the
+                returned JSON pages; None for pages that are JSON lists.
+            raw(bool): Leave the objects of the pages' arrays undecoded, as
+                :class:`RawJSON` (see :func:`split_json_page`).
+            **kwargs:
+                erc(int): The expected (success) response code for the request.
+                others: Passed on to the requests package.
+
+        Raises:
+            ValueError: If the page size is not provided.
+            ApiError: If anything other than the expected response code is
+                returned by the Webex Teams API endpoint.
+
+        """
+        check_type(url, basestring)
+        check_type(params, dict, optional=True)
+        check_type(offset_param, basestring, optional=True)
+        check_type(page_size, int, optional=True)
+        check_type(page_size_param, basestring)
+        check_type(concurrency, int)
+        check_type(items_param, basestring, optional=True)
+
+        params = dict(params) if params else {}
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
+
+        # Bind the deadline to the requests made by the fetch threads
+        deadline = self._resolve_deadline(kwargs.pop("deadline", None))
+        if deadline is not None:
+            kwargs["deadline"] = deadline
+
+        if offset_param is None:
+            offset_param = "offset" if "offset" in params else "start"
+        if page_size is None:
+            page_size = params.get(page_size_param)
+        if not page_size or page_size < 1:
+            raise ValueError("Parallel pagination requires a page size; "
+                             "provide `page_size` or a `{}` parameter."
+                             "".format(page_size_param))
+        if concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+
+        max_page_size = MAX_PAGE_SIZES.get(self.endpoint_name(url))
+        if max_page_size is not None:
+            page_size = min(page_size, max_page_size)
+
+        params[page_size_param] = page_size
+        first_offset = int(params.get(offset_param, 0))
+        offset_step = 1 if page_numbers else page_size
+
+        def fetch(index):
+            page_params = dict(params)
+            page_params[offset_param] = first_offset + index * offset_step
+            response = self.request("GET", url, erc, params=page_params,
+                                    **kwargs)
+            return self._parse_page(response, raw)
+
+        def count(page):
+            if items_param is None:
+                return len(page)
+            items = page.get(items_param) if isinstance(page, dict) else None
+            return len(items) if items else 0
+
+        # Fetch the first page on its own, to find the server's page size
+        page = fetch(0)
+        yield page
+        received_size = count(page)
+        if received_size == 0:
+            return
+        if received_size < page_size:
+            # The last page, or the server caps the page size: step by the
+            # number of items received, and check for a second page
+            page_size = received_size
+            if not page_numbers:
+                offset_step = received_size
+            page = fetch(1)
+            if count(page) == 0:
+                return
+            yield page
+            if count(page) < page_size:
+                return
+            next_index = 2
+        else:
+            next_index = 1
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending = {}        # future: page index
+        received = {}       # page index: page (ordered merge)
+        yield_index = next_index    # The next page to yield (ordered merge)
+        last_index = None   # The index of the first short page
+
+        try:
+            while True:
+                # Keep up to `concurrency` pages in flight (or buffered)
+                while last_index is None \
+                        and len(pending) + len(received) < concurrency:
+                    pending[executor.submit(fetch, next_index)] = next_index
+                    next_index += 1
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    page = future.result()
+
+                    if count(page) < page_size:
+                        if last_index is None or index < last_index:
+                            last_index = index
+                    if last_index is not None and index > last_index:
+                        continue
+
+                    if ordered:
+                        received[index] = page
+                    else:
+                        yield page
+
+                while yield_index in received:
+                    yield received.pop(yield_index)
+                    yield_index += 1
+
+                # Drop the requests for pages beyond the last page
+                if last_index is not None:
+                    for future, index in list(pending.items()):
+                        if index > last_index:
+                            future.cancel()
+                            del pending[future]
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    @contextlib.contextmanager
+    def recording_item_requests(self):
+        """Context manager: record, rather than send, item GETs.
+
+        Within the context, :meth:`get_items` and :meth:`get_items_list` calls
+        made by the current thread send no requests and yield no items; they
+        record their arguments, as `(url, params, items_param, kwargs)`
+        tuples (with the resolved `raw` option in `kwargs`), in the list
+        returned by the context manager.
+
+        """
+        recorded = []
+        previous = getattr(self._pagination_context, "recorded", None)
+        self._pagination_context.recorded = recorded
+        try:
+            yield recorded
+        finally:
+            self._pagination_context.recorded = previous
+
+    def _record_item_request(self, url, params, items_param, kwargs):
+        """Record an item GET if recording is active; return True if so."""
+        recorded = getattr(self._pagination_context, "recorded", None)
+        if recorded is None:
+            return False
+        recorded.append((url, params, items_param, dict(kwargs)))
+        return True
+
+    @contextlib.contextmanager
+    def checkpointing(self, checkpoint):
+        """Context manager: paginate item GETs from (and into) a checkpoint.
+
+        Within the context, :meth:`get_items` and :meth:`get_items_list` calls
+        made by the current thread start (or resume) their crawl at the
+        checkpoint's cursor, and update the checkpoint as their items are
+        consumed; see :class:`PaginationCheckpoint`.  The pages are fetched as
+        they are needed (without prefetching).
+
+        Args:
+            checkpoint(PaginationCheckpoint): The checkpoint.
+
+        """
+        check_type(checkpoint, PaginationCheckpoint)
+
+        previous = getattr(self._pagination_context, "checkpoint", None)
+        self._pagination_context.checkpoint = checkpoint
+        try:
+            yield checkpoint
+        finally:
+            self._pagination_context.checkpoint = previous
+
+    @contextlib.contextmanager
+    def feeding_items(self, items):
+        """Context manager: yield the provided items, rather than GET them.
+
+        Within the context, :meth:`get_items` and :meth:`get_items_list` calls
+        made by the current thread send no requests; they yield the provided
+        items (for example, the items of a page fetched with
+        :meth:`get_pages`).
+
+        Args:
+            items(list): The items to be yielded.
+
+        """
+        check_type(items, list)
+
+        previous = getattr(self._pagination_context, "fed_items", None)
+        self._pagination_context.fed_items = items
+        try:
+            yield
+        finally:
+            self._pagination_context.fed_items = previous
+
+    def _get_context_items(self, url, params, items_param, kwargs):
+        """Return the fed or checkpointed items, if either is active."""
+        items = getattr(self._pagination_context, "fed_items", None)
+        if items is not None:
+            return items
+
+        checkpoint = getattr(self._pagination_context, "checkpoint", None)
+        if checkpoint is None:
+            return None
+        kwargs.pop("prefetch", None)
+        return self._checkpointed_items(url, params, items_param, checkpoint,
+                                        **kwargs)
+
+    def _checkpointed_items(self, url, params, items_param, checkpoint,
+                            raw=False, **kwargs):
+        """GET and yield items from the checkpoint's cursor, updating it."""
+        checkpoint.start(url, params)
+        if checkpoint.complete:
+            return
+
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
+        while True:
+            response = self.request("GET", checkpoint.url, erc,
+                                    params=checkpoint.params, **kwargs)
+            page = self._parse_page(response, raw)
+            items = page if items_param is None else page.get(items_param)
+            if not isinstance(items, list):
+                raise MalformedResponse(
+                    "'{}' key not found in JSON data: {!r}"
+                    "".format(items_param, page)
+                )
+
+            for item in items[checkpoint.page_offset:]:
+                yield item
+                checkpoint.item_consumed()
+
+            next_link = response.links.get("next")
+            if next_link:
+                checkpoint.page_consumed(_fix_next_url(next_link.get("url")))
+            else:
+                checkpoint.page_consumed(None)
+                return
+
+    def _get_parallel_pages(self, url, params, items_param, kwargs):
+        """Return parallel pages if parallel pagination is active, or None."""
+        options = getattr(self._pagination_context, "parallel", None)
+        if options is None:
+            return None
+        kwargs.pop("prefetch", None)
+        return self.get_pages_parallel(url, params=params,
+                                       items_param=items_param,
+                                       **dict(options, **kwargs))
+
+    def get_items(self, url, params=None, items_param = "items" , raw=None,
+                  **kwargs):
         #print(url)
         """Return a generator that GETs and yields individual JSON `items`.
 
@@ -452,8 +1729,15 @@ class RestSession(object):
             params(dict): The parameters for the HTTP GET request.
             items: expected dict key for returned API envelope, legacy uses "items", but telephony
                     APIs for some reason use others, i.e. autoAttendants
+            raw(bool): Yield the raw JSON text (:class:`RawJSON`) of the
+                items, rather than dictionaries.  Defaults to the session's
+                `raw_items` setting.
             **kwargs:
                 erc(int): The expected (success) response code for the request.
+                deadline(int, float, Deadline): An overall time budget
+                    (seconds) for all the pages; see :meth:`deadline`.
+                prefetch(int): The number of pages fetched ahead; see
+                    :meth:`get_pages`.
                 others: Passed on to the requests package.
 
         Raises:
@@ -463,8 +1747,24 @@ class RestSession(object):
                 top-level dictionary with an "items" key.
 
         """
+        if raw is None:
+            raw = self.raw_items
+        kwargs["raw"] = raw
+
+        if self._record_item_request(url, params, items_param, kwargs):
+            return
+
+        items = self._get_context_items(url, params, items_param, kwargs)
+        if items is not None:
+            for item in items:
+                yield item
+            return
+
         # Get generator for pages of JSON data
-        pages = self.get_pages(url, params=params, **kwargs)
+        pages = self._get_parallel_pages(url, params, items_param, kwargs)
+        if pages is None:
+            self._get_adaptive_page_size(url, params, items_param, kwargs)
+            pages = self.get_pages(url, params=params, **kwargs)
 
         for json_page in pages:
             assert isinstance(json_page, dict)
@@ -487,11 +1787,27 @@ class RestSession(object):
                     yield item
 
 
-    def get_items_list(self, url, params=None, **kwargs):
+    def get_items_list(self, url, params=None, raw=None, **kwargs):
         """Created for webex contact center list methods, i.e. entry-point
         """
+        if raw is None:
+            raw = self.raw_items
+        kwargs["raw"] = raw
+
+        if self._record_item_request(url, params, None, kwargs):
+            return
+
+        items = self._get_context_items(url, params, None, kwargs)
+        if items is not None:
+            for item in items:
+                yield item
+            return
+
         # Get generator for pages of JSON data
-        pages = self.get_pages(url, params=params, **kwargs)
+        pages = self._get_parallel_pages(url, params, None, kwargs)
+        if pages is None:
+            self._get_adaptive_page_size(url, params, None, kwargs)
+            pages = self.get_pages(url, params=params, **kwargs)
 
         for json_page in pages:
             assert isinstance(json_page, list)
@@ -524,7 +1840,7 @@ class RestSession(object):
         response = self.request("POST", url, erc, json=json, data=data,
                                 **kwargs)
 
-        return extract_and_parse_json(response)
+        return self._parse_json(response)
 
     def post_test(self, url, json=None, data=None, **kwargs):
         check_type(url, basestring)
@@ -534,11 +1850,11 @@ class RestSession(object):
 
         response = self.request("POST", url, erc, json=json, data=data,
                                 **kwargs)
-        res_dic = extract_and_parse_json(response)
+        res_dic = self._parse_json(response)
         for hit in res_dic["hits"]["hits"]:
             yield hit
 
-        return extract_and_parse_json(response)
+        return self._parse_json(response)
 
 
     def put(self, url, json=None, data=None, **kwargs):
@@ -567,7 +1883,7 @@ class RestSession(object):
         if erc == 204:
             return "204 Successful"
         else:
-            return extract_and_parse_json(response)
+            return self._parse_json(response)
 
     def delete(self, url, **kwargs):
         """Sends a DELETE request.
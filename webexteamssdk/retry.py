@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""Retry policies for failed Webex Teams API requests.
+
+Classes:
+    RetryBudget: A token budget bounding the retries of a client.
+    RetryPolicy: Decides which failed requests are retried, and when.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import logging
+import random
+import threading
+
+import requests
+
+from .config import (
+    DEFAULT_RETRY_BASE_DELAY, DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_RETRY_MAX_DELAY, RETRYABLE_METHODS, RETRYABLE_STATUS_CODES,
+)
+from .exceptions import ApiError, RateLimitError
+from .utils import check_type
+
+
+logger = logging.getLogger(__name__)
+
+
+class RetryBudget(object):
+    """A token budget bounding the retries of a client.
+
+    Every request deposits `ratio` tokens (up to `max_tokens`), and every
+    retry withdraws one token; when fewer than one token is left, failed
+    requests are not retried.  Retries are thereby limited to about `ratio`
+    of the requests made, so a failing service is not flooded with retries
+    (retry storms), while isolated failures are still retried.  Share a
+    budget between policies (and sessions) to share its limit.
+
+    """
+
+    def __init__(self, ratio=0.1, max_tokens=10):
+        """Init a new RetryBudget (full).
+
+        Args:
+            ratio(int, float): The tokens deposited by each request (the
+                sustained ratio of retries to requests).
+            max_tokens(int, float): The tokens the budget holds (the number
+                of retries permitted in a burst).
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `ratio` is negative or `max_tokens` is less than 1.
+
+        """
+        check_type(ratio, (int, float))
+        check_type(max_tokens, (int, float))
+        if ratio < 0:
+            raise ValueError("ratio must be zero or positive.")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1.")
+
+        super(RetryBudget, self).__init__()
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<{}(ratio={}, tokens={:.2f}/{})>".format(
+            self.__class__.__name__, self.ratio, self._tokens,
+            self.max_tokens,
+        )
+
+    @property
+    def tokens(self):
+        """The tokens left in the budget."""
+        return self._tokens
+
+    def deposit(self):
+        """Deposit the tokens of a request."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self):
+        """Withdraw the token of a retry.
+
+        Returns:
+            bool: True if a token was withdrawn (the retry may be made).
+
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy(object):
+    """Decides which failed requests are retried, and when.
+
+    A request is retried when it failed with a transport error (a
+    connection error or a timeout) or a retryable status code (502, 503 and
+    504 by default), its method is retryable (idempotent methods by
+    default), it has been attempted fewer than `max_attempts` times, and the
+    retry budget is not exhausted.
+
+    The delay before a retry is drawn uniformly from zero to an
+    exponentially growing ceiling (`base_delay * 2 ** retries`, capped at
+    `max_delay`; "full jitter"), so the clients retrying after an outage
+    spread their retries out, rather than retrying in lockstep.  A
+    `Retry-After` header, when present, sets the minimum delay.
+
+    Rate-limited (429) responses are handled by the session's rate-limit
+    handling (see `wait_on_rate_limit`), not by the retry policy.
+
+    """
+
+    def __init__(self, max_attempts=DEFAULT_RETRY_MAX_ATTEMPTS,
+                 methods=RETRYABLE_METHODS,
+                 status_codes=RETRYABLE_STATUS_CODES,
+                 base_delay=DEFAULT_RETRY_BASE_DELAY,
+                 max_delay=DEFAULT_RETRY_MAX_DELAY,
+                 retry_transport_errors=True,
+                 budget=None):
+        """Init a new RetryPolicy.
+
+        Args:
+            max_attempts(int): The number of times a request is attempted
+                (including the first attempt); 1 disables retries.
+            methods(list, tuple, set): The retryable request methods.
+            status_codes(list, tuple, set): The retryable response status
+                codes.
+            base_delay(int, float): The ceiling (seconds) of the delay before
+                the first retry; doubled for each further retry.
+            max_delay(int, float): The largest delay (seconds) before a
+                retry.
+            retry_transport_errors(bool): Retry the requests that failed with
+                a connection error or a timeout.
+            budget(RetryBudget): The retry budget.  Defaults to a new
+                :class:`RetryBudget`; use False for an unlimited budget.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `max_attempts` is less than 1 or a delay is
+                negative.
+
+        """
+        check_type(max_attempts, int)
+        check_type(methods, (list, tuple, set, frozenset))
+        check_type(status_codes, (list, tuple, set, frozenset))
+        check_type(base_delay, (int, float))
+        check_type(max_delay, (int, float))
+        check_type(retry_transport_errors, bool)
+        if budget is not False:
+            check_type(budget, RetryBudget, optional=True)
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError("The delays must be zero or positive.")
+
+        super(RetryPolicy, self).__init__()
+        self.max_attempts = max_attempts
+        self.methods = frozenset(method.upper() for method in methods)
+        self.status_codes = frozenset(status_codes)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_transport_errors = retry_transport_errors
+        if budget is None:
+            budget = RetryBudget()
+        self.budget = budget or None
+
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._retries_by_reason = {}
+        self._attempts_exhausted = 0
+        self._budget_exhausted = 0
+
+    def __repr__(self):
+        return "<{}(max_attempts={}, retries={})>".format(
+            self.__class__.__name__, self.max_attempts, self._retries,
+        )
+
+    @property
+    def retries(self):
+        """The number of retries made."""
+        return self._retries
+
+    @property
+    def stats(self):
+        """The retry counters.
+
+        Returns:
+            dict: The number of `retries` made, the retries by reason
+                (`by_reason`; the status code, or the transport error's
+                class name), and the number of failed requests not retried
+                because they had been attempted `max_attempts` times
+                (`attempts_exhausted`) or the budget was exhausted
+                (`budget_exhausted`).
+
+        """
+        with self._lock:
+            return {
+                "retries": self._retries,
+                "by_reason": dict(self._retries_by_reason),
+                "attempts_exhausted": self._attempts_exhausted,
+                "budget_exhausted": self._budget_exhausted,
+            }
+
+    def reset_stats(self):
+        """Reset the retry counters."""
+        with self._lock:
+            self._retries = 0
+            self._retries_by_reason = {}
+            self._attempts_exhausted = 0
+            self._budget_exhausted = 0
+
+    def request_started(self):
+        """Record a (first) request attempt; deposits into the budget."""
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def _reason(self, method, error):
+        """The reason a failed request is retryable (None if it isn't)."""
+        if method.upper() not in self.methods:
+            return None
+        if isinstance(error, ApiError):
+            if isinstance(error, RateLimitError) \
+                    or error.status_code not in self.status_codes:
+                return None
+            return error.status_code
+        if self.retry_transport_errors and isinstance(
+            error, (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout)
+        ):
+            return error.__class__.__name__
+        return None
+
+    def backoff(self, retries):
+        """A (jittered) delay before a request's next retry.
+
+        Args:
+            retries(int): The number of retries already made.
+
+        Returns:
+            float: A delay (seconds), drawn uniformly from zero to
+                ``min(max_delay, base_delay * 2 ** retries)``.
+
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** min(retries, 32))
+        return random.uniform(0, ceiling)
+
+    def retry_delay(self, method, attempts, error):
+        """Decide whether a failed request is retried.
+
+        Args:
+            method(basestring): The request method.
+            attempts(int): The number of times the request was attempted.
+            error(Exception): The error raised by the last attempt.
+
+        Returns:
+            float: The delay (seconds) before the request is retried, or
+                None if the error should be raised.
+
+        """
+        reason = self._reason(method, error)
+        if reason is None:
+            return None
+
+        if attempts >= self.max_attempts:
+            with self._lock:
+                self._attempts_exhausted += 1
+            return None
+
+        if self.budget is not None and not self.budget.withdraw():
+            with self._lock:
+                self._budget_exhausted += 1
+            logger.debug("Retry budget exhausted; not retrying: %r", error)
+            return None
+
+        with self._lock:
+            self._retries += 1
+            self._retries_by_reason[reason] = \
+                self._retries_by_reason.get(reason, 0) + 1
+
+        delay = self.backoff(attempts - 1)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is None and isinstance(error, ApiError):
+            try:
+                retry_after = int(error.response.headers["Retry-After"])
+            except (KeyError, TypeError, ValueError):
+                retry_after = None
+        if retry_after:
+            delay = max(delay, min(retry_after, self.max_delay))
+
+        logger.debug("Retrying %s request (attempt %s) in %.2fs: %r",
+                     method, attempts + 1, delay, error)
+        return delay
@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+"""Time-window sharded scans of time-bounded list methods.
+
+Classes:
+    ShardedScan: Scan a time range as concurrently-paginated shards.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import inspect
+import queue
+import threading
+from datetime import datetime, timedelta
+
+from past.builtins import basestring
+
+from .utils import WebexTeamsDateTime, check_type, timestamps_to_epoch
+
+
+# Shard states
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+
+# The end-of-shard marker put on the output queues
+_END = object()
+
+# Shards are not split into pieces spanning less than this (milliseconds)
+MIN_SHARD_SPAN = 1000
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+# Helper Functions
+def to_milliseconds(value):
+    """Convert a Webex Teams timestamp to milliseconds since the epoch.
+
+    Args:
+        value(basestring, datetime): An ISO8601 (Webex Teams format) date and
+            time string, or a datetime (naive datetimes are assumed UTC).
+
+    Returns:
+        int: The milliseconds since the epoch.
+
+    """
+    try:
+        return timestamps_to_epoch([value])[0]
+    except ValueError:
+        value = WebexTeamsDateTime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+        return timestamps_to_epoch([value])[0]
+
+
+def from_milliseconds(milliseconds):
+    """Format milliseconds since the epoch as a Webex Teams timestamp."""
+    value = _EPOCH + timedelta(milliseconds=milliseconds)
+    return "{}.{:03d}Z".format(value.strftime("%Y-%m-%dT%H:%M:%S"),
+                               milliseconds % 1000)
+
+
+class _Shard(object):
+    """A sub-range [start, end) of a sharded scan.
+
+    The `start` and `end` bounds are enforced client-side only where they
+    border another shard (`bounded_start`, `bounded_end`); the outer bounds
+    of the scan are left to the API.
+
+    """
+
+    def __init__(self, start, end, bounded_start, bounded_end, buffer_size):
+        self.start = start
+        self.end = end
+        self.bounded_start = bounded_start
+        self.bounded_end = bounded_end
+        self.state = PENDING
+        self.output = queue.Queue(maxsize=buffer_size)
+
+    def __repr__(self):
+        return "<_Shard [{}, {}) {}>".format(
+            from_milliseconds(self.start), from_milliseconds(self.end),
+            self.state,
+        )
+
+
+class ShardedScan(object):
+    """Scan a time range as concurrently-paginated shards.
+
+    A time-bounded list method (a GeneratorContainer wrapping a list method
+    with `_from` and `to` arguments) is called once per shard of the time
+    range, and the shards are paginated concurrently.  Every item is yielded
+    once: each shard yields only the items created within its sub-range.
+
+    When a worker is idle and a shard is still being paginated, the part of
+    the shard's sub-range that has not been scanned yet is split into new
+    shards, so dense sub-ranges are spread across the workers.
+
+    """
+
+    def __init__(self, container, shards, concurrency=None, ordered=True,
+                 newest_first=True, split=True, time_attribute="created"):
+        """Init a new ShardedScan.
+
+        Args:
+            container(GeneratorContainer): The time-bounded list method call;
+                its `_from` argument must be set.  When its `to` argument is
+                not set, the scan ends at the current time.
+            shards(int): The number of shards the time range is split into.
+            concurrency(int): The number of shards paginated at once.
+                Defaults to `shards`.
+            ordered(bool): Yield the items in time order.  When False, items
+                are yielded as soon as they are received, which is faster.
+            newest_first(bool): The time order of the ordered output; Webex
+                Teams lists events newest first.
+            split(bool): Split the unscanned part of busy shards when workers
+                are idle.
+            time_attribute(basestring): The item attribute (or key) holding
+                the item's creation timestamp.
+
+        Raises:
+            TypeError: If the parameter types are incorrect, or the container
+                does not wrap a time-bounded list method.
+            ValueError: If the time range or the numbers of shards are
+                invalid.
+
+        """
+        check_type(shards, int)
+        check_type(concurrency, int, optional=True)
+        check_type(ordered, bool)
+        check_type(newest_first, bool)
+        check_type(split, bool)
+        check_type(time_attribute, basestring)
+
+        generator_function = getattr(container, "generator_function", None)
+        parameters = inspect.signature(generator_function).parameters \
+            if generator_function else {}
+        if "_from" not in parameters or "to" not in parameters:
+            raise TypeError("Sharded scans are supported for time-bounded "
+                            "list methods (with `_from` and `to` arguments) "
+                            "only.")
+
+        arguments = container.arguments
+        if not arguments.get("_from"):
+            raise ValueError("A sharded scan requires a `_from` time.")
+        if shards < 1 or (concurrency is not None and concurrency < 1):
+            raise ValueError("shards and concurrency must be positive "
+                             "integers.")
+
+        self.container = container
+        self.start = to_milliseconds(arguments["_from"])
+        self.end = to_milliseconds(
+            arguments.get("to") or WebexTeamsDateTime.utcnow()
+        )
+        if self.end <= self.start:
+            raise ValueError("The `to` time must be later than `_from`.")
+
+        self.shards = shards
+        self.concurrency = concurrency or shards
+        self.ordered = ordered
+        self.newest_first = newest_first
+        self.split = split
+        self.time_attribute = time_attribute
+        self.page_size = arguments.get("max") or 100
+
+    def __iter__(self):
+        """Start the scan; yield the items of all shards."""
+        return self._scan()
+
+    def _timestamp(self, item):
+        """The creation time of an item, in milliseconds since the epoch."""
+        if isinstance(item, dict):
+            value = item.get(self.time_attribute)
+        else:
+            value = getattr(item, self.time_attribute)
+        return to_milliseconds(value)
+
+    def _new_shards(self, start, end, count, bounded_start, bounded_end):
+        """Split [start, end) into (up to) `count` shards, in output order."""
+        count = max(1, min(count, (end - start) // MIN_SHARD_SPAN))
+        bounds = [start + (end - start) * i // count for i in range(count)]
+        bounds.append(end)
+        shards = [
+            _Shard(
+                bounds[i], bounds[i + 1],
+                bounded_start=bounded_start or i > 0,
+                bounded_end=bounded_end or i < count - 1,
+                buffer_size=self.page_size,
+            )
+            for i in range(count)
+        ]
+        if self.newest_first:
+            shards.reverse()
+        return shards
+
+    def _scan(self):
+        # The workers keep the deadline of the scan (if any)
+        session = getattr(self.container.arguments.get("self"), "_session",
+                          None)
+        self._session = session
+        self._deadline = getattr(session, "current_deadline", None)
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._running = 0
+        self._order = self._new_shards(self.start, self.end, self.shards,
+                                       bounded_start=False, bounded_end=False)
+        self._created = len(self._order)
+        self._finished = 0
+        self._output = None if self.ordered \
+            else queue.Queue(maxsize=self.page_size * self.concurrency)
+
+        workers = [threading.Thread(target=self._work,
+                                    name="webexteamssdk-shard-{}".format(i))
+                   for i in range(self.concurrency)]
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+
+        try:
+            if self.ordered:
+                for item in self._ordered_items():
+                    yield item
+            else:
+                for item in self._unordered_items():
+                    yield item
+        finally:
+            with self._condition:
+                self._stopped = True
+                self._condition.notify_all()
+
+    def _ordered_items(self):
+        """Yield the items of the shards, shard by shard (in time order)."""
+        while True:
+            with self._condition:
+                if not self._order:
+                    return
+                shard = self._order[0]
+            while True:
+                item = shard.output.get()
+                if item is _END:
+                    break
+                elif isinstance(item, _Failure):
+                    raise item.exception
+                yield item
+            with self._condition:
+                self._order.remove(shard)
+
+    def _unordered_items(self):
+        """Yield the items of the shards, as they are received."""
+        while True:
+            with self._condition:
+                if self._finished == self._created:
+                    return
+            item = self._output.get()
+            if item is _END:
+                with self._condition:
+                    self._finished += 1
+            elif isinstance(item, _Failure):
+                raise item.exception
+            else:
+                yield item
+
+    def _put(self, shard, item):
+        """Hand an item to the consumer; return False if the scan stopped."""
+        output = shard.output if self.ordered else self._output
+        while not self._stopped:
+            try:
+                output.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _work(self):
+        """Worker thread: paginate pending shards until the scan is done."""
+        while True:
+            with self._condition:
+                while True:
+                    if self._stopped:
+                        return
+                    shard = next((s for s in self._order
+                                  if s.state == PENDING), None)
+                    if shard is not None:
+                        shard.state = RUNNING
+                        self._running += 1
+                        break
+                    if self._running == 0:
+                        return
+                    self._condition.wait()
+
+            try:
+                if self._deadline is None:
+                    self._paginate(shard)
+                else:
+                    with self._session.deadline(self._deadline):
+                        self._paginate(shard)
+            except Exception as e:
+                self._put(shard, _Failure(e))
+            finally:
+                with self._condition:
+                    shard.state = DONE
+                    self._running -= 1
+                    self._condition.notify_all()
+                self._put(shard, _END)
+
+    def _idle_workers(self):
+        """The number of workers without a shard (call with the lock held)."""
+        if any(s.state == PENDING for s in self._order):
+            return 0
+        return self.concurrency - self._running
+
+    def _paginate(self, shard):
+        """Yield the items of a shard to the consumer, splitting it if busy."""
+        arguments = self.container.arguments.copy()
+        arguments["_from"] = from_milliseconds(shard.start)
+        arguments["to"] = from_milliseconds(shard.end)
+        generator = self.container.generator_function(**arguments)
+
+        first = None        # The timestamp of the shard's first item
+        descending = None   # The direction of the shard's items, once known
+        count = 0
+        try:
+            for item in generator:
+                if self._stopped:
+                    return
+                timestamp = self._timestamp(item)
+
+                if first is None:
+                    first = timestamp
+                elif descending is None and timestamp != first:
+                    descending = timestamp < first
+
+                # Keep the items within the shard's (current) sub-range
+                if shard.bounded_start and timestamp < shard.start:
+                    if descending:
+                        return
+                    continue
+                if shard.bounded_end and timestamp >= shard.end:
+                    if descending is False:
+                        return
+                    continue
+
+                if not self._put(shard, item):
+                    return
+
+                count += 1
+                if self.split and descending is not None \
+                        and count % self.page_size == 0:
+                    self._split(shard, timestamp, descending)
+        finally:
+            generator.close()
+
+    def _split(self, shard, timestamp, descending):
+        """Hand the unscanned part of a shard to the idle workers."""
+        if self.ordered and descending != self.newest_first:
+            # The new shards would precede the split shard in the output
+            return
+
+        with self._condition:
+            idle = self._idle_workers()
+            if not idle:
+                return
+
+            if descending:
+                # Items in [start, timestamp) have not been scanned yet
+                start, end = shard.start, timestamp
+                bounded_start, bounded_end = shard.bounded_start, True
+            else:
+                # Items in (timestamp, end) have not been scanned yet
+                start, end = timestamp + 1, shard.end
+                bounded_start, bounded_end = True, shard.bounded_end
+            if end - start < 2 * MIN_SHARD_SPAN:
+                return
+
+            shards = self._new_shards(start, end, idle + 1,
+                                      bounded_start, bounded_end)
+            if descending:
+                shard.start, shard.bounded_start = end, True
+            else:
+                shard.end, shard.bounded_end = start, True
+
+            # The new shards follow the split shard in the output order
+            index = self._order.index(shard) + 1
+            self._order[index:index] = shards
+            self._created += len(shards)
+            self._condition.notify_all()
+
+
+class _Failure(object):
+    """An exception raised while paginating a shard."""
+
+    def __init__(self, exception):
+        self.exception = exception
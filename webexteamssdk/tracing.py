@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""OpenTelemetry-compatible tracing of Webex Teams API requests.
+
+Classes:
+    Span: A timed operation of a trace.
+    SpanExporter: Base class for the exporters of finished spans.
+    InMemorySpanExporter: Keeps the finished spans in memory.
+    ConsoleSpanExporter: Writes the finished spans to a stream, as JSON.
+    TracingHooks: Request hooks recording the requests as spans.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import (
+    absolute_import,
+    division,
+    print_function,
+    unicode_literals,
+)
+
+from builtins import *
+
+import binascii
+import contextlib
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+
+from past.builtins import basestring
+
+from .hooks import RequestHooks
+from .utils import check_type
+
+
+# The name of the instrumentation scope of the spans
+INSTRUMENTATION_SCOPE = "webexteamssdk"
+
+SPAN_KIND_CLIENT = "SpanKind.CLIENT"
+SPAN_KIND_INTERNAL = "SpanKind.INTERNAL"
+
+STATUS_UNSET = "UNSET"
+STATUS_OK = "OK"
+STATUS_ERROR = "ERROR"
+
+
+def _random_id(size):
+    """A random (non-zero) trace or span ID, as a hexadecimal string."""
+    while True:
+        value = binascii.hexlify(os.urandom(size)).decode("ascii")
+        if value.strip("0"):
+            return value
+
+
+def _time_ns(seconds=None):
+    """A time (seconds since the epoch; default now) in nanoseconds."""
+    return int((time.time() if seconds is None else seconds) * 1e9)
+
+
+def _iso_time(time_ns):
+    return datetime.datetime.utcfromtimestamp(time_ns / 1e9).strftime(
+        "%Y-%m-%dT%H:%M:%S.%fZ"
+    )
+
+
+class Span(object):
+    """A timed operation of a trace.
+
+    Spans follow the OpenTelemetry data model: each has a name, a kind, a
+    trace ID (shared by the spans of a trace) and a span ID, an optional
+    parent span ID, start and end times (nanoseconds since the epoch),
+    attributes, timed events and a status.
+
+    """
+
+    def __init__(self, name, kind=SPAN_KIND_INTERNAL, parent=None,
+                 attributes=None, start_time=None):
+        """Init a new (started) Span.
+
+        Args:
+            name(basestring): The name of the span.
+            kind(basestring): The span kind.
+            parent(Span): The parent span; None for a root span (the first
+                span of a new trace).
+            attributes(dict): The initial attributes of the span.
+            start_time(int): The start time (nanoseconds since the epoch).
+                Defaults to now.
+
+        """
+        super(Span, self).__init__()
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else _random_id(16)
+        self.span_id = _random_id(8)
+        self.parent_id = parent.span_id if parent else None
+        self.start_time = start_time or _time_ns()
+        self.end_time = None
+        self.attributes = {key: value
+                           for key, value in (attributes or {}).items()
+                           if value is not None}
+        self.events = []
+        self.status = STATUS_UNSET
+        self.status_description = None
+
+    def __repr__(self):
+        return "<{}(name={!r}, trace_id={}, span_id={})>".format(
+            self.__class__.__name__, self.name, self.trace_id, self.span_id,
+        )
+
+    @property
+    def duration(self):
+        """The duration (seconds) of a finished span (None if unfinished)."""
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key, value):
+        """Set an attribute (None values are ignored)."""
+        if value is not None:
+            self.attributes[key] = value
+
+    def add_event(self, name, attributes=None, timestamp=None):
+        """Add a timed event to the span."""
+        self.events.append({
+            "name": name,
+            "timestamp": timestamp or _time_ns(),
+            "attributes": dict(attributes or {}),
+        })
+
+    def set_status(self, status, description=None):
+        """Set the status of the span (STATUS_OK or STATUS_ERROR)."""
+        self.status = status
+        self.status_description = description
+
+    def end(self, end_time=None):
+        """End the span (at `end_time` nanoseconds; defaults to now)."""
+        if self.end_time is None:
+            self.end_time = end_time or _time_ns()
+
+    def to_dict(self):
+        """Return the span in the OpenTelemetry SDK's JSON format."""
+        status = {"status_code": self.status}
+        if self.status_description:
+            status["description"] = self.status_description
+        return {
+            "name": self.name,
+            "context": {
+                "trace_id": "0x" + self.trace_id,
+                "span_id": "0x" + self.span_id,
+                "trace_state": "[]",
+            },
+            "kind": self.kind,
+            "parent_id": "0x" + self.parent_id if self.parent_id else None,
+            "start_time": _iso_time(self.start_time),
+            "end_time": _iso_time(self.end_time)
+            if self.end_time is not None else None,
+            "status": status,
+            "attributes": dict(self.attributes),
+            "events": [
+                {
+                    "name": event["name"],
+                    "timestamp": _iso_time(event["timestamp"]),
+                    "attributes": dict(event["attributes"]),
+                }
+                for event in self.events
+            ],
+            "links": [],
+            "resource": {
+                "attributes": {"telemetry.sdk.name": INSTRUMENTATION_SCOPE},
+                "schema_url": "",
+            },
+        }
+
+    def to_json(self, indent=4):
+        """Return the span as JSON (see :meth:`to_dict`)."""
+        return json.dumps(self.to_dict(), indent=indent)
+
+
+class SpanExporter(object):
+    """Base class for the exporters of finished spans."""
+
+    def export(self, spans):
+        """Export a list of finished spans."""
+        raise NotImplementedError
+
+    def shutdown(self):
+        """Release the exporter's resources."""
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the finished spans in memory (for tests and debugging)."""
+
+    def __init__(self):
+        super(InMemorySpanExporter, self).__init__()
+        self._lock = threading.Lock()
+        self._spans = []
+
+    def export(self, spans):
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self):
+        """Return the finished spans, in the order they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        """Discard the finished spans."""
+        with self._lock:
+            del self._spans[:]
+
+
+class ConsoleSpanExporter(SpanExporter):
+    """Writes the finished spans to a stream (stdout by default), as JSON."""
+
+    def __init__(self, out=None, formatter=None):
+        """Init a new ConsoleSpanExporter.
+
+        Args:
+            out: The (text) stream the spans are written to.  Defaults to
+                sys.stdout.
+            formatter(callable): Formats a span as text.  Defaults to
+                :meth:`Span.to_json` (followed by a newline).
+
+        """
+        super(ConsoleSpanExporter, self).__init__()
+        self.out = out
+        self.formatter = formatter or (lambda span: span.to_json() + "\n")
+        self._lock = threading.Lock()
+
+    def export(self, spans):
+        out = self.out if self.out is not None else sys.stdout
+        with self._lock:
+            for span in spans:
+                out.write(self.formatter(span))
+            out.flush()
+
+
+class TracingHooks(RequestHooks):
+    """Request hooks recording the requests of a session as spans.
+
+    Each request attempt is recorded as a CLIENT span (named after its
+    method and templated endpoint, such as "GET rooms/{id}") with the
+    OpenTelemetry HTTP attributes, the Webex Tracking ID and the attempt
+    number.  Retry and rate-limit waits, and the parsing of each page of
+    paginated results, are recorded as INTERNAL spans.
+
+    Spans created within :meth:`span` (in the same thread) are children of
+    its span, so an application operation (such as replying to a message)
+    can be traced along with the API requests it makes::
+
+        tracing = TracingHooks(ConsoleSpanExporter())
+        api = WebexTeamsAPI(hooks=[tracing])
+
+        with tracing.span("reply"):
+            ...
+
+    """
+
+    def __init__(self, exporter, attributes=None):
+        """Init a new TracingHooks.
+
+        Args:
+            exporter(SpanExporter): The exporter of the finished spans.
+            attributes(dict): Attributes added to every request span.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(exporter, SpanExporter)
+        check_type(attributes, dict, optional=True)
+
+        super(TracingHooks, self).__init__()
+        self.exporter = exporter
+        self.attributes = dict(attributes or {})
+        self._context = threading.local()
+
+    @property
+    def current_span(self):
+        """The innermost span started with :meth:`span` in this thread."""
+        stack = getattr(self._context, "stack", None)
+        return stack[-1] if stack else None
+
+    @contextlib.contextmanager
+    def span(self, name, attributes=None):
+        """Context manager: trace an operation as a span.
+
+        The spans of the requests made (in this thread) within the context
+        are children of the operation's span.
+
+        Args:
+            name(basestring): The name of the span.
+            attributes(dict): The attributes of the span.
+
+        """
+        check_type(name, basestring)
+
+        span = Span(name, parent=self.current_span, attributes=attributes)
+        stack = getattr(self._context, "stack", None)
+        if stack is None:
+            stack = self._context.stack = []
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_status(STATUS_ERROR, repr(e))
+            raise
+        finally:
+            stack.pop()
+            self._finish(span)
+
+    def _finish(self, span, end_time=None):
+        span.end(end_time)
+        self.exporter.export([span])
+
+    def before_request(self, event):
+        span = Span(
+            "{} {}".format(event.method, event.endpoint),
+            kind=SPAN_KIND_CLIENT, parent=self.current_span,
+            start_time=_time_ns(event.start_time),
+            attributes=self.attributes,
+        )
+        span.set_attribute("http.request.method", event.method)
+        span.set_attribute("url.full", event.url)
+        span.set_attribute("webex.endpoint", event.endpoint)
+        span.set_attribute("webex.attempt", event.attempt)
+        event.context[self] = span
+
+    def after_response(self, event):
+        span = event.context.pop(self, None)
+        if span is None:
+            return
+        span.set_attribute("http.response.status_code", event.status_code)
+        span.set_attribute("webex.tracking_id", event.tracking_id)
+        if event.error is not None:
+            span.set_attribute("error.type", event.error.__class__.__name__)
+            span.set_status(STATUS_ERROR, str(event.error))
+        elif event.status_code is not None and event.status_code >= 400:
+            span.set_attribute("error.type", str(event.status_code))
+            span.set_status(STATUS_ERROR)
+        self._finish(span, _time_ns(event.start_time + event.elapsed))
+
+    def _wait_span(self, event, name):
+        span = Span(
+            name, parent=self.current_span,
+            start_time=_time_ns(event.start_time),
+            attributes={
+                "webex.endpoint": event.endpoint,
+                "webex.attempt": event.attempt,
+                "webex.wait_seconds": event.wait,
+            },
+        )
+        span.set_attribute("http.response.status_code", event.status_code)
+        span.set_attribute("webex.tracking_id", event.tracking_id)
+        if event.error is not None:
+            span.set_attribute("error.type", event.error.__class__.__name__)
+        self._finish(span, _time_ns(event.start_time + event.wait))
+
+    def on_retry(self, event):
+        self._wait_span(event, "retry_wait")
+
+    def on_rate_limit_wait(self, event):
+        self._wait_span(event, "rate_limit_wait")
+
+    def on_page(self, event):
+        span = Span(
+            "page {}".format(event.endpoint), parent=self.current_span,
+            start_time=_time_ns(event.start_time),
+            attributes={
+                "webex.endpoint": event.endpoint,
+                "webex.tracking_id": event.tracking_id,
+                "webex.page_items": event.items,
+            },
+        )
+        self._finish(span, _time_ns(event.start_time + event.elapsed))
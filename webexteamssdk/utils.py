@@ -38,12 +38,13 @@ native_str = str
 import json
 import mimetypes
 import os
+import re
 import sys
 import urllib.parse
 import warnings
 from builtins import *
 from collections import namedtuple, OrderedDict
-from datetime import datetime, timedelta, tzinfo
+from datetime import date, datetime, timedelta, tzinfo
 
 from past.builtins import basestring
 
@@ -222,25 +223,33 @@ def check_response_code(response, expected_response_code):
         raise ApiError(response)
 
 
-def extract_and_parse_json(response):
+def extract_and_parse_json(response, codec=None):
     """Extract and parse the JSON data from an requests.response object.
 
     Args:
         response(requests.response): The response object returned by a request
             using the requests package.
+        codec(JSONCodec): Optional JSON codec used to parse the response body
+            (bytes).  By default, the response text is parsed with the standard
+            library, decoding JSON objects to OrderedDicts.
 
     Returns:
         The parsed JSON data as the appropriate native Python data type.
 
     """
+    if codec is not None:
+        return codec.loads(response.content)
     return json.loads(response.text, object_hook=OrderedDict)
 
 
-def json_dict(json_data):
+def json_dict(json_data, codec=None):
     """Given a dictionary or JSON string; return a dictionary.
 
     Args:
-        json_data(dict, str): Input JSON object.
+        json_data(dict, str, bytes): Input JSON object.
+        codec(JSONCodec): Optional JSON codec used to parse JSON strings.  By
+            default, JSON strings are parsed with the standard library,
+            decoding JSON objects to OrderedDicts.
 
     Returns:
         A Python dictionary with the contents of the JSON object.
@@ -251,6 +260,8 @@ def json_dict(json_data):
     """
     if isinstance(json_data, dict):
         return json_data
+    elif codec is not None and isinstance(json_data, (basestring, bytes)):
+        return codec.loads(json_data)
     elif isinstance(json_data, basestring):
         return json.loads(json_data, object_hook=OrderedDict)
     else:
@@ -295,12 +306,38 @@ class ZuluTimeZone(tzinfo):
         return timedelta(0)
 
 
+# The Webex Teams DateTime format, matched by the fast timestamp parser
+_WEBEX_TEAMS_DATETIME_RE = re.compile(
+    r"(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)\.(\d{1,6})Z\Z"
+)
+
+_ZULU = ZuluTimeZone()
+
+
 class WebexTeamsDateTime(datetime):
     """Webex Teams formatted Python datetime."""
 
     @classmethod
     def strptime(cls, date_string, format=WEBEX_TEAMS_DATETIME_FORMAT):
-        """strptime with the Webex Teams DateTime format as the default."""
+        """strptime with the Webex Teams DateTime format as the default.
+
+        Timestamps in the Webex Teams DateTime format are parsed with a fast,
+        regular expression based parser; other formats are parsed by the
+        standard library.
+
+        """
+        if format == WEBEX_TEAMS_DATETIME_FORMAT:
+            match = _WEBEX_TEAMS_DATETIME_RE.match(date_string)
+            if match:
+                year, month, day, hour, minute, second, fraction = \
+                    match.groups()
+                return cls(
+                    int(year), int(month), int(day),
+                    int(hour), int(minute), int(second),
+                    int(fraction.ljust(6, "0")),
+                    tzinfo=_ZULU,
+                )
+
         return super(WebexTeamsDateTime, cls).strptime(
             date_string, format
         ).replace(tzinfo=ZuluTimeZone())
@@ -323,3 +360,105 @@ class WebexTeamsDateTime(datetime):
         return dt.strftime("%Y-%m-%dT%H:%M:%S.{:0=3}%Z").format(
             self.microsecond // 1000
         )
+
+
+# The number of units per second, by epoch timestamp unit
+_EPOCH_UNITS = {"s": 1, "ms": 1000, "us": 1000000}
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _to_epoch(timestamp, units_per_second):
+    """Convert a timestamp (string or datetime) to an epoch integer."""
+    if timestamp is None:
+        return None
+
+    if isinstance(timestamp, basestring):
+        match = _WEBEX_TEAMS_DATETIME_RE.match(timestamp)
+        if not match:
+            timestamp = WebexTeamsDateTime.strptime(timestamp)
+        else:
+            year, month, day, hour, minute, second, fraction = match.groups()
+            days = date(int(year), int(month), int(day)).toordinal() \
+                - _EPOCH_ORDINAL
+            seconds = ((days * 24 + int(hour)) * 60 + int(minute)) * 60 \
+                + int(second)
+            microseconds = int(fraction.ljust(6, "0"))
+            return seconds * units_per_second \
+                + microseconds * units_per_second // 1000000
+
+    if not isinstance(timestamp, datetime):
+        raise TypeError("Timestamps must be strings or datetimes; received: "
+                        "{!r}".format(timestamp))
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.replace(tzinfo=None) - timestamp.utcoffset()
+    days = timestamp.toordinal() - _EPOCH_ORDINAL
+    seconds = ((days * 24 + timestamp.hour) * 60 + timestamp.minute) * 60 \
+        + timestamp.second
+    return seconds * units_per_second \
+        + timestamp.microsecond * units_per_second // 1000000
+
+
+def timestamps_to_epoch(timestamps, unit="ms"):
+    """Convert Webex Teams timestamps to integers since the epoch.
+
+    Timestamp strings in the Webex Teams DateTime format are converted
+    directly, without creating datetime objects.
+
+    Args:
+        timestamps(iterable): Webex Teams timestamp strings or datetimes
+            (naive datetimes are assumed UTC).  `None` values are converted
+            to `None`.
+        unit(basestring): The unit of the returned integers: "s", "ms" or
+            "us".
+
+    Returns:
+        list: The seconds, milliseconds or microseconds since the epoch.
+
+    Raises:
+        TypeError: If a timestamp is not a string or datetime.
+        ValueError: If the unit is unknown, or a timestamp string cannot be
+            parsed.
+
+    """
+    try:
+        units_per_second = _EPOCH_UNITS[unit]
+    except KeyError:
+        raise ValueError("Unknown epoch unit: {!r}; expected one of: {}"
+                         "".format(unit, ", ".join(_EPOCH_UNITS)))
+    return [_to_epoch(timestamp, units_per_second) for timestamp in timestamps]
+
+
+def timestamps_to_datetime64(timestamps, unit="ms"):
+    """Convert Webex Teams timestamps to a NumPy datetime64 array.
+
+    Requires the (optional) `numpy` package.
+
+    Args:
+        timestamps(iterable): Webex Teams timestamp strings or datetimes
+            (naive datetimes are assumed UTC).  `None` values are converted
+            to NaT (not a time).
+        unit(basestring): The precision of the array: "s", "ms" or "us".
+
+    Returns:
+        numpy.ndarray: A `datetime64[<unit>]` array of the (UTC) timestamps.
+
+    Raises:
+        ImportError: If numpy is not installed.
+        TypeError: If a timestamp is not a string or datetime.
+        ValueError: If the unit is unknown, or a timestamp string cannot be
+            parsed.
+
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("timestamps_to_datetime64() requires the numpy "
+                          "package; install it with `pip install numpy`.")
+
+    not_a_time = numpy.iinfo(numpy.int64).min
+    values = [not_a_time if value is None else value
+              for value in timestamps_to_epoch(timestamps, unit=unit)]
+    return numpy.array(values, dtype=numpy.int64).astype(
+        "datetime64[{}]".format(unit)
+    )